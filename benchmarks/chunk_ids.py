@@ -0,0 +1,72 @@
+import argparse
+from typing import Dict, List
+
+from langchain.docstore.document import Document
+
+from benchmarks.utils import get_best_time
+from src.connections.utils import _get_document_id, get_id_list
+
+
+# DEF: Chunks with the metadata used by the ids, like the split of the PDF's
+def get_document_list(*, total: int) -> List[Document]:
+    return [
+        Document(
+            page_content='',
+            metadata={
+                'doi': f'10.4316/AECE.2022.030{i // 500:02d}',
+                'publication_date': '2022-08-31',
+                'page': str(i // 50 % 10),
+                'start_index': i % 50 * 412,
+            },
+        )
+        for i in range(total)
+    ]
+
+
+# DEF: Compare the chromadbx generator per chunk with the batch ids
+def run(*, total: int = 100_000, repeat: int = 3) -> Dict[str, float]:
+    document_list = get_document_list(total=total)
+
+    chromadbx_ids = [
+        _get_document_id(document_chunk=document_chunk)
+        for document_chunk in document_list
+    ]
+
+    # DESC: Os ids precisam ser idênticos aos já armazenados
+    if get_id_list(document_list=document_list) != chromadbx_ids:
+        raise AssertionError('The batch ids differ from the chromadbx ids')
+
+    results = {
+        'chromadbx': get_best_time(
+            function=lambda: [
+                _get_document_id(document_chunk=document_chunk)
+                for document_chunk in document_list
+            ],
+            repeat=repeat,
+        ),
+        'hashlib': get_best_time(
+            function=lambda: get_id_list(document_list=document_list),
+            repeat=repeat,
+        ),
+    }
+    results['speedup'] = results['chromadbx'] / results['hashlib']
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Chunk id generation benchmark')
+    parser.add_argument('--total', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(total=args.total, repeat=args.repeat)
+
+    print(f'Chunk ids ({args.total} chunks):')
+    print(f'- chromadbx: {results["chromadbx"]:.3f}s')
+    print(f'- hashlib: {results["hashlib"]:.3f}s')
+    print(f'- speedup: {results["speedup"]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,412 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+import chromadb
+import httpx
+from chromadb.config import Settings
+from requests.adapters import HTTPAdapter
+
+import src.connections.chromadb_handler as chromadb_handler_module
+import src.connections.embeddings as embeddings_module
+from src.connections.chromadb_handler import ChromaDBHandler
+from src.download_manager import DownloadManager
+from src.http_web_scrapper import HttpWebScrapper
+from src.metrics import get_metrics
+
+# DESC: Páginas salvas do aece.ro e PDF's de exemplo
+FIXTURES = Path(__file__).parent.parent / 'tests' / 'fixtures'
+
+BASELINE_PATH = Path(__file__).parent / 'baselines' / 'crawl.json'
+
+JOURNAL_URL = 'https://aece.ro'
+YEAR = 2022
+NUMBER = 3
+
+# DESC: Unidade da vazão de cada estágio: artigos ou chunks por segundo
+# (segundos somados entre os workers do estágio)
+STAGE_UNITS = {
+    'page_load': 'articles',
+    'article_scrape': 'articles',
+    'pdf_download': 'articles',
+    'pdf_parse': 'articles',
+    'pdf_split': 'chunks',
+    'embedding': 'chunks',
+    'chroma_add': 'chunks',
+    'chroma_insert': 'chunks',
+}
+
+
+# LocalJournal
+class LocalJournal:
+    """Local HTTP server with an issue of total articles built from the fixtures.
+
+    Every article page is the saved abstract page with its own number and DOI,
+    and the PDF's cycle through the sample corpus, with different sizes and
+    layouts (one and two columns, tables, running headers).
+    """
+
+    def __init__(self, *, total: int):
+        self.pages = get_journal_pages(total=total)
+        self.pdfs = [path.read_bytes() for path in sorted(FIXTURES.glob('pdfs/*.pdf'))]
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), LocalJournalHandler)
+        self.server.daemon_threads = True
+        self.server.journal = self
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def get_content(self, *, path: str) -> bytes:
+        url = urlsplit(path)
+        article = parse_qs(url.query).get('article', [''])[0]
+
+        if url.path == '/displaypdf.php':
+            return self.pdfs[int(article) % len(self.pdfs)]
+
+        return self.pages[f'{url.path}:{article}'].encode('utf-8')
+
+    def attach(self, *, web_scrapper: HttpWebScrapper):
+        # DESC: As requisições ao aece.ro são atendidas pelo servidor
+        # local, as URL's vistas pelo scrapper continuam as originais
+        web_scrapper.session.mount(JOURNAL_URL, LocalJournalAdapter(url=self.url))
+
+        web_scrapper.download_manager.close()
+        web_scrapper.download_manager = DownloadManager(
+            timeout=web_scrapper.settings.http_timeout,
+            per_host_limit=web_scrapper.settings.download_per_host_limit,
+            retries=web_scrapper.settings.download_retries,
+            backoff=web_scrapper.settings.download_backoff,
+            rate_limiter=web_scrapper.rate_limiter,
+            transport=LocalJournalTransport(url=self.url),
+        )
+        web_scrapper.pdf_store.download_manager = web_scrapper.download_manager
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class LocalJournalHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        try:
+            content = self.server.journal.get_content(path=self.path)
+        except (KeyError, ValueError):
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class LocalJournalAdapter(HTTPAdapter):
+    def __init__(self, *, url: str):
+        super().__init__()
+        self.url = url
+
+    def send(self, request, **kwargs):
+        url = request.url
+        request.url = url.replace(JOURNAL_URL, self.url, 1)
+
+        response = super().send(request, **kwargs)
+        response.url = url
+
+        return response
+
+
+class LocalJournalTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, *, url: str):
+        super().__init__()
+        self.url = httpx.URL(url)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(
+            scheme=self.url.scheme, host=self.url.host, port=self.url.port
+        )
+
+        return await super().handle_async_request(request)
+
+
+# DEF: Pages of an issue with total articles, from the saved aece.ro pages
+def get_journal_pages(*, total: int) -> Dict[str, str]:
+    issue_page = (FIXTURES / 'aece' / f'displayissue_{YEAR}_{NUMBER}.html').read_text()
+    article_page = (
+        FIXTURES / 'aece' / f'abstractplus_{YEAR}_{NUMBER}_1.html'
+    ).read_text()
+
+    rows = re.findall(
+        r'<tr>\s*<td class="papertitle1">.*?</tr>\s*<tr>.*?</tr>\s*', issue_page, re.S
+    )
+    start = issue_page.index(rows[0])
+    end = issue_page.index(rows[-1]) + len(rows[-1])
+
+    pages = {
+        '/displayissue.php:': issue_page[:start]
+        + ''.join(
+            rows[0].replace('article=1', f'article={i}') for i in range(1, total + 1)
+        )
+        + issue_page[end:]
+    }
+
+    for i in range(1, total + 1):
+        pages[f'/abstractplus.php:{i}'] = article_page.replace(
+            'article=1', f'article={i}'
+        ).replace(f'AECE.{YEAR}.0{NUMBER}001', f'AECE.{YEAR}.0{NUMBER}{i:03d}')
+
+    return pages
+
+
+# DEF: Get an in-process Chroma client, the same engine of the server
+def get_chroma_client():
+    return chromadb.EphemeralClient(
+        settings=Settings(allow_reset=True, anonymized_telemetry=False)
+    )
+
+
+# HashEmbeddingFunction
+class HashEmbeddingFunction:
+    """Deterministic embeddings from the SHAKE-256 digest of each text."""
+
+    def __init__(self, *, dimensions: int):
+        self.dimensions = dimensions
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        return [
+            [
+                byte / 127.5 - 1
+                for byte in hashlib.shake_256(text.encode('utf-8')).digest(
+                    self.dimensions
+                )
+            ]
+            for text in input
+        ]
+
+
+# DESC: Embeddings sem download do modelo, no lugar do SentenceTransformer
+@contextmanager
+def hash_embeddings(*, dimensions: int):
+    modules = [chromadb_handler_module, embeddings_module]
+    previous = [module.get_embedding_function for module in modules]
+    embedding_function = HashEmbeddingFunction(dimensions=dimensions)
+
+    for module in modules:
+        module.get_embedding_function = lambda **_: embedding_function
+
+    try:
+        yield
+    finally:
+        for module, get_embedding_function in zip(modules, previous):
+            module.get_embedding_function = get_embedding_function
+
+
+@contextmanager
+def environ(**values: str):
+    previous = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+# DEF: Crawl and index an offline issue, reporting throughput and peak memory
+def run(*, total: int = 50, workers: int = 4, parse_workers: int = 1) -> dict:
+    client = get_chroma_client()
+    collection_name = f'benchmark_{uuid4().hex}'
+
+    with tempfile.TemporaryDirectory() as root, LocalJournal(total=total) as journal:
+        with hash_embeddings(dimensions=384), environ(
+            SCRAPPER_WORKERS=str(workers),
+            PARSE_WORKERS=str(parse_workers),
+            RATE_LIMIT_RPS='0',
+            EMBEDDING_MODEL_NAME='hash:384',
+            EMBEDDING_CACHE_PATH='',
+            CHROMA_COLLECTION=collection_name,
+            PDF_STORE_PATH=os.path.join(root, 'pdfs'),
+            CRAWL_STATE_PATH=os.path.join(root, 'crawl_state.sqlite3'),
+            PAGE_ARCHIVE_PATH=os.path.join(root, 'pages'),
+            ISSUE_INDEX_PATH=os.path.join(root, 'issue_index.sqlite3'),
+            CHUNK_EXPORT_PATH=os.path.join(root, 'chunks'),
+            METRICS_PATH='',
+        ):
+            web_scrapper = HttpWebScrapper()
+            web_scrapper.config(number=NUMBER, year=YEAR)
+            journal.attach(web_scrapper=web_scrapper)
+
+            # DESC: O insert real (get, embeddings e add) no cliente em processo
+            def persistir(*, document_chunks, embedding_model_name: str):
+                ChromaDBHandler().insert(
+                    config=web_scrapper.settings,
+                    client=client,
+                    document_chunks=document_chunks,
+                    embedding_model_name=embedding_model_name,
+                )
+
+            web_scrapper.persistir = persistir
+            get_metrics().reset()
+            tracemalloc.start()
+
+            try:
+                start = time.perf_counter()
+                indexed_articles = web_scrapper.execute_issue(number=NUMBER, year=YEAR)
+                seconds = time.perf_counter() - start
+                _, peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+                del web_scrapper.persistir
+                web_scrapper.close()
+                client.delete_collection(collection_name)
+
+    snapshot = get_metrics().snapshot()
+    totals = {
+        'articles': len(indexed_articles),
+        'chunks': snapshot['counters'].get('chunks_inserted', 0),
+    }
+
+    return {
+        'articles': totals['articles'],
+        'pages': snapshot['counters'].get('pages_parsed', 0),
+        'chunks_created': snapshot['counters'].get('chunks_created', 0),
+        'chunks': totals['chunks'],
+        'seconds': seconds,
+        'articles_per_second': totals['articles'] / seconds,
+        'chunks_per_second': totals['chunks'] / seconds,
+        'peak_memory_mb': peak_memory / 2**20,
+        'max_rss_mb': get_max_rss() / 2**20,
+        'stages': {
+            name: {
+                'seconds': stage['seconds'],
+                'unit': f'{STAGE_UNITS[name]}/s',
+                'throughput': totals[STAGE_UNITS[name]] / stage['seconds']
+                if stage['seconds']
+                else 0.0,
+            }
+            for name, stage in snapshot['stages'].items()
+            if name in STAGE_UNITS
+        },
+    }
+
+
+# DEF: Max resident memory of the process, in bytes
+def get_max_rss() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # DESC: Linux informa em KB, macOS em bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+# DEF: Regressions of the results against the baseline, beyond the tolerance
+def compare(*, results: dict, baseline: dict, tolerance: float = 0.2) -> List[str]:
+    regressions = []
+
+    throughputs = {
+        'articles_per_second': (
+            results['articles_per_second'],
+            baseline['articles_per_second'],
+        ),
+        'chunks_per_second': (
+            results['chunks_per_second'],
+            baseline['chunks_per_second'],
+        ),
+    }
+
+    for name, stage in baseline['stages'].items():
+        if name in results['stages']:
+            throughputs[name] = (
+                results['stages'][name]['throughput'],
+                stage['throughput'],
+            )
+
+    for name, (current, previous) in throughputs.items():
+        if current < previous * (1 - tolerance):
+            regressions.append(f'{name}: {current:.1f} < {previous:.1f}')
+
+    if results['peak_memory_mb'] > baseline['peak_memory_mb'] * (1 + tolerance):
+        regressions.append(
+            f'peak_memory_mb: {results["peak_memory_mb"]:.1f} > '
+            f'{baseline["peak_memory_mb"]:.1f}'
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline crawl and index benchmark')
+    parser.add_argument('--total', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--parse-workers', type=int, default=1)
+    parser.add_argument('--baseline', default=str(BASELINE_PATH))
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--check', action='store_true')
+    args = parser.parse_args()
+
+    results = run(
+        total=args.total, workers=args.workers, parse_workers=args.parse_workers
+    )
+
+    print(
+        f'Crawl and index ({results["articles"]} articles, {results["pages"]} '
+        f'pages, {results["chunks_created"]} chunks):'
+    )
+    print(f'- total: {results["seconds"]:.3f}s')
+    print(f'- articles: {results["articles_per_second"]:.1f} articles/s')
+    print(f'- chunks: {results["chunks_per_second"]:.1f} chunks/s')
+    print(f'- peak memory: {results["peak_memory_mb"]:.1f} MB (python heap)')
+    print(f'- max rss: {results["max_rss_mb"]:.1f} MB')
+
+    for name, stage in results['stages'].items():
+        print(f'- {name}: {stage["throughput"]:.1f} {stage["unit"]}')
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+        print(f'Baseline saved: {args.baseline}')
+        return
+
+    if not os.path.exists(args.baseline):
+        return
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compare(results=results, baseline=baseline, tolerance=args.tolerance)
+
+    for regression in regressions:
+        print(f'REGRESSION - {regression}')
+
+    if regressions and args.check:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
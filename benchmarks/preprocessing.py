@@ -0,0 +1,70 @@
+import argparse
+from typing import Dict, List
+
+from benchmarks.utils import get_best_time
+from src.connections.preprocessing import preprocess_texts
+from src.connections.utils import _get_preprocessed_text
+
+# DESC: Trecho típico de um artigo, com quebras de linha e pontuação
+SAMPLE_TEXT = (
+    'Power quality (PQ) disturbances are classified with convolutional\n'
+    'neural networks; the accuracy reaches 98.7% on 3,000 signals [12].\n'
+    'Análise de distúrbios: tensão, frequência e harmônicos - IEEE 1159.\n'
+)
+
+
+# DEF: Chunks of 512 characters, like the split of the PDF's
+def get_texts(*, total: int) -> List[str]:
+    text = SAMPLE_TEXT * 3
+
+    return [f'{i} {text}'[:512] for i in range(total)]
+
+
+# DEF: Compare the preprocessing per chunk with the batch preprocessing
+def run(*, total: int = 100_000, repeat: int = 3) -> Dict[str, float]:
+    texts = get_texts(total=total)
+
+    # DESC: O modo compatível precisa gerar o mesmo texto
+    if preprocess_texts(texts=texts) != [
+        _get_preprocessed_text(text=text) for text in texts
+    ]:
+        raise AssertionError('The batch preprocessing differs from the current one')
+
+    results = {
+        'current': get_best_time(
+            function=lambda: [_get_preprocessed_text(text=text) for text in texts],
+            repeat=repeat,
+        ),
+        'batch': get_best_time(
+            function=lambda: preprocess_texts(texts=texts),
+            repeat=repeat,
+        ),
+        'batch_normalized': get_best_time(
+            function=lambda: preprocess_texts(
+                texts=texts, keep_punctuation=True, collapse_whitespace=True
+            ),
+            repeat=repeat,
+        ),
+    }
+    results['speedup'] = results['current'] / results['batch']
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Text preprocessing benchmark')
+    parser.add_argument('--total', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(total=args.total, repeat=args.repeat)
+
+    print(f'Text preprocessing ({args.total} chunks):')
+    print(f'- current: {results["current"]:.3f}s')
+    print(f'- batch: {results["batch"]:.3f}s')
+    print(f'- batch normalized: {results["batch_normalized"]:.3f}s')
+    print(f'- speedup: {results["speedup"]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
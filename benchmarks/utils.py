@@ -0,0 +1,14 @@
+import time
+from typing import Callable
+
+
+# DEF: Best wall time (seconds) of repeat runs of the function
+def get_best_time(*, function: Callable, repeat: int = 3) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
@@ -1,12 +1,13 @@
+import importlib
 import os
 
-import chromadb
-import logfire
-
-from src.connections.chromadb_handler import ChromaDBHandler
 from src.connections.config import Config
-from src.logger import Logger
-from src.web_scrapper import WebScrapper
+from src.connections.utils import (
+    HTTP_BACKEND,
+    get_chroma_backend,
+    get_chroma_heartbeat,
+)
+from src.logger import Logger, configure_logfire
 
 # --------------------------
 # DESC: Logger
@@ -14,40 +15,58 @@ from src.web_scrapper import WebScrapper
 logger = Logger().get_logger()
 # --------------------------
 
+# DESC: Backends disponíveis, selecionados pela env SCRAPPER_BACKEND;
+# importados apenas quando usados (selenium, langchain e chromadb)
+WEB_SCRAPPERS = {
+    'selenium': 'src.web_scrapper:WebScrapper',
+    'http': 'src.http_web_scrapper:HttpWebScrapper',
+}
+
+
+def get_web_scrapper(*, backend: str):
+    if backend not in WEB_SCRAPPERS:
+        raise ValueError(
+            f'Invalid scrapper backend {backend}, please, inform one of {list(WEB_SCRAPPERS)}'
+        )
 
-def connect_to_chroma() -> chromadb.HttpClient:
-    config = Config()
-    client = ChromaDBHandler().connect(config=config)
-    return client
+    module_name, _, class_name = WEB_SCRAPPERS[backend].partition(':')
 
+    return getattr(importlib.import_module(module_name), class_name)
 
-def chroma_connection_validate(*, client):
-    return client.heartbeat() is not None
+
+def chroma_connection_validate(*, config: Config) -> bool:
+    # DESC: Sem servidor no backend persistente, exceto no bulk load
+    if (
+        get_chroma_backend(config=config) != HTTP_BACKEND
+        and not config.chroma_bulk_load
+    ):
+        return True
+
+    return get_chroma_heartbeat(config=config)
 
 
 def execute_webscrapper():
     number = os.environ.get('JOURNAL_NUMBER', '')
     year = os.environ.get('JOURNAL_YEAR', '')
 
-    WebScrapper().execute(number=number, year=year)
+    backend = Config().scrapper_backend
 
+    get_web_scrapper(backend=backend)().execute(number=number, year=year)
 
-def main():
-    # ------------------------------
-    # DESC: conectar ao Chroma
-    client = connect_to_chroma()
-    # ------------------------------
 
+def main():
     # ------------------------------
-    # DESC: teste se foi possível se conectar no ChromaDB
-    if not chroma_connection_validate(client=client):
+    # DESC: teste se foi possível se conectar no ChromaDB, antes
+    # de carregar o logfire e os backends do scrapper
+    if not chroma_connection_validate(config=Config()):
         logger.info('-' * 10)
         logger.info('Error to connect to ChromaDB!')
         logger.info('-' * 10)
-        logfire.exception('Error to connect to ChromaDB!')
-        raise
+        raise ConnectionError('Error to connect to ChromaDB!')
     # ------------------------------
 
+    configure_logfire()
+
     # ------------------------------
     # DESC: conectar ao Chroma
     execute_webscrapper()
@@ -0,0 +1,56 @@
+import os
+
+from scripts.get_articles import chroma_connection_validate, get_web_scrapper
+from src.batch import execute_batch, get_issues
+from src.connections.config import Config
+from src.logger import Logger, configure_logfire
+
+# --------------------------
+# DESC: Logger
+
+logger = Logger().get_logger()
+# --------------------------
+
+
+def get_batch_issues():
+    # DESC: Ex: JOURNAL_YEARS=2020-2022,2024 e JOURNAL_NUMBERS=1-4,
+    # ou JOURNAL_SINCE_YEAR=2018 para todas as issues desde 2018
+    since_year = os.environ.get('JOURNAL_SINCE_YEAR', '')
+
+    return get_issues(
+        years=os.environ.get('JOURNAL_YEARS', ''),
+        numbers=os.environ.get('JOURNAL_NUMBERS', ''),
+        since_year=int(since_year) if since_year else None,
+    )
+
+
+def main():
+    # ------------------------------
+    # DESC: teste se foi possível se conectar no ChromaDB
+    config = Config()
+
+    if not chroma_connection_validate(config=config):
+        logger.info('-' * 10)
+        logger.info('Error to connect to ChromaDB!')
+        logger.info('-' * 10)
+        raise ConnectionError('Error to connect to ChromaDB!')
+    # ------------------------------
+
+    configure_logfire()
+
+    # ------------------------------
+    # DESC: executar todas as issues com os recursos compartilhados
+    summaries = execute_batch(
+        web_scrapper=get_web_scrapper(backend=config.scrapper_backend)(),
+        issues=get_batch_issues(),
+        workers=config.batch_workers,
+    )
+    # ------------------------------
+
+    # DESC: Issues ainda não publicadas são puladas, sem falhar o batch
+    if any(summary.status == 'failed' for summary in summaries):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
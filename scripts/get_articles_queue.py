@@ -0,0 +1,87 @@
+import os
+import socket
+
+import logfire
+
+from scripts.get_articles import chroma_connection_validate, get_web_scrapper
+from scripts.get_articles_batch import get_batch_issues
+from src.connections.config import Config
+from src.logger import Logger, configure_logfire
+from src.work_queue import WorkQueue
+
+# --------------------------
+# DESC: Logger
+
+logger = Logger().get_logger()
+# --------------------------
+
+# DESC: 'enqueue' expande as issues em artigos na fila,
+# 'work' processa os artigos da fila até esvaziá-la
+QUEUE_MODES = ['enqueue', 'work']
+
+
+def enqueue_issues(*, web_scrapper, work_queue: WorkQueue) -> int:
+    added = 0
+
+    for number, year in get_batch_issues():
+        try:
+            added += web_scrapper.enqueue_issue(
+                number=number, year=year, work_queue=work_queue
+            )
+        except Exception as e:
+            # DESC: A falha de uma issue não interrompe as demais
+            logger.info(f'Error to enqueue the issue {number}/{year}: {e}')
+            logfire.exception(f'Error to enqueue the issue {number}/{year}: {e}')
+
+    return added
+
+
+def main():
+    mode = os.environ.get('QUEUE_MODE', 'work')
+
+    if mode not in QUEUE_MODES:
+        raise ValueError(
+            f'Invalid queue mode {mode}, please, inform one of {QUEUE_MODES}'
+        )
+
+    config = Config()
+
+    # ------------------------------
+    # DESC: teste se foi possível se conectar no ChromaDB
+    if mode == 'work' and not chroma_connection_validate(config=config):
+        logger.info('-' * 10)
+        logger.info('Error to connect to ChromaDB!')
+        logger.info('-' * 10)
+        raise ConnectionError('Error to connect to ChromaDB!')
+    # ------------------------------
+
+    configure_logfire()
+
+    work_queue = WorkQueue(
+        path=config.work_queue_path,
+        lease_seconds=config.work_queue_lease_seconds,
+        max_attempts=config.work_queue_max_attempts,
+    )
+
+    web_scrapper = get_web_scrapper(backend=config.scrapper_backend)()
+    web_scrapper.config()
+
+    try:
+        if mode == 'enqueue':
+            enqueue_issues(web_scrapper=web_scrapper, work_queue=work_queue)
+        else:
+            web_scrapper.execute_worker(
+                work_queue=work_queue,
+                worker=config.worker_id or f'{socket.gethostname()}-{os.getpid()}',
+            )
+    finally:
+        web_scrapper.close()
+
+        logger.info(f'Work queue: {work_queue.get_counts()}')
+        logfire.info('work queue', **work_queue.get_counts())
+
+        work_queue.close()
+
+
+if __name__ == '__main__':
+    main()
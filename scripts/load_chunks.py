@@ -0,0 +1,50 @@
+import os
+
+from scripts.get_articles import chroma_connection_validate
+from src.batch import parse_range
+from src.chunk_export import ChunkExport
+from src.connections.chroma_connection import get_chroma_connection
+from src.connections.chromadb_handler import ChromaDBHandler
+from src.connections.config import Config
+from src.logger import Logger, configure_logfire
+from src.metrics import get_metrics
+
+# --------------------------
+# DESC: Logger
+
+logger = Logger().get_logger()
+# --------------------------
+
+
+def main():
+    config = Config()
+
+    # ------------------------------
+    # DESC: teste se foi possível se conectar no ChromaDB
+    if not chroma_connection_validate(config=config):
+        logger.info('-' * 10)
+        logger.info('Error to connect to ChromaDB!')
+        logger.info('-' * 10)
+        raise ConnectionError('Error to connect to ChromaDB!')
+    # ------------------------------
+
+    configure_logfire()
+
+    # DESC: Ex: JOURNAL_YEARS=2020-2022 para carregar apenas estes anos,
+    # vazio para carregar todo o export, com o EMBEDDING_MODEL_NAME atual
+    # na CHROMA_COLLECTION deste modelo
+    years = parse_range(value=os.environ.get('JOURNAL_YEARS', ''))
+
+    ChromaDBHandler().load(
+        config=config,
+        client=get_chroma_connection().get_client(config=config),
+        chunk_export=ChunkExport(root=config.chunk_export_path),
+        embedding_model_name=config.embedding_model_name,
+        years=years or None,
+    )
+
+    get_metrics().export(path=config.metrics_path)
+
+
+if __name__ == '__main__':
+    main()
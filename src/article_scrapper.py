@@ -0,0 +1,776 @@
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Set
+
+import logfire
+from langchain.schema import Document
+
+from src.chunk_dedup import ChunkDedup, write_duplicates_report
+from src.chunk_export import ChunkExport
+from src.connections.chroma_connection import get_chroma_connection
+from src.connections.chromadb_handler import ChromaDBHandler
+from src.connections.embeddings import get_embedding_cache, get_embeddings
+from src.connections.utils import (
+    HTTP_BACKEND,
+    PERSISTENT_BACKEND,
+    get_id_list,
+    get_text_list,
+)
+from src.crawl_state import FETCHED, INDEXED, CrawlState
+from src.download_manager import DownloadManager
+from src.html_parser import HtmlDocument, parse_html
+from src.issue_index import IssueIndex
+from src.logger import Logger
+from src.metrics import get_metrics, run_with_metrics
+from src.page_archive import OFF, PageArchive
+from src.pdf_store import PdfStore
+from src.pipeline import Pipeline
+from src.rate_limiter import get_host_rate_limiter
+from src.templates.article_scrapper_base import ArticleScrapperBase
+from src.templates.dataclass import ArticleInfo, ArticleLink, IssueDiff
+from src.utils import download_article_pdf, get_article_document
+from src.work_queue import LEASED, LeaseHeartbeat, WorkQueue
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+
+# DESC: Recursos configurados por _config_shared, compartilhados
+# entre backends do mesmo crawl (fallback do HTTP para o Selenium)
+SHARED_RESOURCES = (
+    'settings',
+    'rate_limiter',
+    'download_manager',
+    'pdf_store',
+    'crawl_state',
+    'parse_executor',
+    'page_archive',
+    'issue_index',
+    'chunk_export',
+    'chunk_dedup',
+)
+
+
+# ArticleScrapper
+class ArticleScrapper(ArticleScrapperBase):
+    """Article flow shared by the scrapper backends: scrape, parse and persist."""
+
+    # DESC: Configurado pelos backends, sem estado nada é pulado
+    crawl_state: Optional[CrawlState] = None
+
+    # DESC: Pool de processos do parse dos PDF's, sem pool o parse
+    # é feito na própria thread do pipeline
+    parse_executor: Optional[Executor] = None
+
+    # DESC: Arquivo do HTML das páginas acessadas, sem arquivo nada é gravado
+    page_archive: Optional[PageArchive] = None
+
+    # DESC: Listagem das issues no último crawl, sem índice todos
+    # os artigos da issue são captados
+    issue_index: Optional[IssueIndex] = None
+
+    # DESC: Parquet dos chunks parseados, sem export nada é gravado
+    chunk_export: Optional[ChunkExport] = None
+
+    # DESC: Índice dos chunks já mantidos, sem índice nada é removido
+    chunk_dedup: Optional[ChunkDedup] = None
+
+    # DESC: Page links dos artigos captados sem PDF, registrados
+    # apenas enquanto o worker da fila processa as tarefas
+    articles_without_pdf: Optional[Set[str]] = None
+
+    def _config_shared(self):
+        # DESC: Ritmo das requisições ao host, compartilhado
+        # entre páginas e PDF's de todos os workers
+        self.rate_limiter = get_host_rate_limiter(
+            rate=self.settings.rate_limit_rps,
+            burst=self.settings.rate_limit_burst,
+            min_rate=self.settings.rate_limit_min_rps,
+        )
+
+        # DESC: Downloads assíncronos dos PDF's, compartilhados entre os workers
+        self.download_manager = DownloadManager(
+            timeout=self.settings.http_timeout,
+            per_host_limit=self.settings.download_per_host_limit,
+            retries=self.settings.download_retries,
+            backoff=self.settings.download_backoff,
+            rate_limiter=self.rate_limiter,
+        )
+
+        # DESC: Store local dos PDF's, cada PDF é baixado uma única vez
+        self.pdf_store = PdfStore(
+            root=self.settings.pdf_store_path,
+            download_manager=self.download_manager,
+            revalidate=self.settings.pdf_revalidate,
+        )
+
+        # DESC: Etapas já concluídas em execuções anteriores
+        self.crawl_state = CrawlState(path=self.settings.crawl_state_path)
+
+        # DESC: Parse dos PDF's em paralelo, um processo por worker
+        self.parse_executor = self._get_parse_executor()
+
+        # DESC: HTML das páginas arquivado ou lido do arquivo (replay)
+        self.page_archive = self._get_page_archive()
+
+        # DESC: Listagem das issues no último crawl
+        self.issue_index = self._get_issue_index()
+
+        # DESC: Parquet dos chunks parseados, por ano e issue
+        self.chunk_export = self._get_chunk_export()
+
+        # DESC: Chunks duplicados entre artigos removidos antes dos embeddings
+        self.chunk_dedup = self._get_chunk_dedup()
+
+    def _share_resources(self, *, scrapper: 'ArticleScrapper'):
+        for name in SHARED_RESOURCES:
+            setattr(scrapper, name, getattr(self, name))
+
+    def _close_shared(self):
+        self.download_manager.close()
+        self.crawl_state.close()
+        self._close_issue_index()
+        self._close_chunk_dedup()
+        self._close_parse_executor()
+        self._ship_bulk_load()
+        self._export_metrics()
+
+    def enqueue_issue(self, *, number: int, year: int, work_queue: WorkQueue) -> int:
+        # DESC: A listagem da issue vira uma tarefa por artigo na fila,
+        # apenas para os artigos novos ou alterados desde o último crawl
+        articles = self.get_issue_articles(number=number, year=year)
+        issue_diff = self._diff_issue_articles(
+            number=number, year=year, articles=articles
+        )
+
+        added = work_queue.put_many(articles=issue_diff.added)
+        added += work_queue.requeue(articles=issue_diff.changed)
+
+        logger.info(
+            f'Work queue: issue {number}/{year} with {len(articles)} articles, '
+            f'{added} added'
+        )
+
+        return added
+
+    def execute_worker(self, *, work_queue: WorkQueue, worker: str) -> int:
+        """Index the articles leased from the queue until it is drained."""
+        self.articles_without_pdf = set()
+
+        try:
+            return self._execute_worker(work_queue=work_queue, worker=worker)
+        finally:
+            self.articles_without_pdf = None
+
+    def _execute_worker(self, *, work_queue: WorkQueue, worker: str) -> int:
+        indexed = 0
+
+        while True:
+            tasks = work_queue.lease(
+                worker=worker, limit=max(self.settings.scrapper_workers, 1)
+            )
+
+            if not tasks:
+                # DESC: Leases de outros workers ainda podem expirar
+                # e voltar para a fila, então o worker aguarda
+                if work_queue.get_counts().get(LEASED):
+                    time.sleep(self.settings.work_queue_poll_seconds)
+                    continue
+
+                return indexed
+
+            # DESC: O lease é renovado enquanto os artigos são processados
+            with LeaseHeartbeat(
+                work_queue=work_queue,
+                worker=worker,
+                task_ids=[task.id for task in tasks],
+                interval=work_queue.lease_seconds / 3,
+            ):
+                self._index_articles(articles=[task.article for task in tasks])
+
+            # DESC: O crawl state indica quais artigos foram indexados, artigos
+            # sem PDF também são concluídos, pois uma nova tentativa não muda
+            # o resultado, os demais voltam para a fila até o máximo de tentativas
+            for task in tasks:
+                if self._get_indexed_chunks(article=task.article) is not None:
+                    indexed += work_queue.complete(worker=worker, task_id=task.id)
+                elif task.article.page_link in self.articles_without_pdf:
+                    work_queue.complete(worker=worker, task_id=task.id)
+                else:
+                    work_queue.fail(
+                        worker=worker, task_id=task.id, error='Article not indexed'
+                    )
+
+    def _get_issue_index(self) -> Optional[IssueIndex]:
+        if not self.settings.issue_index_path:
+            return None
+
+        return IssueIndex(
+            path=self.settings.issue_index_path,
+            max_age=self.settings.issue_index_max_age,
+        )
+
+    def _diff_issue_articles(
+        self, *, number: int, year: int, articles: List[ArticleLink]
+    ) -> IssueDiff:
+        # DESC: No replay todos os artigos são extraídos novamente
+        if self.issue_index is None or self._is_replay():
+            return IssueDiff(added=articles)
+
+        issue_diff = self.issue_index.diff(number=number, year=year, articles=articles)
+
+        # DESC: Artigos com o título alterado ou com a captura expirada
+        # descartam as etapas concluídas, a página é carregada novamente
+        if self.crawl_state is not None:
+            for article in issue_diff.changed:
+                if self.crawl_state.get(article=article) is not None:
+                    self.crawl_state.delete(article=article)
+
+        # DESC: Artigos com PDF que não foram indexados (falha no parse,
+        # outro modelo de embeddings) seguem para a indexação
+        unchanged = []
+
+        for article in issue_diff.unchanged:
+            if (
+                self.issue_index.get_pdf_link(article=article)
+                and self._get_indexed_chunks(article=article) is None
+            ):
+                issue_diff.changed.append(article)
+            else:
+                unchanged.append(article)
+
+        issue_diff.unchanged = unchanged
+
+        metrics = get_metrics()
+        metrics.increment('articles_added', len(issue_diff.added))
+        metrics.increment('articles_changed', len(issue_diff.changed))
+        metrics.increment('articles_unchanged', len(issue_diff.unchanged))
+
+        logger.info(
+            f'Issue index: issue {number}/{year} with {len(issue_diff.added)} '
+            f'added, {len(issue_diff.changed)} changed, '
+            f'{len(issue_diff.unchanged)} unchanged and '
+            f'{len(issue_diff.removed)} removed articles'
+        )
+        logfire.info(
+            'issue diff',
+            number=number,
+            year=year,
+            added=len(issue_diff.added),
+            changed=len(issue_diff.changed),
+            unchanged=len(issue_diff.unchanged),
+            removed=issue_diff.removed,
+        )
+
+        return issue_diff
+
+    def _index_issue(
+        self, *, number: int, year: int, articles: List[ArticleLink]
+    ) -> List[int]:
+        issue_diff = self._diff_issue_articles(
+            number=number, year=year, articles=articles
+        )
+
+        # DESC: Artigos sem alteração não são acessados, apenas contabilizados
+        indexed_articles = [
+            indexed_chunks
+            for indexed_chunks in (
+                self._get_indexed_chunks(article=article)
+                for article in issue_diff.unchanged
+            )
+            if indexed_chunks is not None
+        ]
+
+        return indexed_articles + self._index_articles(
+            articles=issue_diff.added + issue_diff.changed
+        )
+
+    def _get_chunk_dedup(self) -> Optional[ChunkDedup]:
+        if not self.settings.chunk_dedup:
+            return None
+
+        return ChunkDedup(
+            path=self.settings.chunk_dedup_path,
+            threshold=self.settings.chunk_dedup_threshold,
+        )
+
+    def _close_chunk_dedup(self):
+        if self.chunk_dedup is not None:
+            self.chunk_dedup.close()
+            self.chunk_dedup = None
+
+    def _deduplicate_chunks(
+        self, *, article: ArticleLink, document_chunks: List[Document]
+    ) -> List[Document]:
+        if self.chunk_dedup is None:
+            return document_chunks
+
+        chunk_ids = get_id_list(document_list=document_chunks)
+
+        with get_metrics().span('chunk_dedup', chunks=len(document_chunks)):
+            duplicates = self.chunk_dedup.deduplicate(
+                chunk_ids=chunk_ids,
+                texts=[document.page_content for document in document_chunks],
+            )
+
+        if not duplicates:
+            return document_chunks
+
+        # DESC: Chunks repetidos (cabeçalhos, rodapés, referências) não
+        # geram embeddings, o relatório registra o que foi removido
+        if self.settings.chunk_dedup_report_path:
+            write_duplicates_report(
+                path=self.settings.chunk_dedup_report_path,
+                page_link=article.page_link,
+                duplicates=duplicates,
+                chunks=dict(zip(chunk_ids, document_chunks)),
+            )
+
+        for kind in {duplicate.kind for duplicate in duplicates}:
+            get_metrics().increment(
+                f'chunks_duplicated_{kind}',
+                sum(1 for duplicate in duplicates if duplicate.kind == kind),
+            )
+
+        logger.info(
+            f'Chunk dedup: {len(duplicates)} of {len(document_chunks)} chunks '
+            f'removed from {article.page_link}'
+        )
+
+        duplicate_ids = {duplicate.id for duplicate in duplicates}
+
+        return [
+            document
+            for document, chunk_id in zip(document_chunks, chunk_ids)
+            if chunk_id not in duplicate_ids
+        ]
+
+    def _get_chunk_export(self) -> Optional[ChunkExport]:
+        if not self.settings.chunk_export_path:
+            return None
+
+        return ChunkExport(root=self.settings.chunk_export_path)
+
+    def _export_chunks(self, *, article: ArticleLink, document_chunks: List[Document]):
+        if self.chunk_export is None:
+            return
+
+        try:
+            with get_metrics().span('chunk_export', chunks=len(document_chunks)):
+                embeddings = None
+
+                # DESC: Com o cache, o insert reaproveita estes embeddings
+                if self.settings.chunk_export_embeddings:
+                    embeddings = get_embeddings(
+                        texts=get_text_list(
+                            document_list=document_chunks,
+                            keep_punctuation=self.settings.preprocess_keep_punctuation,
+                            collapse_whitespace=self.settings.preprocess_collapse_whitespace,
+                        ),
+                        embedding_model_name=self.settings.embedding_model_name,
+                        batch_size=self.settings.embedding_batch_size,
+                        cache=get_embedding_cache(
+                            path=self.settings.embedding_cache_path
+                        ),
+                    )
+
+                self.chunk_export.write(
+                    article=article,
+                    document_chunks=document_chunks,
+                    chunk_ids=get_id_list(document_list=document_chunks),
+                    embeddings=embeddings,
+                    embedding_model=self.settings.embedding_model_name,
+                )
+
+            get_metrics().increment('chunks_exported', len(document_chunks))
+
+        except Exception as e:
+            # DESC: O export é opcional, uma falha não interrompe a indexação
+            logger.info(f'Error to export the chunks of {article.page_link}: {e}')
+            logfire.exception(f'Error to export the chunks of {article.page_link}: {e}')
+
+    def _get_page_archive(self) -> Optional[PageArchive]:
+        if self.settings.page_archive_mode == OFF:
+            return None
+
+        return PageArchive(
+            root=self.settings.page_archive_path,
+            mode=self.settings.page_archive_mode,
+        )
+
+    def _is_replay(self) -> bool:
+        return self.page_archive is not None and self.page_archive.replay
+
+    def _load_archived_page(self, *, url: str) -> Optional[HtmlDocument]:
+        if not self._is_replay():
+            return None
+
+        # DESC: A página vem do arquivo, sem acesso à rede
+        with get_metrics().span('page_replay', url=url):
+            snapshot = self.page_archive.load(url=url)
+
+        get_metrics().increment('pages_replayed')
+
+        return parse_html(page_source=snapshot.page_source, base_url=snapshot.final_url)
+
+    def _archive_page(self, *, url: str, page_source: str, final_url: str):
+        if self.page_archive is None or self._is_replay():
+            return
+
+        try:
+            self.page_archive.save(
+                url=url, page_source=page_source, final_url=final_url
+            )
+            get_metrics().increment('pages_archived')
+
+        except OSError as e:
+            # DESC: O arquivo é opcional, uma falha não interrompe o crawl
+            logger.info(f'Error to archive the page {url}: {e}')
+            logfire.exception(f'Error to archive the page {url}: {e}')
+
+    def _get_fetched_article_info(
+        self, *, article: ArticleLink
+    ) -> Optional[ArticleInfo]:
+        # DESC: No replay a extração é refeita a partir do HTML arquivado
+        if self.crawl_state is None or self._is_replay():
+            return None
+
+        article_state = self.crawl_state.get(article=article)
+
+        if article_state is None or article_state.status not in (FETCHED, INDEXED):
+            return None
+
+        # DESC: A página não é recarregada, o PDF só é baixado
+        # novamente caso não esteja mais íntegro no store local
+        article_info = article_state.article_info
+
+        stored_pdf = download_article_pdf(
+            link=article_info.pdf_download_link,
+            year=article.year,
+            number=article.number,
+            pdf_store=self.pdf_store,
+        )
+
+        return article_info.model_copy(
+            update={'filename': stored_pdf.path, 'pdf_sha256': stored_pdf.sha256}
+        )
+
+    def _captar_article_info(self, article: ArticleLink):
+        try:
+            article_info = self._get_fetched_article_info(article=article)
+
+            if article_info is None:
+                with get_metrics().span('article_scrape', page_link=article.page_link):
+                    article_info = self._get_article_info(article=article)
+
+                if article_info is not None and self.crawl_state is not None:
+                    self.crawl_state.mark_fetched(
+                        article=article, article_info=article_info
+                    )
+
+                if article_info is None and self.articles_without_pdf is not None:
+                    self.articles_without_pdf.add(article.page_link)
+
+            # DESC: Artigos sem PDF também são registrados, assim não são
+            # acessados novamente enquanto a listagem não mudar
+            if self.issue_index is not None:
+                self.issue_index.mark_captured(
+                    article=article,
+                    pdf_link=article_info.pdf_download_link if article_info else '',
+                )
+
+            return article_info
+
+        except Exception as e:
+            # DESC: A falha de um artigo não interrompe os demais
+            logger.info('-' * 10)
+            logger.info(f'Error to capture the article {article.page_link}: {e}')
+            logger.info('-' * 10)
+            logfire.exception(f'Error to capture the article {article.page_link}: {e}')
+
+            return None
+
+    def _iter_article_infos(self, *, articles: List[ArticleLink], executor: Executor):
+        # DESC: Uma janela de artigos por worker, o próximo artigo é submetido
+        # quando o mais antigo é consumido, preservando a ordem da issue
+        articles = iter(articles)
+        window = deque()
+
+        def submit():
+            article = next(articles, None)
+
+            if article is not None:
+                window.append(
+                    (article, executor.submit(self._captar_article_info, article))
+                )
+
+        for _ in range(max(self.settings.scrapper_workers, 1)):
+            submit()
+
+        while window:
+            article, future = window.popleft()
+            article_info = future.result()
+            submit()
+
+            if article_info is not None:
+                yield article, article_info
+
+    def _export_metrics(self):
+        metrics = get_metrics()
+
+        metrics.export(path=self.settings.metrics_path)
+        logfire.info('crawl metrics', **metrics.snapshot())
+
+    def _get_parse_executor(self) -> Optional[Executor]:
+        if self.settings.parse_workers <= 1:
+            return None
+
+        # DESC: spawn, pois o fork de um processo com threads
+        # (drivers, pipeline) pode herdar locks em uso
+        return ProcessPoolExecutor(
+            max_workers=self.settings.parse_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+
+    def _close_issue_index(self):
+        if self.issue_index is not None:
+            self.issue_index.close()
+            self.issue_index = None
+
+    def _close_parse_executor(self):
+        if self.parse_executor is not None:
+            self.parse_executor.shutdown()
+            self.parse_executor = None
+
+    def _submit_article_document(self, article_info: ArticleInfo) -> Future:
+        # DESC: Leitura do PDF local e split em chunks, CPU-bound
+        if self.parse_executor is not None:
+            return self._merge_metrics(
+                self.parse_executor.submit(
+                    run_with_metrics, get_article_document, article_info=article_info
+                )
+            )
+
+        future = Future()
+
+        try:
+            future.set_result(get_article_document(article_info=article_info))
+        except Exception as e:
+            future.set_exception(e)
+
+        return future
+
+    def _merge_metrics(self, pool_future: Future) -> Future:
+        # DESC: As métricas do parse são registradas no processo do pool
+        # e somadas às métricas deste processo
+        future = Future()
+
+        def done(pool_future: Future):
+            try:
+                result, snapshot = pool_future.result()
+            except Exception as e:
+                future.set_exception(e)
+                return
+
+            get_metrics().merge(snapshot=snapshot)
+            future.set_result(result)
+
+        pool_future.add_done_callback(done)
+
+        return future
+
+    def _get_article_chunks(
+        self, *, article_info: ArticleInfo, future: Future
+    ) -> Optional[List[Document]]:
+        try:
+            # DESC: Langchain Document a partir dos dados crawleados
+            return future.result() or None
+
+        except Exception as e:
+            logger.info('-' * 10)
+            logger.info(f'Error to parse the article {article_info.filename}: {e}')
+            logger.info('-' * 10)
+            logfire.exception(
+                f'Error to parse the article {article_info.filename}: {e}'
+            )
+
+            return None
+
+    def persistir(self, *, document_chunks, embedding_model_name: str):
+        # DESC: O cliente e a coleção são reaproveitados entre artigos e
+        # issues, a conexão é refeita caso o insert falhe
+        get_chroma_connection().run(
+            partial(
+                ChromaDBHandler().insert,
+                config=self.settings,
+                document_chunks=document_chunks,
+                embedding_model_name=embedding_model_name,
+            ),
+            config=self.settings,
+            embedding_model_name=embedding_model_name,
+        )
+
+    def _ship_bulk_load(self):
+        if not self.settings.chroma_bulk_load:
+            return
+
+        chroma_connection = get_chroma_connection()
+
+        # DESC: A coleção do store local é enviada ao servidor em batches
+        # grandes, com os embeddings já calculados
+        try:
+            with get_metrics().span('chroma_ship'):
+                ChromaDBHandler().ship(
+                    config=self.settings,
+                    source_client=chroma_connection.get_client(
+                        config=self.settings, backend=PERSISTENT_BACKEND
+                    ),
+                    target_client=chroma_connection.get_client(
+                        config=self.settings, backend=HTTP_BACKEND
+                    ),
+                    embedding_model_name=self.settings.embedding_model_name,
+                )
+
+        except Exception as e:
+            # DESC: O store local é mantido, o envio é refeito na próxima execução
+            logger.info('-' * 10)
+            logger.info(f'Error to ship the bulk load to ChromaDB: {e}')
+            logger.info('-' * 10)
+            logfire.exception(f'Error to ship the bulk load to ChromaDB: {e}')
+
+    def _persistir_article(self, document_chunks: List[Document]) -> int:
+        with get_metrics().span('chroma_insert', chunks=len(document_chunks)):
+            self.persistir(
+                document_chunks=[document_chunks],
+                embedding_model_name=self.settings.embedding_model_name,
+            )
+
+        get_metrics().increment('articles_indexed')
+
+        return len(document_chunks)
+
+    def _parse_article(self, item):
+        article, article_info = item
+
+        # DESC: O futuro segue para o próximo estágio, assim vários
+        # PDF's são processados em paralelo e a ordem é preservada
+        return article, article_info, self._submit_article_document(article_info)
+
+    def _index_article(self, item) -> Optional[int]:
+        article, article_info, future = item
+
+        document_chunks = self._get_article_chunks(
+            article_info=article_info, future=future
+        )
+
+        if document_chunks is None:
+            return None
+
+        try:
+            return self._persistir_chunks(
+                article=article,
+                article_info=article_info,
+                document_chunks=document_chunks,
+            )
+
+        except Exception as e:
+            # DESC: A falha de um artigo não interrompe os demais, o artigo
+            # não é marcado como indexado e segue para a próxima execução
+            logger.info('-' * 10)
+            logger.info(f'Error to index the article {article.page_link}: {e}')
+            logger.info('-' * 10)
+            logfire.exception(f'Error to index the article {article.page_link}: {e}')
+
+            return None
+
+    def _persistir_chunks(
+        self,
+        *,
+        article: ArticleLink,
+        article_info: ArticleInfo,
+        document_chunks: List[Document],
+    ) -> int:
+        document_chunks = self._deduplicate_chunks(
+            article=article, document_chunks=document_chunks
+        )
+
+        self._export_chunks(article=article, document_chunks=document_chunks)
+
+        # DESC: Artigo sem chunks novos, todos duplicados
+        indexed_chunks = (
+            self._persistir_article(document_chunks) if document_chunks else 0
+        )
+
+        if self.crawl_state is not None:
+            self.crawl_state.mark_indexed(
+                article=article,
+                article_info=article_info,
+                chunk_ids=get_id_list(document_list=document_chunks),
+                model=self.settings.embedding_model_name,
+            )
+
+        return indexed_chunks
+
+    def _get_indexed_chunks(self, *, article: ArticleLink) -> Optional[int]:
+        if self.crawl_state is None:
+            return None
+
+        article_state = self.crawl_state.get(article=article)
+
+        # DESC: Artigos indexados com outro modelo de embeddings são reindexados
+        if (
+            article_state is None
+            or article_state.status != INDEXED
+            or article_state.model != self.settings.embedding_model_name
+        ):
+            return None
+
+        return len(article_state.chunk_ids)
+
+    def _index_articles(self, *, articles: List[ArticleLink]) -> List[int]:
+        indexed_articles = []
+        pending_articles = []
+
+        for article in articles:
+            # DESC: No replay os artigos indexados também são extraídos e
+            # indexados novamente, aplicando as correções do parser
+            indexed_chunks = (
+                None if self._is_replay() else self._get_indexed_chunks(article=article)
+            )
+
+            if indexed_chunks is None:
+                pending_articles.append(article)
+            else:
+                indexed_articles.append(indexed_chunks)
+
+        get_metrics().increment('articles_skipped', len(indexed_articles))
+
+        if indexed_articles:
+            logger.info(
+                f'Crawl state: {len(indexed_articles)} articles already indexed, '
+                f'{len(pending_articles)} pending'
+            )
+
+        # DESC: Cada artigo segue captação -> parse -> persistência assim
+        # que estiver pronto, com filas limitadas entre os estágios
+        with ThreadPoolExecutor(max_workers=self.settings.scrapper_workers) as executor:
+            indexed_articles.extend(
+                Pipeline(
+                    stages=[self._parse_article, self._index_article],
+                    # DESC: A fila comporta um PDF em parse por worker
+                    queue_size=max(
+                        self.settings.pipeline_queue_size, self.settings.parse_workers
+                    ),
+                ).run(
+                    items=self._iter_article_infos(
+                        articles=pending_articles, executor=executor
+                    )
+                )
+            )
+
+        return indexed_articles
@@ -0,0 +1,150 @@
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import logfire
+
+from src.logger import Logger
+from src.templates.article_scrapper_base import ArticleScrapperBase
+from src.templates.dataclass import IssueSummary
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+# DESC: O journal publica 4 issues por ano
+DEFAULT_JOURNAL_NUMBERS = '1-4'
+
+
+def parse_range(*, value: str) -> List[int]:
+    """Parse ranges such as '2020-2022,2024' into [2020, 2021, 2022, 2024]."""
+    items = []
+
+    for part in value.split(','):
+        part = part.strip()
+
+        if not part:
+            continue
+
+        start, _, end = part.partition('-')
+        items.extend(range(int(start), int(end or start) + 1))
+
+    return sorted(set(items))
+
+
+def get_issues(
+    *,
+    years: str = '',
+    numbers: str = DEFAULT_JOURNAL_NUMBERS,
+    since_year: Optional[int] = None,
+    current_year: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    if since_year is not None:
+        current_year = current_year or datetime.date.today().year
+        years = f'{since_year}-{current_year}'
+
+    return [
+        (number, year)
+        for year in parse_range(value=years)
+        for number in parse_range(value=numbers or DEFAULT_JOURNAL_NUMBERS)
+    ]
+
+
+def _execute_issue(
+    *, web_scrapper: ArticleScrapperBase, number: int, year: int
+) -> IssueSummary:
+    # DESC: Import lento (selenium e langchain), feito apenas na execução
+    from src.utils import IssueNotPublishedError
+
+    start = time.perf_counter()
+
+    try:
+        indexed_articles = web_scrapper.execute_issue(number=number, year=year)
+
+    except IssueNotPublishedError as e:
+        # DESC: Issues futuras (JOURNAL_SINCE_YEAR até o ano atual)
+        # são puladas, sem contar como falha
+        logger.info(f'Issue {number}/{year} skipped: {e}')
+
+        return IssueSummary(
+            year=year,
+            number=number,
+            status='skipped',
+            seconds=time.perf_counter() - start,
+            error=str(e),
+        )
+
+    except Exception as e:
+        # DESC: A falha de uma issue não interrompe as demais
+        logger.info(f'Error to execute the issue {number}/{year}: {e}')
+        logfire.exception(f'Error to execute the issue {number}/{year}: {e}')
+
+        return IssueSummary(
+            year=year,
+            number=number,
+            status='failed',
+            seconds=time.perf_counter() - start,
+            error=str(e) or type(e).__name__,
+        )
+
+    return IssueSummary(
+        year=year,
+        number=number,
+        status='success',
+        articles=len(indexed_articles),
+        chunks=sum(indexed_articles),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def execute_batch(
+    *,
+    web_scrapper: ArticleScrapperBase,
+    issues: List[Tuple[int, int]],
+    workers: int = 1,
+) -> List[IssueSummary]:
+    # DESC: Drivers/sessão HTTP, store de PDF's, modelo de embeddings
+    # e conexões são configurados uma única vez para todas as issues
+    web_scrapper.config()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            summaries = list(
+                executor.map(
+                    lambda issue: _execute_issue(
+                        web_scrapper=web_scrapper, number=issue[0], year=issue[1]
+                    ),
+                    issues,
+                )
+            )
+    finally:
+        web_scrapper.close()
+
+    log_batch_summary(summaries=summaries)
+
+    return summaries
+
+
+def log_batch_summary(*, summaries: List[IssueSummary]):
+    logger.info('-' * 10)
+
+    for summary in summaries:
+        logger.info(
+            f'Issue {summary.number}/{summary.year}: {summary.status}, '
+            f'articles={summary.articles}, chunks={summary.chunks}, '
+            f'seconds={summary.seconds:.1f} {summary.error}'.rstrip()
+        )
+
+    logger.info(
+        f'Batch: issues={len(summaries)}, '
+        f'success={sum(summary.status == "success" for summary in summaries)}, '
+        f'skipped={sum(summary.status == "skipped" for summary in summaries)}, '
+        f'chunks={sum(summary.chunks for summary in summaries)}'
+    )
+    logger.info('-' * 10)
+
+    logfire.info(
+        'batch summary', summaries=[summary.model_dump() for summary in summaries]
+    )
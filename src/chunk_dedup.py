@@ -0,0 +1,306 @@
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import struct
+import threading
+from typing import Dict, List, Set, Tuple
+
+from langchain.schema import Document
+
+from src.templates.dataclass import ChunkDuplicate
+
+# DESC: Tipos de duplicata
+EXACT = 'exact'
+NEAR = 'near'
+
+# DESC: Primo de Mersenne das permutações do MinHash, hashes de 32 bits
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# DESC: Escritas no relatório do dedup, feitas pelos workers do pipeline
+REPORT_LOCK = threading.Lock()
+
+
+def get_words(*, text: str) -> List[str]:
+    return WORD_PATTERN.findall(text.lower())
+
+
+def get_text_hash(*, text: str) -> str:
+    # DESC: Caixa, pontuação e espaços não diferenciam os chunks
+    return hashlib.sha256(' '.join(get_words(text=text)).encode('utf-8')).hexdigest()
+
+
+def get_shingles(*, text: str, size: int = 3) -> Set[str]:
+    words = get_words(text=text)
+
+    if len(words) <= size:
+        return {' '.join(words)}
+
+    return {' '.join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def get_lsh_params(*, threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Bands and rows whose LSH threshold (1/bands)**(1/rows) is the highest
+    one below the similarity threshold, so near duplicates are rarely missed."""
+    params = [
+        (num_perm // rows, rows)
+        for rows in range(1, num_perm + 1)
+        if num_perm % rows == 0
+    ]
+    below = [
+        (bands, rows)
+        for bands, rows in params
+        if (1 / bands) ** (1 / rows) <= threshold
+    ]
+
+    return max(below or params[:1], key=lambda item: (1 / item[0]) ** (1 / item[1]))
+
+
+# MinHash
+class MinHash:
+    """MinHash signatures of shingle sets, with num_perm seeded permutations."""
+
+    def __init__(self, *, num_perm: int = 64, seed: int = 1):
+        generator = random.Random(seed)
+
+        self.num_perm = num_perm
+        self.permutations = [
+            (
+                generator.randint(1, MERSENNE_PRIME - 1),
+                generator.randint(0, MERSENNE_PRIME - 1),
+            )
+            for _ in range(num_perm)
+        ]
+
+    def get_signature(self, *, shingles: Set[str]) -> List[int]:
+        hashes = [
+            int.from_bytes(
+                hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'big'
+            )
+            for shingle in shingles
+        ]
+
+        return [
+            min(((a * value + b) % MERSENNE_PRIME) & MAX_HASH for value in hashes)
+            for a, b in self.permutations
+        ]
+
+
+def get_similarity(*, signature: List[int], other: List[int]) -> float:
+    """Jaccard similarity estimated by the MinHash signatures."""
+    return sum(1 for a, b in zip(signature, other) if a == b) / len(signature)
+
+
+def write_duplicates_report(
+    *,
+    path: str,
+    page_link: str,
+    duplicates: List[ChunkDuplicate],
+    chunks: Dict[str, Document],
+):
+    # DESC: Uma linha JSON por chunk removido, com o trecho do texto
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with REPORT_LOCK, open(path, 'a') as file:
+        for duplicate in duplicates:
+            metadata = chunks[duplicate.id].metadata
+
+            file.write(
+                json.dumps(
+                    {
+                        **duplicate.model_dump(),
+                        'page_link': page_link,
+                        'doi': metadata.get('doi', ''),
+                        'page': metadata.get('page', ''),
+                        'start_index': metadata.get('start_index', ''),
+                        'text': chunks[duplicate.id].page_content[:200],
+                    }
+                )
+                + '\n'
+            )
+
+
+# ChunkDedup
+class ChunkDedup:
+    """SQLite index of the chunks kept so far, shared by articles and runs.
+
+    A chunk is an exact duplicate when its normalized text was kept before,
+    and a near duplicate when a kept chunk in the same LSH bucket has a
+    MinHash similarity above the threshold. The first occurrence is kept.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        threshold: float = 0.9,
+        num_perm: int = 64,
+        shingle_size: int = 3,
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.minhash = MinHash(num_perm=num_perm)
+        self.bands, self.rows = get_lsh_params(threshold=threshold, num_perm=num_perm)
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        # DESC: O dedup usa BEGIN IMMEDIATE, workers em outros
+        # processos não mantêm a mesma duplicata
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS chunks ('
+            'id TEXT PRIMARY KEY, '
+            'text_sha256 TEXT NOT NULL, '
+            'signature BLOB NOT NULL)'
+        )
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS chunks_text_sha256 ON chunks (text_sha256)'
+        )
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS buckets ('
+            'band INTEGER NOT NULL, '
+            'bucket TEXT NOT NULL, '
+            'id TEXT NOT NULL)'
+        )
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS buckets_band_bucket ON buckets (band, bucket)'
+        )
+
+    def _get_buckets(self, *, signature: List[int]) -> List[str]:
+        return [
+            hashlib.blake2b(
+                struct.pack(
+                    f'{self.rows}I',
+                    *signature[band * self.rows : (band + 1) * self.rows],
+                ),
+                digest_size=8,
+            ).hexdigest()
+            for band in range(self.bands)
+        ]
+
+    def _find_duplicate(
+        self,
+        *,
+        chunk_id: str,
+        text_sha256: str,
+        signature: List[int],
+        buckets: List[str],
+    ):
+        row = self._connection.execute(
+            'SELECT id FROM chunks WHERE text_sha256 = ? LIMIT 1', (text_sha256,)
+        ).fetchone()
+
+        if row is not None:
+            return ChunkDuplicate(
+                id=chunk_id, duplicate_of=row[0], similarity=1.0, kind=EXACT
+            )
+
+        candidates = set()
+
+        for band, bucket in enumerate(buckets):
+            candidates.update(
+                candidate
+                for (candidate,) in self._connection.execute(
+                    'SELECT id FROM buckets WHERE band = ? AND bucket = ?',
+                    (band, bucket),
+                )
+            )
+
+        best = None
+
+        for candidate in sorted(candidates):
+            (blob,) = self._connection.execute(
+                'SELECT signature FROM chunks WHERE id = ?', (candidate,)
+            ).fetchone()
+
+            similarity = get_similarity(
+                signature=signature,
+                other=list(struct.unpack(f'{len(signature)}I', blob)),
+            )
+
+            if similarity >= self.threshold and (
+                best is None or similarity > best.similarity
+            ):
+                best = ChunkDuplicate(
+                    id=chunk_id,
+                    duplicate_of=candidate,
+                    similarity=similarity,
+                    kind=NEAR,
+                )
+
+        return best
+
+    def deduplicate(
+        self, *, chunk_ids: List[str], texts: List[str]
+    ) -> List[ChunkDuplicate]:
+        """Keep the new chunks in the index, returning the duplicates to drop."""
+        duplicates = []
+
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+
+            try:
+                for chunk_id, text in zip(chunk_ids, texts):
+                    # DESC: O mesmo chunk (reindexação do artigo) é mantido
+                    if self._connection.execute(
+                        'SELECT 1 FROM chunks WHERE id = ?', (chunk_id,)
+                    ).fetchone():
+                        continue
+
+                    text_sha256 = get_text_hash(text=text)
+                    signature = self.minhash.get_signature(
+                        shingles=get_shingles(text=text, size=self.shingle_size)
+                    )
+                    buckets = self._get_buckets(signature=signature)
+
+                    duplicate = self._find_duplicate(
+                        chunk_id=chunk_id,
+                        text_sha256=text_sha256,
+                        signature=signature,
+                        buckets=buckets,
+                    )
+
+                    if duplicate is not None:
+                        duplicates.append(duplicate)
+                        continue
+
+                    self._connection.execute(
+                        'INSERT INTO chunks (id, text_sha256, signature) '
+                        'VALUES (?, ?, ?)',
+                        (
+                            chunk_id,
+                            text_sha256,
+                            struct.pack(f'{len(signature)}I', *signature),
+                        ),
+                    )
+                    self._connection.executemany(
+                        'INSERT INTO buckets (band, bucket, id) VALUES (?, ?, ?)',
+                        [
+                            (band, bucket, chunk_id)
+                            for band, bucket in enumerate(buckets)
+                        ],
+                    )
+
+                self._connection.execute('COMMIT')
+
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+        return duplicates
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+from src.templates.dataclass import ArticleLink, ExportedChunk
+
+if TYPE_CHECKING:
+    from langchain.schema import Document
+
+
+def get_chunk_schema():
+    # DESC: Import lento, feito apenas na exportação e na carga
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ('id', pa.string()),
+            ('doi', pa.string()),
+            ('text', pa.string()),
+            ('metadata', pa.string()),
+            ('embedding', pa.list_(pa.float32())),
+            ('embedding_model', pa.string()),
+        ]
+    )
+
+
+# ChunkExport
+class ChunkExport:
+    """Parquet files of the parsed chunks, partitioned by year and issue number.
+
+    Each article is written to its own file (year=<year>/number=<number>/),
+    so exporting an article again replaces its chunks. The files are read
+    back in batches to index the chunks without crawling or parsing again.
+    """
+
+    def __init__(self, *, root: str):
+        self.root = root
+
+    def get_path(self, *, article: ArticleLink) -> str:
+        key = hashlib.sha256(article.page_link.encode('utf-8')).hexdigest()[:16]
+
+        return os.path.join(
+            self.root,
+            f'year={article.year}',
+            f'number={article.number}',
+            f'article_{key}.parquet',
+        )
+
+    def write(
+        self,
+        *,
+        article: ArticleLink,
+        document_chunks: List['Document'],
+        chunk_ids: List[str],
+        embeddings: Optional[List[List[float]]] = None,
+        embedding_model: str = '',
+    ) -> str:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self.get_path(article=article)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        table = pa.Table.from_pydict(
+            {
+                'id': chunk_ids,
+                'doi': [
+                    str(document.metadata.get('doi', ''))
+                    for document in document_chunks
+                ],
+                'text': [document.page_content for document in document_chunks],
+                'metadata': [
+                    json.dumps(document.metadata, sort_keys=True)
+                    for document in document_chunks
+                ],
+                'embedding': embeddings or [None] * len(document_chunks),
+                'embedding_model': [embedding_model if embeddings else '']
+                * len(document_chunks),
+            },
+            schema=get_chunk_schema(),
+        )
+
+        # DESC: Arquivos iniciados por '.' são ignorados na leitura,
+        # o arquivo parcial é movido ao final da escrita
+        partial_path = os.path.join(
+            os.path.dirname(path),
+            f'.{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.part',
+        )
+        pq.write_table(table, partial_path, compression='zstd')
+        os.replace(partial_path, path)
+
+        return path
+
+    def iter_batches(
+        self, *, batch_size: int, years: Optional[List[int]] = None
+    ) -> Iterator[List[ExportedChunk]]:
+        """Stream the exported chunks, batch_size chunks at a time."""
+        if not os.path.isdir(self.root):
+            return
+
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        partition_schema = pa.schema([('year', pa.int32()), ('number', pa.int32())])
+
+        dataset = ds.dataset(
+            self.root,
+            format='parquet',
+            partitioning=ds.partitioning(partition_schema, flavor='hive'),
+            schema=pa.unify_schemas([get_chunk_schema(), partition_schema]),
+        )
+
+        batch = []
+
+        for record_batch in dataset.to_batches(
+            filter=ds.field('year').isin(years) if years else None,
+            batch_size=batch_size,
+        ):
+            for row in record_batch.to_pylist():
+                batch.append(
+                    ExportedChunk(
+                        id=row['id'],
+                        text=row['text'],
+                        metadata=json.loads(row['metadata']),
+                        embedding=row['embedding'],
+                        embedding_model=row['embedding_model'] or '',
+                    )
+                )
+
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+
+        if batch:
+            yield batch
@@ -0,0 +1,130 @@
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+import logfire
+
+from src.connections.chromadb_handler import ChromaDBHandler
+from src.connections.config import Config
+from src.connections.utils import get_chroma_backend
+from src.logger import Logger
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+
+# DEF: Get the key of the client, a config change creates a new client
+def _get_client_key(*, config: Config, backend: str) -> Tuple[str, ...]:
+    return (
+        backend,
+        config.chroma_host,
+        config.chroma_port,
+        config.chroma_client_auth_credentials,
+        config.chroma_persist_path,
+    )
+
+
+# ChromaConnection
+class ChromaConnection:
+    """Chroma clients and collection handles shared by the whole process.
+
+    Each backend is connected once and its collections are fetched once per
+    (name, embedding model). A failed call drops the client and its handles,
+    reconnects and runs the call again.
+    """
+
+    def __init__(self, *, handler: Optional[ChromaDBHandler] = None):
+        self.handler = handler or ChromaDBHandler()
+
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, ...], object] = {}
+        self._collections: Dict[Tuple[str, ...], object] = {}
+
+    def get_client(self, *, config: Config, backend: Optional[str] = None):
+        backend = backend or get_chroma_backend(config=config)
+        key = _get_client_key(config=config, backend=backend)
+
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = self.handler.connect(
+                    config=config, backend=backend
+                )
+
+            return self._clients[key]
+
+    def get_collection(
+        self,
+        *,
+        config: Config,
+        embedding_model_name: str,
+        backend: Optional[str] = None,
+    ):
+        backend = backend or get_chroma_backend(config=config)
+        key = (
+            *_get_client_key(config=config, backend=backend),
+            config.chroma_collection,
+            embedding_model_name,
+        )
+
+        client = self.get_client(config=config, backend=backend)
+
+        with self._lock:
+            if key not in self._collections:
+                self._collections[key] = self.handler.get_collection(
+                    config=config,
+                    client=client,
+                    embedding_model_name=embedding_model_name,
+                )
+
+            return self._collections[key]
+
+    def reset(self, *, config: Config, backend: Optional[str] = None):
+        backend = backend or get_chroma_backend(config=config)
+        key = _get_client_key(config=config, backend=backend)
+
+        with self._lock:
+            self._clients.pop(key, None)
+
+            for collection_key in list(self._collections):
+                if collection_key[: len(key)] == key:
+                    del self._collections[collection_key]
+
+    def run(
+        self,
+        function: Callable,
+        *,
+        config: Config,
+        embedding_model_name: str,
+        backend: Optional[str] = None,
+        retries: int = 1,
+    ):
+        """Run function(client=..., collection=...), reconnecting on failure."""
+        for attempt in range(retries + 1):
+            try:
+                return function(
+                    client=self.get_client(config=config, backend=backend),
+                    collection=self.get_collection(
+                        config=config,
+                        embedding_model_name=embedding_model_name,
+                        backend=backend,
+                    ),
+                )
+
+            except Exception as e:
+                if attempt == retries:
+                    raise
+
+                # DESC: Cliente ou coleção inválidos (servidor reiniciado,
+                # conexão perdida), a conexão é refeita na próxima tentativa
+                logger.info(f'Chroma call failed ({e!r}), reconnecting')
+                logfire.info('chroma reconnect', attempt=attempt, error=repr(e))
+
+                self.reset(config=config, backend=backend)
+
+
+# DEF: Get the Chroma connection shared by every scrapper of the process
+@lru_cache(maxsize=None)
+def get_chroma_connection() -> ChromaConnection:
+    return ChromaConnection()
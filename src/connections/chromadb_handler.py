@@ -1,9 +1,16 @@
-import chromadb
+from typing import TYPE_CHECKING, List, Optional
+
 import logfire
-from chromadb.config import Settings
 
 from src.connections.config import Config
+from src.connections.embeddings import get_embedding_cache, get_embeddings
 from src.connections.utils import (
+    HTTP_BACKEND,
+    PERSISTENT_BACKEND,
+    get_batch_size,
+    get_batches,
+    get_chroma_backend,
+    get_chroma_url,
     get_document_list,
     get_embedding_function,
     get_id_list,
@@ -11,8 +18,15 @@ from src.connections.utils import (
     get_text_list,
 )
 from src.logger import Logger
+from src.metrics import get_metrics
 from src.templates.chromadb_base import ChromaDBBase
 
+if TYPE_CHECKING:
+    from src.chunk_export import ChunkExport
+
+# DESC: Metadado da coleção com o modelo de embeddings
+EMBEDDING_MODEL_METADATA = 'embedding_model'
+
 # --------------------------
 # -----DESC: Logger-----
 logger = Logger().get_logger()
@@ -21,11 +35,23 @@ logger = Logger().get_logger()
 
 # ChromaDB
 class ChromaDBHandler(ChromaDBBase):
-    def connect(self, *, config: Config) -> chromadb.HttpClient:
-        host = f'http://{config.chroma_host}:{config.chroma_port}'
+    def connect(self, *, config: Config, backend: Optional[str] = None):
+        backend = backend or get_chroma_backend(config=config)
+
+        if backend == PERSISTENT_BACKEND:
+            return self._connect_persistent(config=config)
+
+        if backend != HTTP_BACKEND:
+            raise ValueError(
+                f'Invalid chroma backend {backend}, please, inform one of {[HTTP_BACKEND, PERSISTENT_BACKEND]}'
+            )
+
+        # DESC: Import lento, feito apenas na conexão
+        import chromadb
+        from chromadb.config import Settings
 
         client = chromadb.HttpClient(
-            host=host,
+            host=get_chroma_url(config=config),
             settings=Settings(
                 allow_reset=True,
                 anonymized_telemetry=False,
@@ -37,19 +63,51 @@ class ChromaDBHandler(ChromaDBBase):
 
         return client
 
+    def _connect_persistent(self, *, config: Config):
+        import chromadb
+        from chromadb.config import Settings
+
+        # DESC: Store local, no mesmo processo, sem HTTP e serialização JSON
+        return chromadb.PersistentClient(
+            path=config.chroma_persist_path,
+            settings=Settings(allow_reset=True, anonymized_telemetry=False),
+        )
+
+    def get_collection(self, *, config: Config, client, embedding_model_name: str):
+        # DESC: O modelo fica nos metadados da coleção, registrado na criação
+        document_collection = client.get_or_create_collection(
+            name=config.chroma_collection,
+            embedding_function=get_embedding_function(
+                embedding_model_name=embedding_model_name
+            ),
+            metadata={EMBEDDING_MODEL_METADATA: embedding_model_name},
+        )
+
+        # DESC: Embeddings de outro modelo (outra dimensão) não se misturam
+        # na mesma coleção, coleções antigas sem o modelo são aceitas
+        collection_model = (document_collection.metadata or {}).get(
+            EMBEDDING_MODEL_METADATA
+        )
+
+        if collection_model and collection_model != embedding_model_name:
+            raise ValueError(
+                f'The collection {config.chroma_collection} was created with the embedding model {collection_model}, please, inform another CHROMA_COLLECTION for {embedding_model_name}'
+            )
+
+        return document_collection
+
     def insert(
         self,
         *,
         config: Config,
-        client: chromadb.HttpClient,
+        client,
         document_chunks,
         embedding_model_name: str,
+        collection=None,
     ):
-        document_collection = client.get_or_create_collection(
-            name=config.chroma_collection,
-            embedding_function=get_embedding_function(
-                embedding_model_name=embedding_model_name
-            ),
+        # DESC: A coleção pode vir do cache da conexão
+        document_collection = collection or self.get_collection(
+            config=config, client=client, embedding_model_name=embedding_model_name
         )
 
         # DESC: get the document list
@@ -59,73 +117,276 @@ class ChromaDBHandler(ChromaDBBase):
         document_ids = get_id_list(document_list=document_list)
 
         # DESC: get the text of the documents
-        document_texts = get_text_list(document_list=document_list)
+        document_texts = get_text_list(
+            document_list=document_list,
+            keep_punctuation=config.preprocess_keep_punctuation,
+            collapse_whitespace=config.preprocess_collapse_whitespace,
+        )
 
         # DESC: get the metadatas of the documents
         document_metadatas = get_metadata_list(document_list=document_list)
 
+        # DESC: respeitar o tamanho máximo de batch aceito pelo servidor
+        batch_size = get_batch_size(client=client, batch_size=config.chroma_batch_size)
+
+        from chromadb.errors import DuplicateIDError
+
         # DESC: Add the documents inside the ChromaDB
         # throught the configured collection
         try:
-            for i in range(len(document_ids)):
-                metadata = {
-                    'doi': document_list[i].metadata.get('doi', ''),
-                    'publication_date': document_list[i].metadata.get(
-                        'publication_date', ''
-                    ),
-                    'page': document_list[i].metadata.get('page', ''),
-                    'start_index': document_list[i].metadata.get('start_index', ''),
-                }
-
-                # FIXME: Acho interessante verificarmos se os
-                # documentos existem no ChromaDB em Batch...
-
-                # DESC: Filtro para verificar se já existe um documento
-                # com este ID inserido no ChromaDB
-                document = document_collection.get(
-                    ids=[document_ids[i]],
-                    include=['metadatas', 'documents', 'embeddings'],
+            for batch in get_batches(
+                items=list(zip(document_ids, document_texts, document_metadatas)),
+                batch_size=batch_size,
+            ):
+                with get_metrics().span('chroma_batch', chunks=len(batch)):
+                    self._insert_batch(
+                        config=config,
+                        document_collection=document_collection,
+                        batch=batch,
+                        embedding_model_name=embedding_model_name,
+                    )
+
+        except DuplicateIDError as e:
+            logger.info('-' * 10)
+            logger.info(f'ERROR - DuplicateIDError occurred: {e}')
+            logger.info('-' * 10)
+            logfire.exception(f'ERROR - DuplicateIDError occurred: {e}')
+
+            pass
+
+    def _insert_batch(
+        self,
+        *,
+        config: Config,
+        document_collection,
+        batch,
+        embedding_model_name: str,
+    ):
+        metrics = get_metrics()
+
+        # DESC: Filtro em batch para verificar quais IDs já foram
+        # inseridos no ChromaDB, sem trazer os embeddings de volta
+        with metrics.span('chroma_get', chunks=len(batch)):
+            existing_ids = set(
+                document_collection.get(
+                    ids=[document_id for document_id, _, _ in batch],
+                    include=[],
+                ).get('ids', [])
+            )
+
+        # DESC: Chunks repetidos dentro da mesma execução
+        # também são considerados existentes
+        new_documents = []
+
+        for document_id, document_text, document_metadata in batch:
+            if document_id in existing_ids:
+                continue
+
+            existing_ids.add(document_id)
+            new_documents.append((document_id, document_text, document_metadata))
+
+        skipped = len(batch) - len(new_documents)
+
+        if new_documents:
+            ids, texts, metadatas = (list(items) for items in zip(*new_documents))
+
+            # DESC: Embeddings calculados fora do ChromaDB, em batch
+            # e apenas para os chunks que ainda não foram inseridos
+            with metrics.span('embedding', chunks=len(texts)):
+                embeddings = get_embeddings(
+                    texts=texts,
+                    embedding_model_name=embedding_model_name,
+                    batch_size=config.embedding_batch_size,
+                    cache=get_embedding_cache(path=config.embedding_cache_path),
                 )
 
-                # FIXME: Acho interessante inserirmos os dados
-                # no ChromaDB em Batch...
+            with metrics.span('chroma_add', chunks=len(ids)):
+                document_collection.add(
+                    ids=ids,
+                    embeddings=embeddings,
+                    documents=texts,
+                    metadatas=metadatas,
+                )
 
-                # DESC: caso não tenha sido encontrado ids
-                # para o document recuperado
-                if not document.get('ids', None):
-                    document_collection.add(
-                        ids=document_ids[i],
-                        documents=document_texts[i],
-                        metadatas=document_metadatas[i],
-                    )
+        metrics.increment('chunks_inserted', len(new_documents))
+        metrics.increment('chunks_skipped', skipped)
 
-                    logger.info('-' * 10)
-                    logger.info(
-                        f'SUCCESS - Document inserted with success: ID={document_ids[i]}, metadata={metadata}'
-                    )
-                    logger.info('-' * 10)
-                    logfire.info(
-                        f'SUCCESS - Document inserted with success: ID={document_ids[i]}, metadata={metadata}',
-                        doi=metadata['doi'],
-                        publication_date=metadata['publication_date'],
-                    )
+        dois = sorted({metadata.get('doi', '') for _, _, metadata in batch})
+
+        logger.info('-' * 10)
+        logger.info(
+            f'SUCCESS - Batch inserted with success: inserted={len(new_documents)}, already_exists={skipped}, doi={dois}'
+        )
+        logger.info('-' * 10)
+        logfire.info(
+            f'SUCCESS - Batch inserted with success: inserted={len(new_documents)}, already_exists={skipped}',
+            inserted=len(new_documents),
+            already_exists=skipped,
+            doi=dois,
+        )
+
+    def ship(
+        self,
+        *,
+        config: Config,
+        source_client,
+        target_client,
+        embedding_model_name: str,
+    ) -> int:
+        """Copy the chunks of the local store to the server, embeddings included."""
+        source_collection = self.get_collection(
+            config=config,
+            client=source_client,
+            embedding_model_name=embedding_model_name,
+        )
+        target_collection = self.get_collection(
+            config=config,
+            client=target_client,
+            embedding_model_name=embedding_model_name,
+        )
+
+        batch_size = get_batch_size(
+            client=target_client, batch_size=config.chroma_batch_size
+        )
+
+        metrics = get_metrics()
+        offset = 0
+        shipped = 0
 
-                else:
-                    logger.info('-' * 10)
-                    logger.info(
-                        f'ERROR - Document already exists: ID={document_ids[i]}, metadata={metadata}'
+        while True:
+            batch = source_collection.get(
+                limit=batch_size,
+                offset=offset,
+                include=['embeddings', 'documents', 'metadatas'],
+            )
+
+            if not batch['ids']:
+                break
+
+            offset += len(batch['ids'])
+
+            # DESC: Chunks já existentes no servidor não são reenviados
+            existing_ids = set(
+                target_collection.get(ids=batch['ids'], include=[]).get('ids', [])
+            )
+            positions = [
+                position
+                for position, document_id in enumerate(batch['ids'])
+                if document_id not in existing_ids
+            ]
+
+            if positions:
+                with metrics.span('chroma_add', chunks=len(positions)):
+                    target_collection.add(
+                        ids=[batch['ids'][position] for position in positions],
+                        embeddings=[
+                            [float(value) for value in batch['embeddings'][position]]
+                            for position in positions
+                        ],
+                        documents=[
+                            batch['documents'][position] for position in positions
+                        ],
+                        metadatas=[
+                            batch['metadatas'][position] for position in positions
+                        ],
                     )
-                    logger.info('-' * 10)
-                    logfire.exception(
-                        f'ERROR - Document already exists: ID={document_ids[i]}, metadata={metadata}',
-                        doi=metadata['doi'],
-                        publication_date=metadata['publication_date'],
+
+            shipped += len(positions)
+            metrics.increment('chunks_shipped', len(positions))
+
+        logger.info(f'SUCCESS - Bulk load shipped: shipped={shipped}, total={offset}')
+        logfire.info(
+            f'SUCCESS - Bulk load shipped: shipped={shipped}, total={offset}',
+            shipped=shipped,
+            total=offset,
+        )
+
+        return shipped
+
+    def load(
+        self,
+        *,
+        config: Config,
+        client,
+        chunk_export: 'ChunkExport',
+        embedding_model_name: str,
+        years: Optional[List[int]] = None,
+    ) -> int:
+        """Index the exported chunks, reusing the embeddings of the same model."""
+        from langchain.schema import Document
+
+        document_collection = self.get_collection(
+            config=config, client=client, embedding_model_name=embedding_model_name
+        )
+
+        batch_size = get_batch_size(client=client, batch_size=config.chroma_batch_size)
+
+        metrics = get_metrics()
+        loaded = 0
+
+        for chunks in chunk_export.iter_batches(batch_size=batch_size, years=years):
+            document_list = [
+                Document(page_content=chunk.text, metadata=chunk.metadata)
+                for chunk in chunks
+            ]
+            document_texts = get_text_list(
+                document_list=document_list,
+                keep_punctuation=config.preprocess_keep_punctuation,
+                collapse_whitespace=config.preprocess_collapse_whitespace,
+            )
+
+            # DESC: Embeddings exportados com o mesmo modelo são enviados
+            # direto, os demais são calculados como em um insert
+            if all(
+                chunk.embedding is not None
+                and chunk.embedding_model == embedding_model_name
+                for chunk in chunks
+            ):
+                existing_ids = set(
+                    document_collection.get(
+                        ids=[chunk.id for chunk in chunks], include=[]
+                    ).get('ids', [])
+                )
+                positions = [
+                    position
+                    for position, chunk in enumerate(chunks)
+                    if chunk.id not in existing_ids
+                ]
+
+                if positions:
+                    with metrics.span('chroma_add', chunks=len(positions)):
+                        document_collection.add(
+                            ids=[chunks[position].id for position in positions],
+                            embeddings=[
+                                chunks[position].embedding for position in positions
+                            ],
+                            documents=[
+                                document_texts[position] for position in positions
+                            ],
+                            metadatas=[
+                                chunks[position].metadata for position in positions
+                            ],
+                        )
+
+                metrics.increment('chunks_inserted', len(positions))
+                metrics.increment('chunks_skipped', len(chunks) - len(positions))
+
+            else:
+                with metrics.span('chroma_batch', chunks=len(chunks)):
+                    self._insert_batch(
+                        config=config,
+                        document_collection=document_collection,
+                        batch=[
+                            (chunk.id, document_text, chunk.metadata)
+                            for chunk, document_text in zip(chunks, document_texts)
+                        ],
+                        embedding_model_name=embedding_model_name,
                     )
 
-        except chromadb.errors.DuplicateIDError as e:
-            logger.info('-' * 10)
-            logger.info(f'ERROR - DuplicateIDError occurred: {e}')
-            logger.info('-' * 10)
-            logfire.exception(f'ERROR - DuplicateIDError occurred: {e}')
+            loaded += len(chunks)
+            metrics.increment('chunks_loaded', len(chunks))
 
-            pass
+        logger.info(f'SUCCESS - Chunk export loaded: chunks={loaded}')
+        logfire.info(f'SUCCESS - Chunk export loaded: chunks={loaded}', chunks=loaded)
+
+        return loaded
@@ -17,5 +17,149 @@ class Config(Singleton):
             'CHROMA_AUTH_TOKEN_TRANSPORT_HEADER', ''
         )
         self.chroma_collection = os.environ.get('CHROMA_COLLECTION', '')
+        self.chroma_batch_size = int(os.environ.get('CHROMA_BATCH_SIZE', '1000'))
+
+        # DESC: Backend do ChromaDB: 'http' (servidor) ou 'persistent' (local)
+        self.chroma_backend = os.environ.get('CHROMA_BACKEND', 'http')
+        self.chroma_persist_path = os.environ.get(
+            'CHROMA_PERSIST_PATH', '/tmp/scientific_crawler/chroma'
+        )
+        # DESC: Bulk load, os inserts vão para o store persistente local
+        # e a coleção é enviada ao servidor ao final da execução
+        self.chroma_bulk_load = (
+            os.environ.get('CHROMA_BULK_LOAD', 'false').lower() == 'true'
+        )
 
         self.embedding_model_name = os.environ.get('EMBEDDING_MODEL_NAME', '')
+        self.embedding_batch_size = int(os.environ.get('EMBEDDING_BATCH_SIZE', '256'))
+        # DESC: Normalização do texto dos chunks, desabilitada mantém
+        # o texto armazenado idêntico ao das versões anteriores
+        self.preprocess_keep_punctuation = (
+            os.environ.get('PREPROCESS_KEEP_PUNCTUATION', 'false').lower() == 'true'
+        )
+        self.preprocess_collapse_whitespace = (
+            os.environ.get('PREPROCESS_COLLAPSE_WHITESPACE', 'false').lower() == 'true'
+        )
+
+        # DESC: Cache persistente dos embeddings, vazio para desabilitar
+        self.embedding_cache_path = os.environ.get(
+            'EMBEDDING_CACHE_PATH', '/tmp/scientific_crawler/embeddings.sqlite3'
+        )
+
+        # DESC: Remoção dos chunks duplicados entre artigos (cabeçalhos,
+        # rodapés, referências) antes dos embeddings, desabilitada mantém
+        # os chunks armazenados idênticos aos das versões anteriores
+        self.chunk_dedup = os.environ.get('CHUNK_DEDUP', 'false').lower() == 'true'
+        self.chunk_dedup_path = os.environ.get(
+            'CHUNK_DEDUP_PATH', '/tmp/scientific_crawler/chunk_dedup.sqlite3'
+        )
+        # DESC: Similaridade (Jaccard estimada pelo MinHash) a partir
+        # da qual um chunk é considerado duplicado
+        self.chunk_dedup_threshold = float(
+            os.environ.get('CHUNK_DEDUP_THRESHOLD', '0.9')
+        )
+        # DESC: Relatório dos chunks removidos (JSON lines), vazio para desabilitar
+        self.chunk_dedup_report_path = os.environ.get(
+            'CHUNK_DEDUP_REPORT_PATH', '/tmp/scientific_crawler/chunk_dedup.jsonl'
+        )
+
+        # DESC: Parquet dos chunks por ano e issue, para reindexar sem
+        # um novo crawl, vazio para desabilitar
+        self.chunk_export_path = os.environ.get(
+            'CHUNK_EXPORT_PATH', '/tmp/scientific_crawler/chunks'
+        )
+        # DESC: Exporta também os embeddings, reaproveitados na carga
+        # quando o modelo de embeddings for o mesmo
+        self.chunk_export_embeddings = (
+            os.environ.get('CHUNK_EXPORT_EMBEDDINGS', 'false').lower() == 'true'
+        )
+
+        # DESC: Pool de browsers, a página da issue também usa um driver do pool,
+        # o tamanho efetivo é max(DRIVER_POOL_SIZE, SCRAPPER_WORKERS)
+        self.driver_pool_size = int(os.environ.get('DRIVER_POOL_SIZE', '2'))
+        self.driver_max_pages = int(os.environ.get('DRIVER_MAX_PAGES', '50'))
+
+        # DESC: Quantidade de artigos captados em paralelo
+        self.scrapper_workers = int(os.environ.get('SCRAPPER_WORKERS', '1'))
+
+        # DESC: Quantidade de issues executadas em paralelo no modo batch
+        self.batch_workers = int(os.environ.get('BATCH_WORKERS', '1'))
+
+        # DESC: Tamanho das filas entre os estágios do pipeline
+        self.pipeline_queue_size = int(os.environ.get('PIPELINE_QUEUE_SIZE', '4'))
+
+        # DESC: Processos do parse dos PDF's, 1 faz o parse na thread do
+        # pipeline, sem pool de processos (cada processo importa o langchain)
+        self.parse_workers = int(os.environ.get('PARSE_WORKERS', '1'))
+
+        # DESC: Backend do scrapper: 'selenium' ou 'http'
+        self.scrapper_backend = os.environ.get('SCRAPPER_BACKEND', 'selenium')
+        self.http_timeout = int(os.environ.get('HTTP_TIMEOUT', '30'))
+        # DESC: Novas tentativas das páginas após 429/5xx, no ritmo do rate limiter
+        self.http_retries = int(os.environ.get('HTTP_RETRIES', '3'))
+
+        # DESC: Diretório do store local dos PDF's
+        self.pdf_store_path = os.environ.get(
+            'PDF_STORE_PATH', '/tmp/scientific_crawler/pdfs'
+        )
+        self.pdf_revalidate = (
+            os.environ.get('PDF_REVALIDATE', 'false').lower() == 'true'
+        )
+
+        # DESC: Arquivo do HTML das páginas: 'record' arquiva as páginas
+        # acessadas, 'replay' lê as páginas do arquivo em vez da rede
+        self.page_archive_mode = os.environ.get('PAGE_ARCHIVE_MODE', 'record')
+        self.page_archive_path = os.environ.get(
+            'PAGE_ARCHIVE_PATH', '/tmp/scientific_crawler/pages'
+        )
+
+        # DESC: Requisições por segundo a cada host (páginas e PDF's),
+        # reduzidas até o mínimo em respostas 429/5xx, 0 para desabilitar
+        self.rate_limit_rps = float(os.environ.get('RATE_LIMIT_RPS', '2'))
+        self.rate_limit_burst = int(os.environ.get('RATE_LIMIT_BURST', '4'))
+        self.rate_limit_min_rps = float(os.environ.get('RATE_LIMIT_MIN_RPS', '0.2'))
+
+        # DESC: Downloads simultâneos por host e novas tentativas
+        self.download_per_host_limit = int(
+            os.environ.get('DOWNLOAD_PER_HOST_LIMIT', '2')
+        )
+        self.download_retries = int(os.environ.get('DOWNLOAD_RETRIES', '3'))
+        self.download_backoff = float(os.environ.get('DOWNLOAD_BACKOFF', '1.0'))
+
+        # DESC: Arquivo local das métricas dos estágios, JSON ou
+        # Prometheus (extensão .prom), vazio para desabilitar
+        self.metrics_path = os.environ.get(
+            'METRICS_PATH', '/tmp/scientific_crawler/metrics.json'
+        )
+
+        # DESC: Fila de artigos compartilhada entre os workers (modo fila),
+        # leases expirados voltam para a fila. Arquivo local, os workers
+        # rodam no mesmo host, compartilhando o volume
+        self.work_queue_path = os.environ.get(
+            'WORK_QUEUE_PATH', '/tmp/scientific_crawler/work_queue.sqlite3'
+        )
+        self.work_queue_lease_seconds = float(
+            os.environ.get('WORK_QUEUE_LEASE_SECONDS', '300')
+        )
+        self.work_queue_max_attempts = int(
+            os.environ.get('WORK_QUEUE_MAX_ATTEMPTS', '3')
+        )
+        self.work_queue_poll_seconds = float(
+            os.environ.get('WORK_QUEUE_POLL_SECONDS', '5')
+        )
+        # DESC: Identificador do worker, vazio para hostname-pid
+        self.worker_id = os.environ.get('WORKER_ID', '')
+
+        # DESC: Índice da listagem das issues, apenas os artigos novos ou
+        # alterados desde o último crawl são captados, vazio para desabilitar
+        self.issue_index_path = os.environ.get(
+            'ISSUE_INDEX_PATH', '/tmp/scientific_crawler/issue_index.sqlite3'
+        )
+        # DESC: Idade máxima (segundos) da captura de um artigo, o DOI e o
+        # link do PDF não estão na listagem, 0 para não verificar novamente
+        self.issue_index_max_age = float(os.environ.get('ISSUE_INDEX_MAX_AGE', '0'))
+
+        # DESC: Estado persistente do crawl, etapas já concluídas por artigo
+        self.crawl_state_path = os.environ.get(
+            'CRAWL_STATE_PATH', '/tmp/scientific_crawler/crawl_state.sqlite3'
+        )
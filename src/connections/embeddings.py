@@ -0,0 +1,132 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from src.connections.utils import get_batches, get_embedding_function
+from src.logger import Logger
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+
+# DEF: Get the SHA256 of the preprocessed text
+def get_text_sha256(*, text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# EmbeddingCache
+class EmbeddingCache:
+    """SQLite cache of embeddings keyed by (model name, SHA256 of the text)."""
+
+    def __init__(self, *, path: str):
+        self.path = path
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS embeddings ('
+            'model TEXT NOT NULL, '
+            'text_sha256 TEXT NOT NULL, '
+            'embedding BLOB NOT NULL, '
+            'PRIMARY KEY (model, text_sha256))'
+        )
+        self._connection.commit()
+
+    def get_many(self, *, model: str, text_hashes: List[str]) -> Dict[str, List[float]]:
+        embeddings = {}
+
+        with self._lock:
+            # DESC: Limite de variáveis por consulta do SQLite
+            for batch in get_batches(items=list(set(text_hashes)), batch_size=500):
+                rows = self._connection.execute(
+                    'SELECT text_sha256, embedding FROM embeddings '
+                    f'WHERE model = ? AND text_sha256 IN ({",".join("?" * len(batch))})',
+                    [model, *batch],
+                )
+
+                for text_sha256, embedding in rows:
+                    embeddings[text_sha256] = array('f', embedding).tolist()
+
+        return embeddings
+
+    def put_many(self, *, model: str, embeddings: Dict[str, List[float]]):
+        with self._lock:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO embeddings (model, text_sha256, embedding) '
+                'VALUES (?, ?, ?)',
+                [
+                    (model, text_sha256, array('f', embedding).tobytes())
+                    for text_sha256, embedding in embeddings.items()
+                ],
+            )
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+# DEF: Get the embedding cache, one per path and process
+@lru_cache(maxsize=None)
+def get_embedding_cache(*, path: str) -> Optional[EmbeddingCache]:
+    if not path:
+        return None
+
+    return EmbeddingCache(path=path)
+
+
+# DEF: Encode the texts in batches, reusing the cached embeddings
+def get_embeddings(
+    *,
+    texts: List[str],
+    embedding_model_name: str,
+    batch_size: int = 256,
+    cache: Optional[EmbeddingCache] = None,
+) -> List[List[float]]:
+    text_hashes = [get_text_sha256(text=text) for text in texts]
+
+    embeddings = (
+        cache.get_many(model=embedding_model_name, text_hashes=text_hashes)
+        if cache is not None
+        else {}
+    )
+
+    # DESC: Apenas os textos inéditos são codificados (uma vez cada)
+    missing = {
+        text_sha256: text
+        for text_sha256, text in zip(text_hashes, texts)
+        if text_sha256 not in embeddings
+    }
+
+    if missing:
+        embedding_function = get_embedding_function(
+            embedding_model_name=embedding_model_name
+        )
+
+        new_embeddings = {}
+
+        for batch in get_batches(items=list(missing.items()), batch_size=batch_size):
+            batch_embeddings = embedding_function([text for _, text in batch])
+
+            for (text_sha256, _), embedding in zip(batch, batch_embeddings):
+                new_embeddings[text_sha256] = [float(value) for value in embedding]
+
+        if cache is not None:
+            cache.put_many(model=embedding_model_name, embeddings=new_embeddings)
+
+        embeddings.update(new_embeddings)
+
+    logger.info(
+        f'Embeddings: total={len(texts)}, cached={len(texts) - len(missing)}, encoded={len(missing)}'
+    )
+
+    return [embeddings[text_sha256] for text_sha256 in text_hashes]
@@ -0,0 +1,89 @@
+import string
+from functools import lru_cache
+from typing import List
+
+# DESC: Caracteres mantidos no texto dos chunks (mesmo conjunto do
+# _get_preprocessed_text), todos fazem parte do latin-1
+ALLOWED_CHARACTERS = string.ascii_letters + string.digits + 'áéíóúÁÉÍÓÚâêîôÂÊÎÔãõÃÕçÇ: '
+
+# DESC: Pontuação relevante para os modelos de embeddings
+PUNCTUATION = '.,;!?()[]\'"%/+-=<>'
+
+
+# DESC: Espaços em branco do latin-1 (str.isspace), viram espaço no collapse
+WHITESPACE_BYTES = bytes(
+    byte for byte in range(256) if chr(byte).isspace() and chr(byte) != ' '
+)
+_WHITESPACE_TABLE = bytes.maketrans(WHITESPACE_BYTES, b' ' * len(WHITESPACE_BYTES))
+
+
+# DEF: Get the table of the removed latin-1 bytes
+@lru_cache(maxsize=None)
+def _get_removed_bytes(*, keep_punctuation: bool, collapse_whitespace: bool) -> bytes:
+    allowed_characters = ALLOWED_CHARACTERS
+
+    if keep_punctuation:
+        allowed_characters += PUNCTUATION
+
+    allowed_bytes = set(allowed_characters.encode('latin-1'))
+
+    if collapse_whitespace:
+        allowed_bytes.update(WHITESPACE_BYTES)
+
+    return bytes(byte for byte in range(256) if byte not in allowed_bytes)
+
+
+# DEF: Preprocess the texts of a whole chunk list
+def preprocess_texts(
+    *,
+    texts: List[str],
+    keep_punctuation: bool = False,
+    collapse_whitespace: bool = False,
+) -> List[str]:
+    """Without options the output is identical to _get_preprocessed_text.
+
+    collapse_whitespace turns every whitespace run (newlines included) into a
+    single space instead of deleting the newlines, which glues the words.
+    """
+    removed_bytes = _get_removed_bytes(
+        keep_punctuation=keep_punctuation, collapse_whitespace=collapse_whitespace
+    )
+
+    if not collapse_whitespace:
+        # DESC: Os caracteres fora do latin-1 nunca são mantidos e são
+        # descartados no encode, o restante é removido pela tabela de bytes
+        return [
+            text.encode('latin-1', 'ignore')
+            .translate(None, removed_bytes)
+            .decode('latin-1')
+            for text in texts
+        ]
+
+    preprocessed_texts = []
+
+    for text in texts:
+        # DESC: Espaços unicode (ex.: thin space) seriam descartados no encode
+        if not text.isascii():
+            text = ' '.join(text.split())
+
+        text = (
+            text.encode('latin-1', 'ignore')
+            .translate(_WHITESPACE_TABLE, removed_bytes)
+            .decode('latin-1')
+        )
+
+        # DESC: A remoção pode deixar espaços duplicados
+        preprocessed_texts.append(' '.join(text.split()))
+
+    return preprocessed_texts
+
+
+# DEF: Preprocess the text of a single chunk
+def preprocess_text(
+    *, text: str, keep_punctuation: bool = False, collapse_whitespace: bool = False
+) -> str:
+    return preprocess_texts(
+        texts=[text],
+        keep_punctuation=keep_punctuation,
+        collapse_whitespace=collapse_whitespace,
+    )[0]
@@ -1,9 +1,21 @@
+import base64
+import hashlib
 import re
-from typing import List
+import urllib.request
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List
 
-from chromadb.utils import embedding_functions
-from chromadbx import DocumentSHA256Generator
-from langchain.docstore.document import Document
+from src.connections.config import Config
+from src.connections.preprocessing import preprocess_texts
+
+# DESC: chromadb, chromadbx e langchain são importados apenas quando
+# usados, o import deles leva mais de um segundo
+if TYPE_CHECKING:
+    from langchain.docstore.document import Document
+
+# DESC: Backends do ChromaDB
+HTTP_BACKEND = 'http'
+PERSISTENT_BACKEND = 'persistent'
 
 
 # DESC: Transform documents matrix into documents list
@@ -15,23 +27,32 @@ def get_document_list(*, document_chunks):
 # documentos vão ter o mesmo DOI, pois estamos armazenando chunks,
 # logo é mais interessanter colocar informações
 # complementares aos chunks: doi, source, page...
-def _get_document_id(*, document_chunk: Document):
-    doi = document_chunk.metadata.get('doi', '')
-    publication_date = document_chunk.metadata.get('publication_date', '')
-    page = document_chunk.metadata.get('page', '')
-    start_index = document_chunk.metadata.get('start_index', '')
-
-    document_name = '_'.join(
-        str(item) for item in [doi, publication_date, page, start_index]
+def _get_document_name(*, document_chunk: 'Document') -> str:
+    metadata = document_chunk.metadata
+
+    return (
+        f"{metadata.get('doi', '')}_{metadata.get('publication_date', '')}_"
+        f"{metadata.get('page', '')}_{metadata.get('start_index', '')}"
     )
 
+
+# DEF: Get the document id of a single chunk with the chromadbx generator
+def _get_document_id(*, document_chunk: 'Document'):
+    document_name = _get_document_name(document_chunk=document_chunk)
+
+    from chromadbx import DocumentSHA256Generator
+
     return DocumentSHA256Generator(documents=[document_name])[0]
 
 
-# DEF: Get the document ids
-def get_id_list(*, document_list: List[Document]):
+# DEF: Get the document ids of all the chunks in a single pass,
+# same SHA256 hex digest of the DocumentSHA256Generator (existing
+# collections keep the same ids), without one generator per chunk
+def get_id_list(*, document_list: List['Document']):
+    sha256 = hashlib.sha256
+
     return [
-        _get_document_id(document_chunk=document_chunk)
+        sha256(_get_document_name(document_chunk=document_chunk).encode()).hexdigest()
         for document_chunk in document_list
     ]
 
@@ -44,20 +65,96 @@ def _get_preprocessed_text(*, text):
 
 
 # DEF: Get the text list
-def get_text_list(*, document_list: List[Document]):
-    return [
-        _get_preprocessed_text(text=document_chunk.page_content)
-        for document_chunk in document_list
-    ]
+def get_text_list(
+    *,
+    document_list: List['Document'],
+    keep_punctuation: bool = False,
+    collapse_whitespace: bool = False,
+):
+    return preprocess_texts(
+        texts=[document_chunk.page_content for document_chunk in document_list],
+        keep_punctuation=keep_punctuation,
+        collapse_whitespace=collapse_whitespace,
+    )
 
 
 # DEF: Get the metadata list
-def get_metadata_list(*, document_list: List[Document]):
+def get_metadata_list(*, document_list: List['Document']):
     return [document_chunk.metadata for document_chunk in document_list]
 
 
-# DEF: Get the embedding function
+# DEF: Get the embedding function, the model is loaded once per process
+@lru_cache(maxsize=None)
 def get_embedding_function(*, embedding_model_name: str):
+    from chromadb.utils import embedding_functions
+
     return embedding_functions.SentenceTransformerEmbeddingFunction(
         model_name=embedding_model_name
     )
+
+
+# DEF: Split the items in batches of batch_size
+def get_batches(*, items: list, batch_size: int):
+    for start in range(0, len(items), batch_size):
+        yield items[start : start + batch_size]
+
+
+# DEF: Get the batch size respecting the max batch size of the client
+def get_batch_size(*, client, batch_size: int):
+    try:
+        max_batch_size = client.get_max_batch_size()
+    except Exception:
+        return batch_size
+
+    return max(min(batch_size, max_batch_size), 1)
+
+
+# DEF: Get the backend that receives the inserts
+def get_chroma_backend(*, config: Config) -> str:
+    # DESC: No bulk load os inserts vão para o store persistente local
+    if config.chroma_bulk_load:
+        return PERSISTENT_BACKEND
+
+    return config.chroma_backend
+
+
+# DEF: Get the URL of the Chroma server, shared by the client and the heartbeat
+def get_chroma_url(*, config: Config) -> str:
+    return f'http://{config.chroma_host}:{config.chroma_port}'
+
+
+# DEF: Get the auth headers the chromadb client sends with the configured
+# provider: basic (Authorization: Basic) or token (Bearer or X-Chroma-Token)
+def get_chroma_auth_headers(*, config: Config) -> Dict[str, str]:
+    provider = config.chroma_client_auth_provider.lower()
+    credentials = config.chroma_client_auth_credentials
+
+    if not provider or not credentials:
+        return {}
+
+    if 'basic' in provider:
+        token = base64.b64encode(credentials.encode('utf-8')).decode('utf-8')
+        return {'Authorization': f'Basic {token}'}
+
+    header = config.chroma_auth_token_transport_header or 'Authorization'
+
+    if header.lower() == 'authorization':
+        return {'Authorization': f'Bearer {credentials}'}
+
+    return {header: credentials}
+
+
+# DEF: Check the Chroma server without importing chromadb (seconds to import):
+# the same GET /api/v1/heartbeat of client.heartbeat() in chromadb 0.5,
+# with the URL and auth headers of the client
+def get_chroma_heartbeat(*, config: Config, timeout: float = 5) -> bool:
+    request = urllib.request.Request(
+        f'{get_chroma_url(config=config)}/api/v1/heartbeat',
+        headers=get_chroma_auth_headers(config=config),
+    )
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status == 200
+    except (OSError, ValueError):
+        return False
@@ -0,0 +1,119 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from src.templates.dataclass import ArticleInfo, ArticleLink, ArticleState
+
+# DESC: Etapas concluídas de cada artigo, em ordem
+FETCHED = 'fetched'
+INDEXED = 'indexed'
+
+
+# CrawlState
+class CrawlState:
+    """SQLite record of the crawl stages already completed for each article."""
+
+    def __init__(self, *, path: str):
+        self.path = path
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS articles ('
+            'year INTEGER NOT NULL, '
+            'number INTEGER NOT NULL, '
+            'page_link TEXT NOT NULL, '
+            'status TEXT NOT NULL, '
+            'article_info TEXT NOT NULL, '
+            'pdf_sha256 TEXT NOT NULL, '
+            "chunk_ids TEXT NOT NULL DEFAULT '[]', "
+            "model TEXT NOT NULL DEFAULT '', "
+            'updated_at REAL NOT NULL, '
+            'PRIMARY KEY (year, number, page_link))'
+        )
+        self._connection.commit()
+
+    def get(self, *, article: ArticleLink) -> Optional[ArticleState]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT status, article_info, pdf_sha256, chunk_ids, model '
+                'FROM articles WHERE year = ? AND number = ? AND page_link = ?',
+                (article.year, article.number, article.page_link),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, article_info, pdf_sha256, chunk_ids, model = row
+
+        return ArticleState(
+            status=status,
+            article_info=ArticleInfo.model_validate_json(article_info),
+            pdf_sha256=pdf_sha256,
+            chunk_ids=json.loads(chunk_ids),
+            model=model,
+        )
+
+    def mark_fetched(self, *, article: ArticleLink, article_info: ArticleInfo):
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO articles '
+                '(year, number, page_link, status, article_info, pdf_sha256, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (
+                    article.year,
+                    article.number,
+                    article.page_link,
+                    FETCHED,
+                    article_info.model_dump_json(),
+                    article_info.pdf_sha256,
+                    time.time(),
+                ),
+            )
+            self._connection.commit()
+
+    def mark_indexed(
+        self,
+        *,
+        article: ArticleLink,
+        article_info: ArticleInfo,
+        chunk_ids: List[str],
+        model: str,
+    ):
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO articles '
+                '(year, number, page_link, status, article_info, pdf_sha256, '
+                'chunk_ids, model, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    article.year,
+                    article.number,
+                    article.page_link,
+                    INDEXED,
+                    article_info.model_dump_json(),
+                    article_info.pdf_sha256,
+                    json.dumps(chunk_ids),
+                    model,
+                    time.time(),
+                ),
+            )
+            self._connection.commit()
+
+    def delete(self, *, article: ArticleLink):
+        with self._lock:
+            self._connection.execute(
+                'DELETE FROM articles WHERE year = ? AND number = ? AND page_link = ?',
+                (article.year, article.number, article.page_link),
+            )
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import os
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import logfire
+
+from src.logger import Logger
+from src.rate_limiter import HostRateLimiter
+from src.templates.dataclass import Download
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+# DESC: Respostas temporárias do servidor, o download é refeito
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class RetryableDownloadError(Exception):
+    pass
+
+
+# DownloadManager
+class DownloadManager:
+    """Asyncio downloader with a pooled client, per-host limits and retries.
+
+    The event loop runs in its own thread, so download() can be called from
+    the scrapper worker threads, which download concurrently.
+    Partial downloads are resumed with Range requests and previously fetched
+    files are revalidated with If-None-Match/If-Modified-Since.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 30,
+        per_host_limit: int = 2,
+        retries: int = 3,
+        backoff: float = 1.0,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self.retries = retries
+        self.backoff = backoff
+        self.rate_limiter = rate_limiter
+        # DESC: Transporte alternativo do cliente (ex.: servidor local dos benchmarks)
+        self.transport = transport
+
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # DESC: Downloads simultâneos do mesmo arquivo são compartilhados
+        self._downloads: Dict[str, asyncio.Future] = {}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+        self._client = self._run(self._create_client())
+
+    async def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            # DESC: Sem compressão, os offsets do Range são os bytes em disco
+            headers={'Accept-Encoding': 'identity'},
+            limits=httpx.Limits(max_keepalive_connections=self.per_host_limit),
+            transport=self.transport,
+        )
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def download(
+        self, *, url: str, path: str, etag: str = '', last_modified: str = ''
+    ) -> Download:
+        return self._run(
+            self.adownload(url=url, path=path, etag=etag, last_modified=last_modified)
+        )
+
+    async def adownload(
+        self, *, url: str, path: str, etag: str = '', last_modified: str = ''
+    ) -> Download:
+        if path not in self._downloads:
+            self._downloads[path] = asyncio.ensure_future(
+                self._download(
+                    url=url, path=path, etag=etag, last_modified=last_modified
+                )
+            )
+            self._downloads[path].add_done_callback(
+                lambda _: self._downloads.pop(path, None)
+            )
+
+        return await asyncio.shield(self._downloads[path])
+
+    def _get_host_semaphore(self, *, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+
+        return self._host_semaphores[host]
+
+    async def _download(
+        self, *, url: str, path: str, etag: str, last_modified: str
+    ) -> Download:
+        for attempt in range(self.retries + 1):
+            # DESC: Aguarda a vez no rate limiter do host antes de ocupar uma conexão
+            if self.rate_limiter is not None:
+                await self.rate_limiter.get(url=url).aacquire()
+
+            try:
+                async with self._get_host_semaphore(url=url):
+                    return await self._request(
+                        url=url, path=path, etag=etag, last_modified=last_modified
+                    )
+
+            except (httpx.TransportError, RetryableDownloadError) as e:
+                if attempt == self.retries:
+                    raise
+
+                # DESC: Backoff exponencial, o parcial já baixado é mantido
+                delay = self.backoff * 2**attempt
+
+                logger.info(f'Download failed ({e!r}), retrying in {delay:.1f}s: {url}')
+                logfire.info('download retry', url=url, attempt=attempt, error=repr(e))
+
+                await asyncio.sleep(delay)
+
+    async def _request(
+        self, *, url: str, path: str, etag: str, last_modified: str
+    ) -> Download:
+        partial_path = f'{path}.part'
+        partial_validator = _read_validator(path=f'{partial_path}.json')
+        offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+
+        headers = {}
+
+        if offset and partial_validator:
+            # DESC: Continua o download parcial, se o arquivo tiver mudado
+            # no servidor (If-Range) a resposta é o arquivo completo
+            headers['Range'] = f'bytes={offset}-'
+            headers['If-Range'] = partial_validator
+
+        elif os.path.exists(path):
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        async with self._client.stream('GET', url, headers=headers) as response:
+            # DESC: 429/5xx reduzem o ritmo do host, Retry-After pausa o host
+            if self.rate_limiter is not None:
+                self.rate_limiter.get(url=url).update(
+                    status_code=response.status_code,
+                    retry_after=response.headers.get('Retry-After'),
+                )
+
+            if response.status_code == 304:
+                return Download(
+                    url=url,
+                    path=path,
+                    status='not_modified',
+                    size=os.path.getsize(path),
+                    etag=etag,
+                    last_modified=last_modified,
+                )
+
+            if response.status_code == 416:
+                # DESC: Parcial inválido, o próximo attempt recomeça do zero
+                _remove(path=partial_path)
+                raise RetryableDownloadError('Range not satisfiable')
+
+            if response.status_code in RETRY_STATUS_CODES:
+                raise RetryableDownloadError(f'HTTP {response.status_code}')
+
+            response.raise_for_status()
+
+            resumed = response.status_code == 206
+
+            if not resumed:
+                _write_validator(
+                    path=f'{partial_path}.json', validator=_get_validator(response)
+                )
+
+            # DESC: Cada bloco recebido vai direto para o disco, assim uma
+            # conexão interrompida mantém tudo o que já foi baixado
+            with open(partial_path, 'ab' if resumed else 'wb') as file:
+                async for chunk in response.aiter_bytes():
+                    file.write(chunk)
+
+        # DESC: O arquivo final só existe quando o download termina
+        os.replace(partial_path, path)
+        _remove(path=f'{partial_path}.json')
+
+        return Download(
+            url=url,
+            path=path,
+            status='resumed' if resumed else 'downloaded',
+            size=os.path.getsize(path),
+            etag=response.headers.get('ETag', ''),
+            last_modified=response.headers.get('Last-Modified', ''),
+        )
+
+    def close(self):
+        self._run(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+# DEF: Get the validator of the If-Range, weak ETags are not accepted
+def _get_validator(response: httpx.Response) -> str:
+    etag = response.headers.get('ETag', '')
+
+    if etag and not etag.startswith('W/'):
+        return etag
+
+    return response.headers.get('Last-Modified', '')
+
+
+def _read_validator(*, path: str) -> Optional[str]:
+    try:
+        with open(path) as file:
+            return json.load(file)['validator']
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+
+
+def _write_validator(*, path: str, validator: str):
+    with open(path, 'w') as file:
+        json.dump({'validator': validator}, file)
+
+
+def _remove(*, path: str):
+    if os.path.exists(path):
+        os.remove(path)
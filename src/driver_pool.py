@@ -0,0 +1,154 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+import logfire
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import Chrome
+
+from src.logger import Logger
+from src.metrics import get_metrics
+from src.templates.dataclass import DriverPoolMetrics
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+
+# DriverPool
+class DriverPool:
+    """Bounded pool of warm Chrome drivers, recycled after max_pages or on crash."""
+
+    def __init__(
+        self,
+        *,
+        factory: Callable[[], Chrome],
+        size: int = 2,
+        max_pages: int = 50,
+    ):
+        if size < 1:
+            raise ValueError('The driver pool size must be at least 1!')
+
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+
+        self.metrics = DriverPoolMetrics(size=size)
+
+        # DESC: LIFO para reaproveitar sempre o browser mais "quente"
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._pages = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _launch(self) -> Chrome:
+        with get_metrics().span('driver_launch'):
+            driver = self.factory()
+
+        with self._lock:
+            self._pages[id(driver)] = 0
+            self.metrics.launches += 1
+
+        return driver
+
+    def _quit(self, driver: Chrome):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.info(f'Error to quit the driver: {e}')
+
+    def _recycle(self, driver: Chrome):
+        self._quit(driver)
+
+        with self._lock:
+            self.metrics.recycles += 1
+
+    @staticmethod
+    def _is_healthy(driver: Chrome) -> bool:
+        try:
+            return driver.current_url is not None
+        except WebDriverException:
+            return False
+
+    def acquire(self) -> Chrome:
+        if self._closed:
+            raise RuntimeError('The driver pool is closed!')
+
+        start = time.perf_counter()
+        self._slots.acquire()
+        wait_seconds = time.perf_counter() - start
+
+        with self._lock:
+            self.metrics.borrows += 1
+            self.metrics.borrow_wait_seconds += wait_seconds
+            self.metrics.max_borrow_wait_seconds = max(
+                self.metrics.max_borrow_wait_seconds, wait_seconds
+            )
+
+        try:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return self._launch()
+
+            # DESC: Caso o browser tenha "morrido" enquanto estava ocioso
+            if not self._is_healthy(driver):
+                self._recycle(driver)
+                return self._launch()
+
+            return driver
+
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, driver: Chrome, *, failed: bool = False):
+        with self._lock:
+            pages = self._pages.get(id(driver), 0) + 1
+            self._pages[id(driver)] = pages
+
+        try:
+            if self._closed:
+                self._quit(driver)
+            elif failed or pages >= self.max_pages:
+                self._recycle(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def borrow(self):
+        driver = self.acquire()
+        failed = False
+
+        try:
+            yield driver
+        except WebDriverException:
+            failed = True
+            raise
+        finally:
+            self.release(driver, failed=failed)
+
+    def close(self):
+        self._closed = True
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+            self._quit(driver)
+
+        logger.info('-' * 10)
+        logger.info(f'Driver pool metrics: {self.metrics.model_dump()}')
+        logger.info('-' * 10)
+        logfire.info('driver pool metrics', **self.metrics.model_dump())
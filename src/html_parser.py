@@ -0,0 +1,173 @@
+import html
+import re
+from html.parser import HTMLParser
+from typing import List, Optional
+from urllib.parse import urljoin
+
+from selenium.webdriver.common.by import By
+
+# DESC: Tags que não possuem fechamento, serializadas como o Chrome (ex: <br>)
+VOID_TAGS = {
+    'area',
+    'base',
+    'br',
+    'col',
+    'embed',
+    'hr',
+    'img',
+    'input',
+    'link',
+    'meta',
+    'param',
+    'source',
+    'track',
+    'wbr',
+}
+
+# DESC: Atributos que o browser devolve como URL absoluta
+URL_ATTRIBUTES = {'href', 'src'}
+
+WHITESPACE_PATTERN = re.compile(r'[ \t\r\f\v]+')
+
+
+# HtmlElement
+class HtmlElement:
+    """In-memory element exposing the subset of the WebElement API we scrape with."""
+
+    def __init__(self, *, tag: str, attrs: dict, base_url: str = ''):
+        self.tag = tag
+        self.attrs = attrs
+        self.base_url = base_url
+        self.children = []
+
+    def iter(self):
+        for child in self.children:
+            if isinstance(child, HtmlElement):
+                yield child
+                yield from child.iter()
+
+    def _text_parts(self):
+        for child in self.children:
+            if isinstance(child, HtmlElement):
+                if child.tag == 'br':
+                    yield '\n'
+                else:
+                    yield from child._text_parts()
+            else:
+                yield child
+
+    @property
+    def text(self) -> str:
+        lines = ''.join(self._text_parts()).split('\n')
+        return '\n'.join(
+            WHITESPACE_PATTERN.sub(' ', line).strip() for line in lines
+        ).strip()
+
+    @property
+    def inner_html(self) -> str:
+        return ''.join(
+            child.outer_html
+            if isinstance(child, HtmlElement)
+            else html.escape(child, quote=False)
+            for child in self.children
+        )
+
+    @property
+    def outer_html(self) -> str:
+        attrs = ''.join(
+            f' {name}="{html.escape(value or "")}"'
+            for name, value in self.attrs.items()
+        )
+
+        if self.tag in VOID_TAGS:
+            return f'<{self.tag}{attrs}>'
+
+        return f'<{self.tag}{attrs}>{self.inner_html}</{self.tag}>'
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        if name == 'outerHTML':
+            return self.outer_html
+
+        if name == 'innerHTML':
+            return self.inner_html
+
+        value = self.attrs.get(name)
+
+        if value is not None and name in URL_ATTRIBUTES:
+            return urljoin(self.base_url, value)
+
+        return value
+
+    def find_elements(self, by: str, value: str) -> List['HtmlElement']:
+        if by == By.TAG_NAME:
+            return [element for element in self.iter() if element.tag == value]
+
+        if by == By.CLASS_NAME:
+            return [
+                element
+                for element in self.iter()
+                if value in (element.attrs.get('class') or '').split()
+            ]
+
+        raise ValueError(f'Unsupported locator strategy: {by}')
+
+    def find_element(self, by: str, value: str) -> 'HtmlElement':
+        elements = self.find_elements(by, value)
+
+        if not elements:
+            raise LookupError(f'Element not found: {by}={value}')
+
+        return elements[0]
+
+
+# HtmlDocument
+class HtmlDocument(HtmlElement):
+    """Parsed page snapshot, usable where the scrapper reads driver.page_source."""
+
+    def __init__(self, *, page_source: str, base_url: str = ''):
+        super().__init__(tag='#document', attrs={}, base_url=base_url)
+        self.page_source = page_source
+        self.current_url = base_url
+
+
+# _TreeBuilder
+class _TreeBuilder(HTMLParser):
+    def __init__(self, *, document: HtmlDocument):
+        super().__init__(convert_charrefs=True)
+        self.stack = [document]
+
+    def handle_starttag(self, tag, attrs):
+        element = HtmlElement(
+            tag=tag, attrs=dict(attrs), base_url=self.stack[0].base_url
+        )
+        self.stack[-1].children.append(element)
+
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+        if tag not in VOID_TAGS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        # DESC: Fecha a tag mais próxima com o mesmo nome, tolerando
+        # HTML mal formado (tags não fechadas dentro dela)
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                break
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(*, page_source: str, base_url: str = '') -> HtmlDocument:
+    document = HtmlDocument(page_source=page_source, base_url=base_url)
+
+    builder = _TreeBuilder(document=document)
+    builder.feed(page_source)
+    builder.close()
+
+    return document
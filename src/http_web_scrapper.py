@@ -0,0 +1,247 @@
+import threading
+from typing import List, Optional
+
+import logfire
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.common.by import By
+
+from src.article_scrapper import ArticleScrapper
+from src.connections.config import Config
+from src.html_parser import HtmlDocument, parse_html
+from src.logger import Logger
+from src.metrics import get_metrics
+from src.rate_limiter import SLOWDOWN_STATUS_CODES
+from src.templates.dataclass import ArticleInfo, ArticleLink
+from src.utils import (
+    download_article_pdf,
+    get_article_infos_from_document,
+    get_article_name,
+    get_donwload_link_from_document,
+    get_issue_url,
+    get_page_link,
+    journal_issue_verify,
+)
+from src.web_scrapper import WebScrapper
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+SELENIUM_FALLBACK_LOCK = threading.Lock()
+
+# DESC: Respostas de bloqueio do cliente HTTP, que o navegador pode
+# contornar, 429/5xx ficam com o rate limiter e não usam o fallback
+SELENIUM_FALLBACK_STATUS_CODES = {403}
+
+
+# HttpWebScrapper
+class HttpWebScrapper(ArticleScrapper):
+    # DESC: Configurado no primeiro fallback, reaproveitado entre issues
+    selenium_scrapper: Optional[WebScrapper] = None
+
+    def config(self, number: int = 3, year: int = 2024):
+        self.settings = Config()
+        self.number = number
+        self.year = year
+
+        self._config_shared()
+
+        # ---------------HTTP Config---------------
+        # DESC: Uma única sessão com pool de conexões
+        # compartilhada entre os workers dos artigos
+        self.session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(self.settings.scrapper_workers, 1),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # -------------------------------------------
+
+        return {
+            'session': self.session,
+            'url': get_issue_url(number=self.number, year=self.year),
+        }
+
+    def conectar(self, url: str, session: requests.Session) -> HtmlDocument:
+        archived_document = self._load_archived_page(url=url)
+
+        if archived_document is not None:
+            return archived_document
+
+        # ---------------HTTP Access---------------
+        rate_limiter = self.rate_limiter.get(url=url)
+
+        for attempt in range(self.settings.http_retries + 1):
+            rate_limiter.acquire()
+
+            with get_metrics().span('page_load', url=url):
+                response = session.get(url, timeout=self.settings.http_timeout)
+
+            # DESC: 429/5xx reduzem o ritmo do host, Retry-After pausa o host
+            rate_limiter.update(
+                status_code=response.status_code,
+                retry_after=response.headers.get('Retry-After'),
+            )
+
+            # DESC: A nova tentativa aguarda o rate limiter do host
+            if (
+                response.status_code not in SLOWDOWN_STATUS_CODES
+                or attempt == self.settings.http_retries
+            ):
+                break
+
+            logger.info(f'HTTP {response.status_code}, retrying: {url}')
+            logfire.info('page retry', url=url, status_code=response.status_code)
+
+        response.raise_for_status()
+
+        self._archive_page(url=url, page_source=response.text, final_url=response.url)
+
+        return parse_html(page_source=response.text, base_url=response.url)
+
+    def _get_articles(
+        self, *, document: HtmlDocument, number: int, year: int
+    ) -> List[ArticleLink]:
+        # DESC: Verificação se a issue do journal é válida
+        journal_issue_verify(
+            number=number,
+            year=year,
+            driver=document,
+        )
+
+        articles = []
+
+        for element in document.find_elements(By.CLASS_NAME, 'papertitle1'):
+            article_page_refence = (
+                f'https://aece.ro/abstractplus.php?year={year}&number={number}'
+            )
+            page_link = get_page_link(element=element, reference=article_page_refence)
+
+            if page_link is None:
+                continue
+
+            articles.append(
+                ArticleLink(
+                    name=get_article_name(element=element),
+                    page_link=page_link,
+                    year=year,
+                    number=number,
+                )
+            )
+
+        return articles
+
+    def _get_article_info(self, *, article: ArticleLink):
+        # DESC: acessar a página do artigo científico
+        document = self.conectar(url=article.page_link, session=self.session)
+
+        article_link_refence = f'https://aece.ro/displaypdf.php?year={article.year}&number={article.number}'
+        article_links = get_donwload_link_from_document(
+            document=document, reference=article_link_refence
+        )
+
+        if not article_links:
+            # DESC: Skip the article if it does not have a download link
+            logger.info(f'Article without a pdf download link: {article.page_link}')
+            logfire.info(f'Article without a pdf download link: {article.page_link}')
+            return None
+
+        # DESC: Todas as informações do artigo em uma única varredura
+        article_infos = get_article_infos_from_document(document=document)
+
+        stored_pdf = download_article_pdf(
+            link=article_links[0],
+            year=article.year,
+            number=article.number,
+            pdf_store=self.pdf_store,
+        )
+
+        article_info = ArticleInfo(
+            name=article.name,
+            page_link=article.page_link,
+            pdf_download_link=article_links[0],
+            author_keywords=article_infos.author_keywords,
+            publication_date=article_infos.publication_date,
+            doi=article_infos.doi,
+            filename=stored_pdf.path,
+            pdf_sha256=stored_pdf.sha256,
+            about=article_infos.about,
+        )
+
+        return article_info
+
+    def get_issue_articles(self, *, number: int, year: int) -> List[ArticleLink]:
+        document = self.conectar(
+            url=get_issue_url(number=number, year=year), session=self.session
+        )
+
+        return self._get_articles(document=document, number=number, year=year)
+
+    def execute_issue(self, *, number: int, year: int) -> List[int]:
+        try:
+            articles = self.get_issue_articles(number=number, year=year)
+
+        except requests.HTTPError as e:
+            # DESC: 429/5xx após as novas tentativas e demais erros HTTP
+            # interrompem a issue, sem acessar o host pelo Selenium
+            if e.response is None or (
+                e.response.status_code not in SELENIUM_FALLBACK_STATUS_CODES
+            ):
+                raise
+
+            return self._execute_selenium_fallback(number=number, year=year, error=e)
+
+        except (requests.ConnectionError, requests.Timeout) as e:
+            return self._execute_selenium_fallback(number=number, year=year, error=e)
+
+        # DESC: Issue válida sem artigos na listagem, a página
+        # depende de renderização no navegador
+        if not articles:
+            return self._execute_selenium_fallback(
+                number=number, year=year, error='issue without articles'
+            )
+
+        # DESC: Apenas os artigos novos ou alterados são captados,
+        # cada artigo é indexado assim que estiver pronto
+        return self._index_issue(number=number, year=year, articles=articles)
+
+    def _execute_selenium_fallback(self, *, number: int, year: int, error) -> List[int]:
+        # DESC: Fallback para o Selenium quando a listagem da issue
+        # não pôde ser acessada ou precisa ser renderizada
+        logger.info('-' * 10)
+        logger.info(f'HTTP scrapper failed ({error}), falling back to Selenium!')
+        logger.info('-' * 10)
+        logfire.info(
+            'HTTP scrapper failed, falling back to Selenium!', error=str(error)
+        )
+
+        return self._get_selenium_scrapper().execute_issue(number=number, year=year)
+
+    def _get_selenium_scrapper(self) -> WebScrapper:
+        # DESC: Issues executadas em paralelo configuram um único fallback
+        with SELENIUM_FALLBACK_LOCK:
+            if self.selenium_scrapper is None:
+                selenium_scrapper = WebScrapper()
+
+                # DESC: O fallback usa o estado, os downloads e o export deste
+                # crawl, apenas o pool de drivers é próprio do Selenium
+                self._share_resources(scrapper=selenium_scrapper)
+                selenium_scrapper._config_driver_pool()
+
+                self.selenium_scrapper = selenium_scrapper
+
+            return self.selenium_scrapper
+
+    def close(self):
+        self.session.close()
+
+        # DESC: Os recursos compartilhados são fechados uma única vez
+        if self.selenium_scrapper is not None:
+            self.selenium_scrapper._close_driver_pool()
+            self.selenium_scrapper = None
+
+        self._close_shared()
@@ -0,0 +1,129 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import List
+
+from src.templates.dataclass import ArticleLink, IssueDiff
+
+
+# IssueIndex
+class IssueIndex:
+    """SQLite index of the article list of each issue, as seen in the last crawl.
+
+    Each article keeps its listing title and the PDF link of its last capture.
+    The listing only has the title and the article page link, so an article is
+    changed when its title differs from the index or it was never captured,
+    the article pages of unchanged articles are not loaded again. A corrected
+    DOI or a replaced PDF link is only seen on the article page, which is
+    loaded again once its capture is older than max_age seconds (0 disables).
+    """
+
+    def __init__(self, *, path: str, max_age: float = 0, clock=time.time):
+        self.path = path
+        self.max_age = max_age
+        self.clock = clock
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS issue_articles ('
+            'year INTEGER NOT NULL, '
+            'number INTEGER NOT NULL, '
+            'page_link TEXT NOT NULL, '
+            'name TEXT NOT NULL, '
+            "pdf_link TEXT NOT NULL DEFAULT '', "
+            'captured_at REAL NOT NULL DEFAULT 0, '
+            'PRIMARY KEY (year, number, page_link))'
+        )
+        self._connection.commit()
+
+    def diff(self, *, number: int, year: int, articles: List[ArticleLink]) -> IssueDiff:
+        """Compare the listing with the index and store the new listing.
+
+        Articles whose title changed, that were never captured or whose
+        capture expired are changed; removed articles are dropped from the index.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT page_link, name, captured_at FROM issue_articles '
+                'WHERE year = ? AND number = ?',
+                (year, number),
+            ).fetchall()
+
+            indexed = {
+                page_link: (name, captured_at) for page_link, name, captured_at in rows
+            }
+            issue_diff = IssueDiff()
+
+            for article in articles:
+                if article.page_link not in indexed:
+                    issue_diff.added.append(article)
+                    self._connection.execute(
+                        'INSERT OR IGNORE INTO issue_articles '
+                        '(year, number, page_link, name) VALUES (?, ?, ?, ?)',
+                        (year, number, article.page_link, article.name),
+                    )
+                    continue
+
+                name, captured_at = indexed.pop(article.page_link)
+
+                if name != article.name:
+                    # DESC: Título alterado, o artigo é captado novamente
+                    issue_diff.changed.append(article)
+                    self._connection.execute(
+                        'UPDATE issue_articles SET name = ?, captured_at = 0 '
+                        'WHERE year = ? AND number = ? AND page_link = ?',
+                        (article.name, year, number, article.page_link),
+                    )
+                elif not captured_at:
+                    issue_diff.changed.append(article)
+                elif self.max_age and self.clock() - captured_at > self.max_age:
+                    # DESC: Captura expirada, a página do artigo é carregada
+                    # novamente para verificar o DOI e o link do PDF
+                    issue_diff.changed.append(article)
+                else:
+                    issue_diff.unchanged.append(article)
+
+            issue_diff.removed = sorted(indexed)
+
+            self._connection.executemany(
+                'DELETE FROM issue_articles '
+                'WHERE year = ? AND number = ? AND page_link = ?',
+                [(year, number, page_link) for page_link in issue_diff.removed],
+            )
+            self._connection.commit()
+
+        return issue_diff
+
+    def mark_captured(self, *, article: ArticleLink, pdf_link: str):
+        with self._lock:
+            self._connection.execute(
+                'UPDATE issue_articles SET pdf_link = ?, captured_at = ? '
+                'WHERE year = ? AND number = ? AND page_link = ?',
+                (
+                    pdf_link,
+                    self.clock(),
+                    article.year,
+                    article.number,
+                    article.page_link,
+                ),
+            )
+            self._connection.commit()
+
+    def get_pdf_link(self, *, article: ArticleLink) -> str:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT pdf_link FROM issue_articles '
+                'WHERE year = ? AND number = ? AND page_link = ?',
+                (article.year, article.number, article.page_link),
+            ).fetchone()
+
+        return row[0] if row is not None else ''
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -1,4 +1,6 @@
 import logging
+import os
+from functools import lru_cache
 
 from src.templates.singleton import Singleton
 
@@ -11,3 +13,15 @@ class Logger(Singleton):
     def get_logger(self) -> logging.Logger:
         """Returns a logger instance with the name of the current module."""
         return logging.getLogger(__name__)
+
+
+# DEF: Configure Logfire once, by the entrypoints instead of on import
+@lru_cache(maxsize=None)
+def configure_logfire():
+    # DESC: O import do logfire é lento, feito apenas aqui
+    import logfire
+
+    logfire.configure(
+        token=os.environ.get('LOGFIRE_PROJECT_TOKEN', ''),
+        pydantic_plugin=logfire.PydanticPlugin(record='all'),
+    )
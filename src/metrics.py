@@ -0,0 +1,142 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, Tuple
+
+import logfire
+
+from src.templates.dataclass import StageMetrics
+
+# DESC: Prefixo das métricas no formato Prometheus
+PROMETHEUS_PREFIX = 'crawler'
+
+
+# Metrics
+class Metrics:
+    """Thread-safe stage timers and counters of the crawl.
+
+    Each span is also sent to Logfire when it is configured; export() writes
+    a local JSON file (or Prometheus text for a .prom path) without it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, StageMetrics] = {}
+        self._counters: Dict[str, float] = {}
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        start = time.perf_counter()
+
+        try:
+            with logfire.span(name, **attributes):
+                yield
+        finally:
+            self.observe(name=name, seconds=time.perf_counter() - start)
+
+    def observe(self, *, name: str, seconds: float):
+        with self._lock:
+            stage = self._stages.setdefault(name, StageMetrics())
+            stage.count += 1
+            stage.seconds += seconds
+            stage.max_seconds = max(stage.max_seconds, seconds)
+
+    def increment(self, name: str, value: float = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                'stages': {
+                    name: stage.model_dump() for name, stage in self._stages.items()
+                },
+                'counters': dict(self._counters),
+            }
+
+    def merge(self, *, snapshot: Dict[str, dict]):
+        """Add the metrics recorded by another process (e.g. the parse pool)."""
+        with self._lock:
+            for name, values in snapshot['stages'].items():
+                stage = self._stages.setdefault(name, StageMetrics())
+                stage.count += values['count']
+                stage.seconds += values['seconds']
+                stage.max_seconds = max(stage.max_seconds, values['max_seconds'])
+
+            for name, value in snapshot['counters'].items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def get_prometheus_text(self) -> str:
+        snapshot = self.snapshot()
+        lines = []
+
+        if snapshot['stages']:
+            lines.append(f'# TYPE {PROMETHEUS_PREFIX}_stage_seconds summary')
+
+            for name, stage in sorted(snapshot['stages'].items()):
+                lines.append(
+                    f'{PROMETHEUS_PREFIX}_stage_seconds_count{{stage="{name}"}} '
+                    f'{stage["count"]}'
+                )
+                lines.append(
+                    f'{PROMETHEUS_PREFIX}_stage_seconds_sum{{stage="{name}"}} '
+                    f'{stage["seconds"]}'
+                )
+
+            lines.append(f'# TYPE {PROMETHEUS_PREFIX}_stage_seconds_max gauge')
+
+            for name, stage in sorted(snapshot['stages'].items()):
+                lines.append(
+                    f'{PROMETHEUS_PREFIX}_stage_seconds_max{{stage="{name}"}} '
+                    f'{stage["max_seconds"]}'
+                )
+
+        for name, value in sorted(snapshot['counters'].items()):
+            lines.append(f'# TYPE {PROMETHEUS_PREFIX}_{name}_total counter')
+            lines.append(f'{PROMETHEUS_PREFIX}_{name}_total {value}')
+
+        return '\n'.join(lines) + '\n'
+
+    def export(self, *, path: str):
+        if not path:
+            return
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if path.endswith('.prom'):
+            content = self.get_prometheus_text()
+        else:
+            content = json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+        # DESC: Escrita atômica, o arquivo pode ser lido por um coletor
+        partial_path = f'{path}.part'
+
+        with open(partial_path, 'w') as file:
+            file.write(content)
+
+        os.replace(partial_path, path)
+
+
+# DEF: Get the metrics of the process
+@lru_cache(maxsize=None)
+def get_metrics() -> Metrics:
+    return Metrics()
+
+
+# DEF: Run the function in a worker process, returning its metrics
+def run_with_metrics(function: Callable, /, **kwargs) -> Tuple[object, dict]:
+    metrics = get_metrics()
+    metrics.reset()
+
+    result = function(**kwargs)
+
+    return result, metrics.snapshot()
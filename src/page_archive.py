@@ -0,0 +1,80 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+from src.templates.dataclass import PageSnapshot
+
+# DESC: Modos do arquivo das páginas
+OFF = 'off'
+RECORD = 'record'
+REPLAY = 'replay'
+
+PAGE_ARCHIVE_MODES = [OFF, RECORD, REPLAY]
+
+
+def get_page_archive_mode(*, mode: str) -> str:
+    if mode not in PAGE_ARCHIVE_MODES:
+        raise ValueError(
+            f'Invalid page archive mode {mode}, please, inform one of {PAGE_ARCHIVE_MODES}'
+        )
+
+    return mode
+
+
+# PageArchive
+class PageArchive:
+    """Compressed snapshots of the fetched pages, one file per URL.
+
+    Each snapshot keeps the HTML with the final URL and the fetch timestamp,
+    so the extraction can be run again from the archive without the network.
+    """
+
+    def __init__(self, *, root: str, mode: str = RECORD):
+        self.root = root
+        self.mode = get_page_archive_mode(mode=mode)
+
+    @property
+    def replay(self) -> bool:
+        return self.mode == REPLAY
+
+    def get_path(self, *, url: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+        return os.path.join(
+            self.root, urlparse(url).netloc or 'local', key[:2], f'{key}.json.gz'
+        )
+
+    def save(self, *, url: str, page_source: str, final_url: str = '') -> str:
+        path = self.get_path(url=url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        snapshot = PageSnapshot(
+            url=url,
+            final_url=final_url or url,
+            fetched_at=time.time(),
+            page_source=page_source,
+        )
+
+        # DESC: Escrita em um arquivo temporário e movida ao final,
+        # um snapshot nunca é lido pela metade
+        partial_path = f'{path}.{os.getpid()}.{threading.get_ident()}.part'
+
+        with gzip.open(partial_path, 'wt', encoding='utf-8') as file:
+            json.dump(snapshot.model_dump(), file, ensure_ascii=False)
+
+        os.replace(partial_path, path)
+
+        return path
+
+    def load(self, *, url: str) -> PageSnapshot:
+        path = self.get_path(url=url)
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                return PageSnapshot(**json.load(file))
+        except FileNotFoundError:
+            raise FileNotFoundError(f'Page not archived: {url}') from None
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+import logfire
+
+from src.download_manager import DownloadManager
+from src.logger import Logger
+from src.metrics import get_metrics
+from src.templates.dataclass import StoredPdf
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+
+def get_file_sha256(*, path: str, chunk_size: int = 1024 * 1024) -> str:
+    sha256 = hashlib.sha256()
+
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+# PdfStore
+class PdfStore:
+    """Local PDF store keyed by year/number/article, with size and checksum sidecars."""
+
+    def __init__(
+        self, *, root: str, download_manager: DownloadManager, revalidate: bool = False
+    ):
+        self.root = root
+        self.download_manager = download_manager
+        # DESC: Revalida os PDF's já armazenados com requisições condicionais
+        self.revalidate = revalidate
+
+    def get_path(self, *, year: int, number: int, article_number: str) -> str:
+        return os.path.join(
+            self.root, str(year), str(number), f'article_{article_number}.pdf'
+        )
+
+    def get(
+        self, *, year: int, number: int, article_number: str
+    ) -> Optional[StoredPdf]:
+        path = self.get_path(year=year, number=number, article_number=article_number)
+
+        try:
+            with open(f'{path}.json') as file:
+                stored_pdf = StoredPdf(**json.load(file))
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # DESC: O arquivo só é reaproveitado se estiver íntegro
+        if (
+            not os.path.exists(path)
+            or os.path.getsize(path) != stored_pdf.size
+            or get_file_sha256(path=path) != stored_pdf.sha256
+        ):
+            return None
+
+        return stored_pdf
+
+    def fetch(
+        self, *, link: str, year: int, number: int, article_number: str
+    ) -> StoredPdf:
+        stored_pdf = self.get(year=year, number=number, article_number=article_number)
+
+        metrics = get_metrics()
+
+        if stored_pdf is not None and not (
+            self.revalidate and (stored_pdf.etag or stored_pdf.last_modified)
+        ):
+            logger.info(f'PDF already stored: {stored_pdf.path}')
+            metrics.increment('pdfs_stored')
+            return stored_pdf
+
+        path = self.get_path(year=year, number=number, article_number=article_number)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # DESC: O download é feito em um arquivo parcial, movido ao final,
+        # um download interrompido é retomado na próxima tentativa
+        with metrics.span('pdf_download', link=link):
+            download = self.download_manager.download(
+                url=link,
+                path=path,
+                etag=stored_pdf.etag if stored_pdf is not None else '',
+                last_modified=stored_pdf.last_modified
+                if stored_pdf is not None
+                else '',
+            )
+
+        if download.status == 'not_modified':
+            logger.info(f'PDF not modified: {stored_pdf.path}')
+            metrics.increment('pdfs_not_modified')
+            return stored_pdf
+
+        metrics.increment('pdfs_downloaded')
+        metrics.increment('bytes_downloaded', download.size)
+
+        stored_pdf = self.store(
+            path=path,
+            link=link,
+            etag=download.etag,
+            last_modified=download.last_modified,
+        )
+
+        logger.info(f'PDF stored: {stored_pdf.path} ({stored_pdf.size} bytes)')
+        logfire.info(
+            'PDF stored', path=stored_pdf.path, size=stored_pdf.size, link=link
+        )
+
+        return stored_pdf
+
+    def store(
+        self, *, path: str, link: str, etag: str = '', last_modified: str = ''
+    ) -> StoredPdf:
+        stored_pdf = StoredPdf(
+            path=path,
+            link=link,
+            size=os.path.getsize(path),
+            sha256=get_file_sha256(path=path),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+        with open(f'{path}.json', 'w') as file:
+            json.dump(stored_pdf.model_dump(), file)
+
+        return stored_pdf
@@ -0,0 +1,96 @@
+import queue
+import threading
+from typing import Callable, Iterable, List
+
+# DESC: Sinaliza o fim dos itens entre os estágios
+_DONE = object()
+
+
+# Pipeline
+class Pipeline:
+    """Runs each item through the stages in threads linked by bounded queues.
+
+    A stage returning None drops the item; an exception in any stage stops
+    the pipeline and is raised by run() once every thread has finished.
+    """
+
+    def __init__(self, *, stages: List[Callable], queue_size: int = 4):
+        self.stages = stages
+        self.queue_size = queue_size
+
+    def run(self, *, items: Iterable) -> list:
+        queues = [
+            queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)
+        ]
+        errors = []
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for item in items:
+                    if stop.is_set():
+                        break
+
+                    queues[0].put(item)
+
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+
+            finally:
+                queues[0].put(_DONE)
+
+        def work(stage: Callable, inbox: queue.Queue, outbox: queue.Queue):
+            try:
+                while True:
+                    item = inbox.get()
+
+                    if item is _DONE:
+                        break
+
+                    # DESC: Após uma falha os itens restantes são descartados,
+                    # mas a fila continua sendo consumida para não travar
+                    if stop.is_set():
+                        continue
+
+                    try:
+                        result = stage(item)
+                    except BaseException as e:
+                        errors.append(e)
+                        stop.set()
+                        continue
+
+                    if result is not None:
+                        outbox.put(result)
+
+            finally:
+                outbox.put(_DONE)
+
+        threads = [threading.Thread(target=produce, daemon=True)]
+        threads.extend(
+            threading.Thread(
+                target=work, args=(stage, queues[i], queues[i + 1]), daemon=True
+            )
+            for i, stage in enumerate(self.stages)
+        )
+
+        for thread in threads:
+            thread.start()
+
+        results = []
+
+        while True:
+            result = queues[-1].get()
+
+            if result is _DONE:
+                break
+
+            results.append(result)
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        return results
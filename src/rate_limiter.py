@@ -0,0 +1,159 @@
+import asyncio
+import email.utils
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from src.logger import Logger
+
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
+
+# DESC: Respostas que indicam sobrecarga do host
+SLOWDOWN_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+# DEF: Get the seconds of a Retry-After header (seconds or HTTP date)
+def parse_retry_after(*, value: Optional[str], now: Optional[float] = None) -> float:
+    if not value:
+        return 0.0
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+    return max(retry_at - (time.time() if now is None else now), 0.0)
+
+
+# RateLimiter
+class RateLimiter:
+    """Token bucket of a single host with adaptive slowdown (AIMD).
+
+    Tokens may go negative: each caller reserves its slot and sleeps until
+    it, so concurrent workers are scheduled in arrival order. A 429/5xx
+    halves the rate (down to min_rate) and Retry-After pauses the host;
+    every success recovers part of the configured rate.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int = 1,
+        min_rate: Optional[float] = None,
+        clock=time.monotonic,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.min_rate = min(min_rate or rate / 10, rate)
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Reserve a request slot, returning the seconds to wait for it."""
+        if self.max_rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = self.clock()
+
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    async def aacquire(self) -> float:
+        wait = self.reserve()
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def slowdown(self, *, retry_after: float = 0.0):
+        if self.max_rate <= 0:
+            return
+
+        with self._lock:
+            self.rate = max(self.rate / 2, self.min_rate)
+
+            if retry_after:
+                self._paused_until = max(self._paused_until, self.clock() + retry_after)
+
+        logger.info(
+            f'Rate limit: slowing down to {self.rate:.2f} req/s'
+            + (f', paused for {retry_after:.1f}s' if retry_after else '')
+        )
+
+    def speedup(self):
+        with self._lock:
+            self.rate = min(self.rate + self.max_rate / 10, self.max_rate)
+
+    def update(self, *, status_code: int, retry_after: Optional[str] = None):
+        """Adapt the rate to the status code of a response."""
+        if status_code in SLOWDOWN_STATUS_CODES:
+            self.slowdown(retry_after=parse_retry_after(value=retry_after))
+        elif status_code < 400:
+            self.speedup()
+
+
+# HostRateLimiter
+class HostRateLimiter:
+    """One RateLimiter per host, shared by page loads and PDF downloads."""
+
+    def __init__(
+        self, *, rate: float, burst: int = 1, min_rate: Optional[float] = None
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+
+        self._lock = threading.Lock()
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+
+    def get(self, *, url: str) -> RateLimiter:
+        host = urlsplit(url).netloc
+
+        with self._lock:
+            if host not in self._rate_limiters:
+                self._rate_limiters[host] = RateLimiter(
+                    rate=self.rate, burst=self.burst, min_rate=self.min_rate
+                )
+
+            return self._rate_limiters[host]
+
+
+# DEF: Get the rate limiter shared by every scrapper of the process
+@lru_cache(maxsize=None)
+def get_host_rate_limiter(
+    *, rate: float, burst: int, min_rate: Optional[float] = None
+) -> HostRateLimiter:
+    return HostRateLimiter(rate=rate, burst=burst, min_rate=min_rate)
@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from src.templates.dataclass import ArticleInfo, ArticleLink
+from src.templates.web_scrapper_base import WebScrapperBase
+from src.work_queue import WorkQueue
+
+
+# ArticleScrapper
+class ArticleScrapperBase(WebScrapperBase):
+    def get_issue_articles(self, *, number: int, year: int) -> List[ArticleLink]:
+        raise NotImplementedError
+
+    def execute_issue(self, *, number: int, year: int) -> List[int]:
+        raise NotImplementedError
+
+    def enqueue_issue(self, *, number: int, year: int, work_queue: WorkQueue) -> int:
+        raise NotImplementedError
+
+    def execute_worker(self, *, work_queue: WorkQueue, worker: str) -> int:
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    def _get_article_info(self, *, article: ArticleLink) -> Optional[ArticleInfo]:
+        raise NotImplementedError
+
+    def execute(self, *, number: int, year: int):
+        self.config(number=number, year=year)
+
+        try:
+            return self.execute_issue(number=number, year=year)
+        finally:
+            self.close()
@@ -1,6 +1,22 @@
+from typing import Any, Dict, List, Optional
+
 from pydantic import BaseModel
 
 
+class ArticleMetadata(BaseModel):
+    author_keywords: Optional[str] = None
+    publication_date: Optional[str] = None
+    doi: Optional[str] = None
+    about: Dict[str, str] = {}
+
+
+class ArticleLink(BaseModel):
+    name: str
+    page_link: str
+    year: int
+    number: int
+
+
 class ArticleInfo(BaseModel):
     name: str
     page_link: str
@@ -9,3 +25,92 @@ class ArticleInfo(BaseModel):
     publication_date: str
     doi: str
     filename: str
+    pdf_sha256: str = ''
+    about: Dict[str, str] = {}
+
+
+class ArticleState(BaseModel):
+    status: str
+    article_info: ArticleInfo
+    pdf_sha256: str = ''
+    chunk_ids: List[str] = []
+    model: str = ''
+
+
+class ArticleTask(BaseModel):
+    id: int
+    article: ArticleLink
+    worker: str = ''
+    attempts: int = 0
+
+
+class IssueDiff(BaseModel):
+    added: List[ArticleLink] = []
+    changed: List[ArticleLink] = []
+    unchanged: List[ArticleLink] = []
+    removed: List[str] = []
+
+
+class ExportedChunk(BaseModel):
+    id: str
+    text: str
+    metadata: Dict[str, Any] = {}
+    embedding: Optional[List[float]] = None
+    embedding_model: str = ''
+
+
+class ChunkDuplicate(BaseModel):
+    id: str
+    duplicate_of: str
+    similarity: float
+    kind: str
+
+
+class StoredPdf(BaseModel):
+    path: str
+    link: str
+    size: int
+    sha256: str
+    etag: str = ''
+    last_modified: str = ''
+
+
+class PageSnapshot(BaseModel):
+    url: str
+    final_url: str
+    fetched_at: float
+    page_source: str
+
+
+class Download(BaseModel):
+    url: str
+    path: str
+    status: str
+    size: int
+    etag: str = ''
+    last_modified: str = ''
+
+
+class DriverPoolMetrics(BaseModel):
+    size: int
+    launches: int = 0
+    recycles: int = 0
+    borrows: int = 0
+    borrow_wait_seconds: float = 0.0
+    max_borrow_wait_seconds: float = 0.0
+
+
+class StageMetrics(BaseModel):
+    count: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class IssueSummary(BaseModel):
+    year: int
+    number: int
+    status: str
+    articles: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    error: str = ''
@@ -3,7 +3,6 @@ from langchain.docstore.document import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.document_loaders import PyPDFLoader
 from selenium.common.exceptions import (
-    InvalidSelectorException,
     TimeoutException,
     WebDriverException,
 )
@@ -12,7 +11,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from src.html_parser import HtmlDocument, parse_html
 from src.logger import Logger
+from src.metrics import get_metrics
+from src.pdf_store import PdfStore
+from src.templates.dataclass import ArticleInfo, ArticleMetadata, StoredPdf
 
 # --------------------------
 # -----DESC: Logger-----
@@ -20,6 +23,14 @@ logger = Logger().get_logger()
 # --------------------------
 
 
+class IssueNotPublishedError(WebDriverException):
+    pass
+
+
+def get_issue_url(*, number: int, year: int):
+    return f'https://aece.ro/displayissue.php?year={year}&number={number}'
+
+
 def journal_issue_verify(*, number: int, year: int, driver: Chrome):
     page_source = driver.page_source
     issue_text = f'Issue: <b>{number}</b>'
@@ -41,7 +52,11 @@ def journal_issue_verify(*, number: int, year: int, driver: Chrome):
             logfire.exception(
                 'Invalid issue, please inform a valid issue of the journal!'
             )
-            raise WebDriverException
+            # DESC: O journal mostra a issue atual no lugar
+            # das issues que ainda não foram publicadas
+            raise IssueNotPublishedError(
+                f'Issue {number}/{year} not published by the journal'
+            )
 
 
 def get_article_name(*, element):
@@ -68,28 +83,15 @@ def get_page_link(*, element, reference: str):
     return page_link
 
 
-def get_donwload_link(*, driver: Chrome, reference: str, timeout: int = 10):
-    links = []
-    try:
-        elements = WebDriverWait(driver, timeout).until(
-            EC.presence_of_all_elements_located((By.XPATH, '//a[@href]'))
-        )
-
-        for element in elements:
-            if reference in element.get_attribute('href'):
-                links.append(element.get_attribute('href'))
-
-        links = list(set(links))
-
-    except InvalidSelectorException as e:
-        logger.info(f'Erro: Invalid selector: {e}')
-        logfire.exception(f'Erro: Invalid selector: {e}')
-
-    except TimeoutException:
-        logger.info('Erro: Timed out waiting for elements to be present.')
-        logfire.exception('Erro: Timed out waiting for elements to be present.')
+def get_donwload_link_from_document(*, document: HtmlDocument, reference: str):
+    links = [
+        element.get_attribute('href')
+        for element in document.find_elements(By.TAG_NAME, 'a')
+        if element.get_attribute('href') is not None
+        and reference in element.get_attribute('href')
+    ]
 
-    return links
+    return list(set(links))
 
 
 def _get_author_keywords(tags):
@@ -112,61 +114,77 @@ def _get_doi(tags):
     return preprocess_doi.split(':')[-1].replace(' ', '').replace('\n', '')
 
 
-def get_infos(*, driver: Chrome, topic: str = 'Author keywords', timeout: int = 10):
-    valid_topics = [
-        'Author keywords',
-        'Date of Publication',
-        'Digital Object Identifier',
-    ]
-
-    if topic not in valid_topics:
-        logger.info('-' * 10)
-        logger.info(
-            f'Invalid reference, please, inform a valid reference (such, as {valid_topics})'
-        )
-        logger.info('-' * 10)
-        logfire.exception(
-            f'Invalid reference, please, inform a valid reference (such, as {valid_topics})'
-        )
-        raise WebDriverException
-
-    reference = (
-        'About this article' if topic != 'Author keywords' else 'Author keywords'
-    )
+def _get_about_this_article(tags):
+    # DESC: Todos os campos 'chave: valor' do 'font' que
+    # contém a frase: 'About this article'
+    about = {}
 
-    try:
-        elements = WebDriverWait(driver, timeout).until(
-            EC.presence_of_all_elements_located((By.TAG_NAME, 'font'))
-        )
+    for line in tags[1].text.split('\n'):
+        key, separator, value = line.partition(':')
 
-        for element in elements:
-            outer_html = element.get_attribute('outerHTML')
+        if separator:
+            about[key.strip()] = value.strip()
 
-            if reference in outer_html:
-                tags = element.find_elements(By.TAG_NAME, 'font')
+    return about
 
-                if topic == 'Author keywords':
-                    return _get_author_keywords(tags)
-                elif topic == 'Date of Publication':
-                    return _get_date_of_publication(tags)
-                else:
-                    return _get_doi(tags)
 
-    except InvalidSelectorException as e:
-        logger.info(f'Erro: Invalid selector: {e}')
-        logfire.exception(f'Erro: Invalid selector: {e}')
+def get_page_document(*, driver: Chrome, timeout: int = 10) -> HtmlDocument:
+    # DESC: Aguarda a renderização dos 'font' e obtém o HTML da página
+    # uma única vez, as extrações são feitas em memória
+    try:
+        with get_metrics().span('page_wait'):
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_all_elements_located((By.TAG_NAME, 'font'))
+            )
 
     except TimeoutException:
         logger.info('Erro: Timed out waiting for elements to be present.')
         logfire.exception('Erro: Timed out waiting for elements to be present.')
 
-    return None
+    return parse_html(page_source=driver.page_source, base_url=driver.current_url)
+
+
+def get_article_infos_from_document(*, document: HtmlDocument) -> ArticleMetadata:
+    keywords_tags = None
+    about_tags = None
+
+    # DESC: Uma única varredura dos 'font' para todos os campos
+    for element in document.find_elements(By.TAG_NAME, 'font'):
+        outer_html = element.get_attribute('outerHTML')
+
+        if keywords_tags is None and 'Author keywords' in outer_html:
+            keywords_tags = element.find_elements(By.TAG_NAME, 'font')
+
+        if about_tags is None and 'About this article' in outer_html:
+            about_tags = element.find_elements(By.TAG_NAME, 'font')
+
+        if keywords_tags is not None and about_tags is not None:
+            break
+
+    return ArticleMetadata(
+        author_keywords=_get_author_keywords(keywords_tags) if keywords_tags else None,
+        publication_date=_get_date_of_publication(about_tags) if about_tags else None,
+        doi=_get_doi(about_tags) if about_tags else None,
+        about=_get_about_this_article(about_tags) if about_tags else {},
+    )
 
 
 def get_article_number(*, link: str):
     return link.split('&')[-1].split('=')[-1]
 
 
+def download_article_pdf(
+    *, link: str, year: int, number: int, pdf_store: PdfStore
+) -> StoredPdf:
+    # DESC: O PDF só é baixado caso ainda não esteja no store local
+    return pdf_store.fetch(
+        link=link,
+        year=year,
+        number=number,
+        article_number=get_article_number(link=link),
+    )
+
+
 def _split_text(*, documents: list[Document]):
     # Initialize text splitter with specified parameters
     text_splitter = RecursiveCharacterTextSplitter(
@@ -180,7 +198,12 @@ def _split_text(*, documents: list[Document]):
     return text_splitter.split_documents(documents)
 
 
-def get_article_document(*, article_info: Document):
+def get_article_document(*, article_info: ArticleInfo):
+    metrics = get_metrics()
+
+    with metrics.span('pdf_parse', filename=article_info.filename):
+        pages = PyPDFLoader(article_info.filename).load()
+
     document_list = [
         Document(
             page_content=document.page_content,
@@ -189,11 +212,19 @@ def get_article_document(*, article_info: Document):
                 'name': str(article_info.name),
                 'publication_date': str(article_info.publication_date),
                 'keywords': str(article_info.author_keywords),
-                'source': str(document.metadata['source']),
+                # DESC: A origem continua sendo o link do PDF,
+                # mesmo com a leitura feita a partir do arquivo local
+                'source': str(article_info.pdf_download_link),
                 'page': str(document.metadata['page']),
             },
         )
-        for document in PyPDFLoader(article_info.pdf_download_link).load()
+        for document in pages
     ]
 
-    return _split_text(documents=document_list)
+    with metrics.span('pdf_split', filename=article_info.filename):
+        document_chunks = _split_text(documents=document_list)
+
+    metrics.increment('pages_parsed', len(pages))
+    metrics.increment('chunks_created', len(document_chunks))
+
+    return document_chunks
@@ -1,9 +1,7 @@
-import os
+from functools import partial
 from typing import List
 
 import logfire
-import wget
-from langchain.schema import Document
 from selenium.common.exceptions import (
     WebDriverException,
 )
@@ -13,32 +11,34 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from src.connections.chromadb_handler import ChromaDBHandler
+from src.article_scrapper import ArticleScrapper
 from src.connections.config import Config
-from src.templates.dataclass import ArticleInfo
-from src.templates.web_scrapper_base import WebScrapperBase
+from src.driver_pool import DriverPool
+from src.html_parser import HtmlDocument
+from src.logger import Logger
+from src.metrics import get_metrics
+from src.templates.dataclass import ArticleInfo, ArticleLink
 from src.utils import (
-    get_article_document,
+    download_article_pdf,
+    get_article_infos_from_document,
     get_article_name,
-    get_article_number,
-    get_donwload_link,
-    get_infos,
+    get_donwload_link_from_document,
+    get_issue_url,
+    get_page_document,
     get_page_link,
     journal_issue_verify,
 )
 
-# -----DESC: Logfire Config-----
-logfire.configure(
-    token=os.environ.get('LOGFIRE_PROJECT_TOKEN', ''),
-    pydantic_plugin=logfire.PydanticPlugin(record='all'),
-)
-# ------------------------------
+# --------------------------
+# -----DESC: Logger-----
+logger = Logger().get_logger()
+# --------------------------
 
 
 # WebScrapper
-class WebScrapper(WebScrapperBase):
+class WebScrapper(ArticleScrapper):
     def config(self, number: int = 3, year: int = 2024):
-        self.config = Config()
+        self.settings = Config()
         self.number = number
         self.year = year
 
@@ -48,6 +48,14 @@ class WebScrapper(WebScrapperBase):
         # - link: https://aece.ro/index.php
         # --------------------
 
+        self._config_shared()
+        self._config_driver_pool()
+
+        return {
+            'url': get_issue_url(number=self.number, year=self.year),
+        }
+
+    def _config_driver_pool(self):
         # ---------------Chrome Config---------------
         self.chrome_options = Options()
 
@@ -57,22 +65,35 @@ class WebScrapper(WebScrapperBase):
         self.chrome_options.add_argument('--no-sandbox')
         # -------------------------------------------
 
-        return {
-            'driver': Chrome(options=self.chrome_options),
-            'url': f'https://aece.ro/displayissue.php?year={self.year}&number={self.number}',
-        }
+        # ---------------Driver Pool---------------
+        # DESC: Os drivers são emprestados para a página da issue
+        # e para os workers dos artigos (inclusive entre issues)
+        self.driver_pool = DriverPool(
+            factory=partial(Chrome, options=self.chrome_options),
+            size=max(self.settings.driver_pool_size, self.settings.scrapper_workers),
+            max_pages=self.settings.driver_max_pages,
+        )
+        # -------------------------------------------
+
+    def _close_driver_pool(self):
+        self.driver_pool.close()
 
     def conectar(self, url: str, driver: Chrome):
         # ---------------Chrome Access---------------
-        driver.get(url)
+        self.rate_limiter.get(url=url).acquire()
+
+        with get_metrics().span('page_load', url=url):
+            driver.get(url)
 
         return driver
 
-    def captar(self, driver: Chrome) -> List[Document]:
+    def _get_articles(
+        self, *, driver: Chrome, number: int, year: int
+    ) -> List[ArticleLink]:
         # DESC: Verificação se a issue do journal é válida
         journal_issue_verify(
-            number=self.number,
-            year=self.year,
+            number=number,
+            year=year,
             driver=driver,
         )
 
@@ -80,125 +101,152 @@ class WebScrapper(WebScrapperBase):
             EC.presence_of_all_elements_located((By.CLASS_NAME, 'papertitle1'))
         )
 
-        documents_list = []
+        # DESC: Os WebElements da issue pertencem ao driver principal,
+        # logo os nomes e links são extraídos antes de distribuir os artigos
+        articles = []
 
-        for i in range(len(elements)):
+        for element in elements:
             # -------------------------
             # DESC: Obtenção do nome do artigo
-            article_name = get_article_name(element=elements[i])
+            article_name = get_article_name(element=element)
             # -------------------------
 
             # -------------------------
             # DESC: Obtenção do link da página do artigo
-            article_page_refence = f'https://aece.ro/abstractplus.php?year={self.year}&number={self.number}'
-            page_link = get_page_link(
-                element=elements[i], reference=article_page_refence
+            article_page_refence = (
+                f'https://aece.ro/abstractplus.php?year={year}&number={number}'
             )
+            page_link = get_page_link(element=element, reference=article_page_refence)
             # -------------------------
 
-            # -------------------------
-            # DESC: Criar um novo driver
-            new_driver = Chrome(options=self.chrome_options)
-            # -------------------------
+            if page_link is None:
+                continue
 
-            # -------------------------
-            # DESC: acessar a página do artigo científico
-            new_driver = self.conectar(url=page_link, driver=new_driver)
-            # -------------------------
+            articles.append(
+                ArticleLink(
+                    name=article_name, page_link=page_link, year=year, number=number
+                )
+            )
 
-            # -------------------------
-            # DESC: Obtenção de author keywords
-            author_keywords = get_infos(driver=new_driver, topic='Author keywords')
-            # -------------------------
+        return articles
 
-            # -------------------------
-            # DESC: Obtenção da data de publicação
-            date_of_publication = get_infos(
-                driver=new_driver, topic='Date of Publication'
-            )
-            # -------------------------
+    def _get_page_document(self, *, url: str) -> HtmlDocument:
+        archived_document = self._load_archived_page(url=url)
+
+        if archived_document is not None:
+            return archived_document
 
+        # DESC: Emprestar um driver do pool
+        with self.driver_pool.borrow() as new_driver:
             # -------------------------
-            # DESC: Obtenção da data de publicação
-            doi = get_infos(driver=new_driver, topic='Digital Object Identifier')
+            # DESC: acessar a página do artigo científico
+            new_driver = self.conectar(url=url, driver=new_driver)
             # -------------------------
 
             # -------------------------
-            # DESC: Obtenção dos links dos PDF's dos artigos científcos
-            article_link_refence = (
-                f'https://aece.ro/displaypdf.php?year={self.year}&number={self.number}'
-            )
-            article_links = get_donwload_link(
-                driver=new_driver, reference=article_link_refence
-            )
+            # DESC: Snapshot do HTML da página, o driver
+            # não é mais necessário para as extrações
+            page_document = get_page_document(driver=new_driver)
             # -------------------------
 
-            # -------------------------
-            # DESC: Download dos artigos científcos
-            try:
-                article_download_link = article_links[0]
-                article_number = get_article_number(link=article_download_link)
+        self._archive_page(
+            url=url,
+            page_source=page_document.page_source,
+            final_url=page_document.current_url,
+        )
 
-                file_path = f'/tmp/year_{self.year}_number_{self.number}_article_{article_number}.pdf'
+        return page_document
 
-                filename = wget.download(article_download_link, file_path)
+    def _get_article_info(self, *, article: ArticleLink):
+        page_document = self._get_page_document(url=article.page_link)
 
-            except IndexError:
-                # DESC: Close connection if article does not have a download link
-                new_driver.close()
-                break
-            # -------------------------
+        # -------------------------
+        # DESC: Obtenção de author keywords, data de publicação,
+        # DOI e demais informações em uma única varredura
+        article_infos = get_article_infos_from_document(document=page_document)
+        # -------------------------
 
-            # -------------------------
-            # DESC: Create ArticleInfo object
-            article_info = ArticleInfo(
-                name=article_name,
-                page_link=page_link,
-                pdf_download_link=article_download_link,
-                author_keywords=author_keywords,
-                publication_date=date_of_publication,
-                doi=doi,
-                filename=filename,
+        # -------------------------
+        # DESC: Obtenção dos links dos PDF's dos artigos científcos
+        article_link_refence = f'https://aece.ro/displaypdf.php?year={article.year}&number={article.number}'
+        article_links = get_donwload_link_from_document(
+            document=page_document, reference=article_link_refence
+        )
+        # -------------------------
+
+        # -------------------------
+        # DESC: Download dos artigos científcos
+        try:
+            article_download_link = article_links[0]
+
+            stored_pdf = download_article_pdf(
+                link=article_download_link,
+                year=article.year,
+                number=article.number,
+                pdf_store=self.pdf_store,
             )
-            # -------------------------
 
-            # -------------------------
-            # DESC: Langchain Document a partir dos dados crawleados
-            article_document = get_article_document(article_info=article_info)
+        except IndexError:
+            # DESC: Skip the article if it does not have a download link
+            logger.info(f'Article without a pdf download link: {article.page_link}')
+            logfire.info(f'Article without a pdf download link: {article.page_link}')
+            return None
+        # -------------------------
+
+        # -------------------------
+        # DESC: Create ArticleInfo object
+        article_info = ArticleInfo(
+            name=article.name,
+            page_link=article.page_link,
+            pdf_download_link=article_download_link,
+            author_keywords=article_infos.author_keywords,
+            publication_date=article_infos.publication_date,
+            doi=article_infos.doi,
+            filename=stored_pdf.path,
+            pdf_sha256=stored_pdf.sha256,
+            about=article_infos.about,
+        )
+        # -------------------------
 
-            # -------------------------
+        return article_info
 
-            documents_list.append(article_document)
+    def get_issue_articles(self, *, number: int, year: int) -> List[ArticleLink]:
+        url = get_issue_url(number=number, year=year)
 
-            # -------------------------
-            # DESC: Fechar driver
-            new_driver.close()
-            # -------------------------
+        # DESC: No replay a página da issue vem do arquivo, sem o Chrome
+        archived_document = self._load_archived_page(url=url)
 
-        return documents_list
+        if archived_document is not None:
+            return self._get_articles(
+                driver=archived_document, number=number, year=year
+            )
 
-    def persistir(self, *, document_chunks, embedding_model_name: str):
-        chroma_db_handler = ChromaDBHandler()
+        # DESC: O driver da página da issue volta para o pool
+        # assim que os links dos artigos são extraídos
+        with self.driver_pool.borrow() as driver:
+            driver = self.conectar(url=url, driver=driver)
 
-        client = chroma_db_handler.connect(config=self.config)
+            articles = self._get_articles(driver=driver, number=number, year=year)
 
-        chroma_db_handler.insert(
-            config=self.config,
-            client=client,
-            document_chunks=document_chunks,
-            embedding_model_name=embedding_model_name,
-        )
+            # DESC: HTML já renderizado, após a espera dos artigos
+            self._archive_page(
+                url=url, page_source=driver.page_source, final_url=driver.current_url
+            )
 
-    def execute(self, *, number: int, year: int):
-        config_dict = self.config(number=number, year=year)
+            return articles
 
-        driver = self.conectar(url=config_dict['url'], driver=config_dict['driver'])
+    def execute_issue(self, *, number: int, year: int) -> List[int]:
+        articles = self.get_issue_articles(number=number, year=year)
 
-        document_chunks = self.captar(driver=driver)
+        # DESC: Apenas os artigos novos ou alterados são captados,
+        # cada artigo é indexado assim que estiver pronto
+        indexed_articles = self._index_issue(
+            number=number, year=year, articles=articles
+        )
 
         # DESC: Raise an exception if scientific journal
         # does not have a download link
-        if not document_chunks:
+        if not indexed_articles:
             logfire.exception(
                 'Journal without a pdf download link, please, inform an issue and year that has pdf download link!'
             )
@@ -206,9 +254,8 @@ class WebScrapper(WebScrapperBase):
                 'Journal without a pdf download link, please, inform an issue and year that has pdf download link!'
             )
 
-        self.persistir(
-            document_chunks=document_chunks,
-            embedding_model_name=self.config.embedding_model_name,
-        )
+        return indexed_articles
 
-        driver.close()
+    def close(self):
+        self._close_driver_pool()
+        self._close_shared()
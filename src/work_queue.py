@@ -0,0 +1,239 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+from src.templates.dataclass import ArticleLink, ArticleTask
+
+# DESC: Estados das tarefas da fila
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+
+# WorkQueue
+class WorkQueue:
+    """SQLite queue of article tasks shared by the crawler workers.
+
+    A worker leases tasks for lease_seconds and heartbeats while it works on
+    them; leases that expire (crashed worker) go back to the queue. A task
+    is completed only by the worker that still holds its lease.
+
+    The queue, like the crawl state, issue index and PDF store it works with,
+    is a local file: the workers must run on a single host sharing its volume.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        lease_seconds: float = 300,
+        max_attempts: int = 3,
+        clock=time.time,
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.clock = clock
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        # DESC: Sem transação implícita, o lease usa BEGIN IMMEDIATE,
+        # que bloqueia a escrita dos demais processos até o commit
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        # DESC: Journal padrão (sem WAL), apenas com locks de arquivo
+        self._connection.execute('PRAGMA journal_mode=DELETE')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS tasks ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'year INTEGER NOT NULL, '
+            'number INTEGER NOT NULL, '
+            'page_link TEXT NOT NULL, '
+            'article TEXT NOT NULL, '
+            'status TEXT NOT NULL, '
+            "worker TEXT NOT NULL DEFAULT '', "
+            'lease_until REAL NOT NULL DEFAULT 0, '
+            'attempts INTEGER NOT NULL DEFAULT 0, '
+            "error TEXT NOT NULL DEFAULT '', "
+            'UNIQUE (year, number, page_link))'
+        )
+
+    def put_many(self, *, articles: List[ArticleLink]) -> int:
+        """Add the articles not queued yet, returning how many were added."""
+        with self._lock:
+            cursor = self._connection.executemany(
+                'INSERT OR IGNORE INTO tasks '
+                '(year, number, page_link, article, status) VALUES (?, ?, ?, ?, ?)',
+                [
+                    (
+                        article.year,
+                        article.number,
+                        article.page_link,
+                        article.model_dump_json(),
+                        PENDING,
+                    )
+                    for article in articles
+                ],
+            )
+
+            return cursor.rowcount
+
+    def requeue(self, *, articles: List[ArticleLink]) -> int:
+        """Queue the articles again, including the done or failed ones."""
+        added = self.put_many(articles=articles)
+
+        with self._lock:
+            cursor = self._connection.executemany(
+                'UPDATE tasks SET status = ?, article = ?, attempts = 0, '
+                "lease_until = 0, error = '' "
+                'WHERE year = ? AND number = ? AND page_link = ? AND status IN (?, ?)',
+                [
+                    (
+                        PENDING,
+                        article.model_dump_json(),
+                        article.year,
+                        article.number,
+                        article.page_link,
+                        DONE,
+                        FAILED,
+                    )
+                    for article in articles
+                ],
+            )
+
+            return added + cursor.rowcount
+
+    def lease(self, *, worker: str, limit: int = 1) -> List[ArticleTask]:
+        with self._lock:
+            now = self.clock()
+
+            self._connection.execute('BEGIN IMMEDIATE')
+
+            try:
+                # DESC: Leases expirados sem tentativas restantes (o worker
+                # caiu em todas elas) não voltam para a fila
+                self._connection.execute(
+                    'UPDATE tasks SET status = ?, lease_until = 0, error = ? '
+                    'WHERE status = ? AND lease_until < ? AND attempts >= ?',
+                    (FAILED, 'Lease expired', LEASED, now, self.max_attempts),
+                )
+
+                # DESC: Tarefas pendentes ou com o lease expirado
+                rows = self._connection.execute(
+                    'SELECT id, article, attempts FROM tasks '
+                    'WHERE status = ? OR (status = ? AND lease_until < ?) '
+                    'ORDER BY id LIMIT ?',
+                    (PENDING, LEASED, now, limit),
+                ).fetchall()
+
+                self._connection.executemany(
+                    'UPDATE tasks SET status = ?, worker = ?, lease_until = ?, '
+                    'attempts = attempts + 1 WHERE id = ?',
+                    [
+                        (LEASED, worker, now + self.lease_seconds, id)
+                        for id, _, _ in rows
+                    ],
+                )
+                self._connection.execute('COMMIT')
+
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+        return [
+            ArticleTask(
+                id=id,
+                article=ArticleLink.model_validate_json(article),
+                worker=worker,
+                attempts=attempts + 1,
+            )
+            for id, article, attempts in rows
+        ]
+
+    def heartbeat(self, *, worker: str, task_ids: List[int]) -> int:
+        """Extend the leases still held by the worker."""
+        with self._lock:
+            cursor = self._connection.executemany(
+                'UPDATE tasks SET lease_until = ? '
+                'WHERE id = ? AND status = ? AND worker = ?',
+                [
+                    (self.clock() + self.lease_seconds, task_id, LEASED, worker)
+                    for task_id in task_ids
+                ],
+            )
+
+            return cursor.rowcount
+
+    def complete(self, *, worker: str, task_id: int) -> bool:
+        with self._lock:
+            cursor = self._connection.execute(
+                'UPDATE tasks SET status = ?, lease_until = 0 '
+                'WHERE id = ? AND status = ? AND worker = ?',
+                (DONE, task_id, LEASED, worker),
+            )
+
+            return cursor.rowcount == 1
+
+    def fail(self, *, worker: str, task_id: int, error: str) -> bool:
+        # DESC: A tarefa volta para a fila até atingir o máximo de tentativas
+        with self._lock:
+            cursor = self._connection.execute(
+                'UPDATE tasks SET '
+                'status = CASE WHEN attempts >= ? THEN ? ELSE ? END, '
+                'lease_until = 0, error = ? '
+                'WHERE id = ? AND status = ? AND worker = ?',
+                (self.max_attempts, FAILED, PENDING, error, task_id, LEASED, worker),
+            )
+
+            return cursor.rowcount == 1
+
+    def get_counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT status, COUNT(*) FROM tasks GROUP BY status'
+            ).fetchall()
+
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+# LeaseHeartbeat
+class LeaseHeartbeat:
+    """Heartbeats the leased tasks in a background thread while in the context."""
+
+    def __init__(
+        self,
+        *,
+        work_queue: WorkQueue,
+        worker: str,
+        task_ids: List[int],
+        interval: float,
+    ):
+        self.work_queue = work_queue
+        self.worker = worker
+        self.task_ids = task_ids
+        self.interval = interval
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.work_queue.heartbeat(worker=self.worker, task_ids=self.task_ids)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
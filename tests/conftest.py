@@ -0,0 +1,196 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.templates.dataclass import ArticleLink
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+LAST_MODIFIED = 'Wed, 31 Aug 2022 00:00:00 GMT'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves the fixture files with ETag, conditional and Range support."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+
+        with server.lock:
+            server.requests.append((self.path, dict(self.headers)))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+
+        try:
+            self._respond()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _respond(self):
+        server = self.server
+        content = server.files.get(self.path.split('?')[0])
+
+        time.sleep(server.delay)
+
+        if content is None:
+            self.send_error(404)
+            return
+
+        # DESC: Falhas temporárias configuradas por caminho
+        with server.lock:
+            failures = server.failures.get(self.path, [])
+            status = failures.pop(0) if failures else None
+
+        if status is not None:
+            self.send_response(status)
+            self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get('Range')
+
+        if range_header and self.headers.get('If-Range', etag) == etag:
+            start = int(range_header.split('=')[1].split('-')[0])
+
+        body = content[start:]
+
+        self.send_response(206 if start else 200)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Type', server.content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if start:
+            self.send_header(
+                'Content-Range', f'bytes {start}-{len(content) - 1}/{len(content)}'
+            )
+        self.end_headers()
+
+        # DESC: Conexão interrompida no meio do corpo
+        with server.lock:
+            truncate = server.truncate.pop(self.path, None)
+
+        if truncate is not None:
+            self.wfile.write(body[:truncate])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.files = {}
+    server.failures = {}
+    server.truncate = {}
+    server.requests = []
+    server.active = 0
+    server.max_active = 0
+    server.delay = 0
+    server.content_type = 'application/pdf'
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sample_pdf():
+    return (FIXTURES / 'pdfs' / 'sample.pdf').read_bytes()
+
+
+@pytest.fixture
+def get_article():
+    def get_article(index, *, name=None, year=2022, number=3):
+        return ArticleLink(
+            name=name or f'Article {index}',
+            page_link=f'link {index}',
+            year=year,
+            number=number,
+        )
+
+    return get_article
+
+
+# ScrapperFactory
+class ScrapperFactory:
+    """Configures scrappers from the env vars and closes every one of them."""
+
+    def __init__(self, *, monkeypatch):
+        self.monkeypatch = monkeypatch
+        self.scrappers = []
+
+    def __call__(self, scrapper_class, *, number=3, year=2022, **env):
+        # DESC: Config é lido das env vars a cada config()
+        for name, value in env.items():
+            self.monkeypatch.setenv(name, str(value))
+
+        scrapper = scrapper_class()
+        scrapper.config(number=number, year=year)
+        self.scrappers.append(scrapper)
+
+        return scrapper
+
+    def close(self, scrapper):
+        self.scrappers.remove(scrapper)
+        scrapper.close()
+
+    def close_all(self):
+        while self.scrappers:
+            self.close(self.scrappers[-1])
+
+
+@pytest.fixture
+def scrapper_env(monkeypatch, tmp_path):
+    # DESC: Todos os arquivos do crawl no diretório do teste, sem rate limit
+    for name, path in {
+        'CRAWL_STATE_PATH': 'crawl_state.sqlite3',
+        'PDF_STORE_PATH': 'pdfs',
+        'METRICS_PATH': 'metrics.json',
+        'PAGE_ARCHIVE_PATH': 'pages',
+        'ISSUE_INDEX_PATH': 'issue_index.sqlite3',
+        'CHUNK_EXPORT_PATH': 'chunks',
+        'CHUNK_DEDUP_PATH': 'chunk_dedup.sqlite3',
+        'CHUNK_DEDUP_REPORT_PATH': 'chunk_dedup.jsonl',
+        'EMBEDDING_CACHE_PATH': 'embeddings.sqlite3',
+        'WORK_QUEUE_PATH': 'work_queue.sqlite3',
+        'CHROMA_PERSIST_PATH': 'chroma',
+    }.items():
+        monkeypatch.setenv(name, str(tmp_path / path))
+
+    monkeypatch.setenv('RATE_LIMIT_RPS', '0')
+    monkeypatch.setenv('EMBEDDING_MODEL_NAME', 'model')
+
+
+@pytest.fixture
+def get_scrapper(monkeypatch, scrapper_env):
+    scrapper_factory = ScrapperFactory(monkeypatch=monkeypatch)
+
+    yield scrapper_factory
+
+    scrapper_factory.close_all()
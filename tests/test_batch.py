@@ -0,0 +1,58 @@
+from src.batch import execute_batch, get_issues, parse_range
+from src.utils import IssueNotPublishedError
+
+
+def test_parse_range():
+    assert parse_range(value='2020-2022, 2024') == [2020, 2021, 2022, 2024]
+    assert parse_range(value='3') == [3]
+    assert parse_range(value='') == []
+
+
+def test_get_issues():
+    assert get_issues(years='2021-2022', numbers='1-2') == [
+        (1, 2021),
+        (2, 2021),
+        (1, 2022),
+        (2, 2022),
+    ]
+    assert len(get_issues(since_year=2020, current_year=2024)) == 20
+
+
+class FakeScrapper:
+    def __init__(self):
+        self.configured = 0
+        self.closed = 0
+
+    def config(self):
+        self.configured += 1
+
+    def close(self):
+        self.closed += 1
+
+    def execute_issue(self, *, number, year):
+        if number == 2:
+            raise ValueError('invalid issue')
+        if number == 4:
+            raise IssueNotPublishedError('not published')
+        return [10, 20, 30]
+
+
+def test_execute_batch_shares_resources_and_isolates_failures():
+    web_scrapper = FakeScrapper()
+
+    summaries = execute_batch(
+        web_scrapper=web_scrapper,
+        issues=get_issues(years='2022', numbers='1-4'),
+        workers=2,
+    )
+
+    assert web_scrapper.configured == web_scrapper.closed == 1
+    assert [(summary.number, summary.status) for summary in summaries] == [
+        (1, 'success'),
+        (2, 'failed'),
+        (3, 'success'),
+        (4, 'skipped'),
+    ]
+    assert summaries[0].articles == 3
+    assert summaries[0].chunks == 60
+    assert summaries[1].error == 'invalid issue'
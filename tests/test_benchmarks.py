@@ -0,0 +1,49 @@
+from benchmarks import chunk_ids, crawl, preprocessing
+
+
+def test_chunk_ids_benchmark():
+    results = chunk_ids.run(total=1_000, repeat=1)
+
+    assert set(results) == {'chromadbx', 'hashlib', 'speedup'}
+
+
+def test_preprocessing_benchmark():
+    results = preprocessing.run(total=1_000, repeat=1)
+
+    assert set(results) == {'current', 'batch', 'batch_normalized', 'speedup'}
+
+
+def test_hash_embedding_function_is_deterministic():
+    embedding_function = crawl.HashEmbeddingFunction(dimensions=8)
+
+    first, second, other = embedding_function(['chunk', 'chunk', 'other chunk'])
+
+    assert len(first) == 8
+    assert first == second != other
+    assert all(-1 <= value <= 1 for value in first)
+
+
+def test_crawl_benchmark():
+    # DESC: Um artigo por PDF do corpus (10, 2, 1 e 4 páginas)
+    results = crawl.run(total=4, workers=2)
+
+    assert results['articles'] == 4
+    assert results['pages'] == 17
+    assert results['chunks'] == results['chunks_created'] == 180
+    assert results['peak_memory_mb'] > 0
+    assert {
+        'article_scrape',
+        'pdf_download',
+        'pdf_parse',
+        'embedding',
+        'chroma_add',
+    } <= set(results['stages'])
+
+    # DESC: Sem regressões contra os próprios resultados
+    assert crawl.compare(results=results, baseline=results) == []
+
+    slower = {**results, 'chunks_per_second': results['chunks_per_second'] / 2}
+    assert crawl.compare(results=slower, baseline=results) == [
+        f'chunks_per_second: {slower["chunks_per_second"]:.1f} < '
+        f'{results["chunks_per_second"]:.1f}'
+    ]
@@ -0,0 +1,128 @@
+import pytest
+
+from src.connections.chroma_connection import ChromaConnection
+from src.connections.config import Config
+from src.connections.utils import get_chroma_auth_headers, get_chroma_heartbeat
+
+
+class FakeHandler:
+    def __init__(self):
+        self.clients = []
+        self.collections = []
+
+    def connect(self, *, config, backend):
+        self.clients.append(object())
+        return self.clients[-1]
+
+    def get_collection(self, *, config, client, embedding_model_name):
+        self.collections.append((client, embedding_model_name))
+        return self.collections[-1]
+
+
+@pytest.fixture
+def config(monkeypatch):
+    config = Config()
+    monkeypatch.setattr(config, 'chroma_backend', 'http')
+    monkeypatch.setattr(config, 'chroma_bulk_load', False)
+
+    return config
+
+
+def test_connection_reuses_the_client_and_collections(config):
+    handler = FakeHandler()
+    connection = ChromaConnection(handler=handler)
+
+    for _ in range(3):
+        collection = connection.get_collection(
+            config=config, embedding_model_name='model'
+        )
+
+    other = connection.get_collection(config=config, embedding_model_name='other')
+
+    assert len(handler.clients) == 1
+    assert collection == (handler.clients[0], 'model')
+    assert other == (handler.clients[0], 'other')
+    assert connection.get_client(config=config) is handler.clients[0]
+
+
+def test_connection_reconnects_on_failure(config):
+    handler = FakeHandler()
+    connection = ChromaConnection(handler=handler)
+    calls = []
+
+    def insert(*, client, collection):
+        calls.append(client)
+
+        if len(calls) == 1:
+            raise ConnectionError('connection reset')
+
+        return collection
+
+    collection = connection.run(insert, config=config, embedding_model_name='model')
+
+    # DESC: A segunda tentativa usa um novo cliente e uma nova coleção
+    assert len(handler.clients) == 2
+    assert calls == handler.clients
+    assert collection == (handler.clients[1], 'model')
+
+
+def test_connection_gives_up_after_the_retries(config):
+    connection = ChromaConnection(handler=FakeHandler())
+
+    def insert(*, client, collection):
+        raise ConnectionError('connection refused')
+
+    with pytest.raises(ConnectionError):
+        connection.run(insert, config=config, embedding_model_name='model')
+
+
+def test_heartbeat_sends_the_client_auth_headers(monkeypatch, config, http_server):
+    http_server.files['/api/v1/heartbeat'] = b'{"nanosecond heartbeat": 1}'
+
+    host, port = http_server.server_address
+    monkeypatch.setattr(config, 'chroma_host', host)
+    monkeypatch.setattr(config, 'chroma_port', str(port))
+    monkeypatch.setattr(
+        config,
+        'chroma_client_auth_provider',
+        'chromadb.auth.token_authn.TokenAuthClientProvider',
+    )
+    monkeypatch.setattr(config, 'chroma_client_auth_credentials', 'secret')
+    monkeypatch.setattr(config, 'chroma_auth_token_transport_header', 'X-Chroma-Token')
+
+    assert get_chroma_heartbeat(config=config)
+
+    ((path, headers),) = http_server.requests
+    assert path == '/api/v1/heartbeat'
+    assert headers['X-Chroma-Token'] == 'secret'
+
+    # DESC: Servidor sem a rota (ou fora do ar)
+    monkeypatch.setattr(config, 'chroma_port', '1')
+    assert not get_chroma_heartbeat(config=config)
+
+
+def test_get_chroma_auth_headers(monkeypatch, config):
+    monkeypatch.setattr(config, 'chroma_client_auth_credentials', 'admin:admin')
+    monkeypatch.setattr(
+        config,
+        'chroma_client_auth_provider',
+        'chromadb.auth.basic_authn.BasicAuthClientProvider',
+    )
+
+    assert get_chroma_auth_headers(config=config) == {
+        'Authorization': 'Basic YWRtaW46YWRtaW4='
+    }
+
+    monkeypatch.setattr(
+        config,
+        'chroma_client_auth_provider',
+        'chromadb.auth.token_authn.TokenAuthClientProvider',
+    )
+    monkeypatch.setattr(config, 'chroma_auth_token_transport_header', 'Authorization')
+
+    assert get_chroma_auth_headers(config=config) == {
+        'Authorization': 'Bearer admin:admin'
+    }
+
+    monkeypatch.setattr(config, 'chroma_client_auth_provider', '')
+    assert get_chroma_auth_headers(config=config) == {}
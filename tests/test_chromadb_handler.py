@@ -0,0 +1,335 @@
+import pytest
+from langchain.docstore.document import Document
+
+import src.connections.chromadb_handler as chromadb_handler_module
+from src.chunk_export import ChunkExport
+from src.connections.chromadb_handler import ChromaDBHandler
+from src.connections.config import Config
+from src.connections.utils import (
+    PERSISTENT_BACKEND,
+    _get_document_id,
+    get_chroma_backend,
+    get_id_list,
+)
+from src.templates.dataclass import ArticleLink
+
+
+class FakeCollection:
+    metadata = None
+
+    def __init__(self, existing_ids=()):
+        self.ids = list(existing_ids)
+        self.records = {}
+        self.get_calls = []
+        self.add_calls = []
+
+    def get(self, ids, include=()):
+        self.get_calls.append((ids, include))
+
+        return {'ids': [document_id for document_id in ids if document_id in self.ids]}
+
+    def add(self, ids, embeddings, documents, metadatas):
+        assert len(embeddings) == len(ids)
+        self.add_calls.append(ids)
+        self.ids.extend(ids)
+        self.records.update(zip(ids, zip(embeddings, documents, metadatas)))
+
+
+class FakeClient:
+    def __init__(self, collection, max_batch_size=100):
+        self.collection = collection
+        self.max_batch_size = max_batch_size
+
+    def get_or_create_collection(self, name, embedding_function=None, metadata=None):
+        return self.collection
+
+    def get_max_batch_size(self):
+        return self.max_batch_size
+
+
+def _get_document_chunks(total):
+    return [
+        [
+            Document(
+                page_content=f'chunk {i}',
+                metadata={
+                    'doi': '10.4316/AECE.2022.03001',
+                    'publication_date': '2022-08-31',
+                    'page': '0',
+                    'start_index': i,
+                },
+            )
+            for i in range(total)
+        ]
+    ]
+
+
+def _patch_embeddings(monkeypatch):
+    monkeypatch.setattr(
+        chromadb_handler_module, 'get_embedding_function', lambda **_: None
+    )
+    monkeypatch.setattr(
+        chromadb_handler_module,
+        'get_embeddings',
+        lambda *, texts, **_: [[0.0, 1.0] for _ in texts],
+    )
+
+
+def test_insert_checks_and_adds_in_batches(monkeypatch):
+    _patch_embeddings(monkeypatch)
+
+    config = Config()
+    monkeypatch.setattr(config, 'chroma_batch_size', 4)
+
+    document_chunks = _get_document_chunks(10)
+    # DESC: o mesmo chunk duas vezes na mesma execução
+    document_chunks[0].append(document_chunks[0][0])
+
+    collection = FakeCollection()
+    ChromaDBHandler().insert(
+        config=config,
+        client=FakeClient(collection, max_batch_size=3),
+        document_chunks=document_chunks,
+        embedding_model_name='all-MiniLM-L6-v2',
+    )
+
+    assert len(collection.get_calls) == 4
+    assert all(include == [] for _, include in collection.get_calls)
+    assert [len(ids) for ids in collection.add_calls] == [3, 3, 3, 1]
+    assert len(set(collection.ids)) == len(collection.ids) == 10
+
+
+def test_insert_skips_existing_documents(monkeypatch):
+    _patch_embeddings(monkeypatch)
+
+    config = Config()
+    monkeypatch.setattr(config, 'chroma_batch_size', 100)
+
+    collection = FakeCollection()
+    client = FakeClient(collection)
+
+    for _ in range(2):
+        ChromaDBHandler().insert(
+            config=config,
+            client=client,
+            document_chunks=_get_document_chunks(5),
+            embedding_model_name='all-MiniLM-L6-v2',
+        )
+
+    assert [len(ids) for ids in collection.add_calls] == [5]
+
+
+def test_bulk_load_ships_the_persistent_store(monkeypatch, tmp_path):
+    _patch_embeddings(monkeypatch)
+
+    config = Config()
+    monkeypatch.setattr(config, 'chroma_collection', 'articles')
+    monkeypatch.setattr(config, 'chroma_batch_size', 4)
+    monkeypatch.setattr(config, 'chroma_bulk_load', True)
+    monkeypatch.setattr(config, 'chroma_persist_path', str(tmp_path / 'local'))
+
+    handler = ChromaDBHandler()
+
+    # DESC: No bulk load os inserts vão para o store persistente local
+    source_client = handler.connect(config=config)
+    handler.insert(
+        config=config,
+        client=source_client,
+        document_chunks=_get_document_chunks(10),
+        embedding_model_name='model',
+    )
+
+    # DESC: Outro store persistente no papel do servidor,
+    # que já possui os dois primeiros chunks
+    monkeypatch.setattr(config, 'chroma_persist_path', str(tmp_path / 'server'))
+    target_client = handler.connect(config=config, backend=PERSISTENT_BACKEND)
+    handler.insert(
+        config=config,
+        client=target_client,
+        document_chunks=[_get_document_chunks(2)[0]],
+        embedding_model_name='model',
+    )
+
+    shipped = handler.ship(
+        config=config,
+        source_client=source_client,
+        target_client=target_client,
+        embedding_model_name='model',
+    )
+
+    source = source_client.get_collection('articles').get(
+        include=['embeddings', 'documents', 'metadatas']
+    )
+    target = target_client.get_collection('articles').get(
+        ids=source['ids'], include=['embeddings', 'documents', 'metadatas']
+    )
+
+    assert shipped == 8
+    assert sorted(target['ids']) == sorted(source['ids'])
+    assert sorted(target['documents']) == [f'chunk {i}' for i in range(10)]
+    assert [list(embedding) for embedding in target['embeddings']] == [[0.0, 1.0]] * 10
+
+    # DESC: Um novo envio não duplica os chunks
+    assert (
+        handler.ship(
+            config=config,
+            source_client=source_client,
+            target_client=target_client,
+            embedding_model_name='model',
+        )
+        == 0
+    )
+
+
+def test_load_indexes_the_exported_chunks(monkeypatch, tmp_path):
+    embedded_texts = []
+
+    monkeypatch.setattr(
+        chromadb_handler_module, 'get_embedding_function', lambda **_: None
+    )
+    monkeypatch.setattr(
+        chromadb_handler_module,
+        'get_embeddings',
+        lambda *, texts, **_: embedded_texts.extend(texts)
+        or [[0.5, 0.5] for _ in texts],
+    )
+
+    chunk_export = ChunkExport(root=str(tmp_path))
+    document_chunks = _get_document_chunks(5)[0]
+    chunk_ids = get_id_list(document_list=document_chunks)
+
+    chunk_export.write(
+        article=ArticleLink(name='Article', page_link='link', year=2022, number=3),
+        document_chunks=document_chunks,
+        chunk_ids=chunk_ids,
+        embeddings=[[float(i), 1.0] for i in range(5)],
+        embedding_model='model',
+    )
+
+    config = Config()
+    monkeypatch.setattr(config, 'chroma_batch_size', 2)
+
+    # DESC: Mesmo modelo, os embeddings exportados são reaproveitados
+    collection = FakeCollection(existing_ids=chunk_ids[:1])
+
+    assert (
+        ChromaDBHandler().load(
+            config=config,
+            client=FakeClient(collection),
+            chunk_export=chunk_export,
+            embedding_model_name='model',
+        )
+        == 5
+    )
+    assert embedded_texts == []
+    assert collection.add_calls == [chunk_ids[1:2], chunk_ids[2:4], chunk_ids[4:]]
+    assert collection.records[chunk_ids[4]] == (
+        [4.0, 1.0],
+        'chunk 4',
+        document_chunks[4].metadata,
+    )
+
+    # DESC: Outro modelo, os embeddings são calculados novamente
+    collection = FakeCollection()
+
+    ChromaDBHandler().load(
+        config=config,
+        client=FakeClient(collection),
+        chunk_export=chunk_export,
+        embedding_model_name='other-model',
+    )
+
+    assert embedded_texts == [f'chunk {i}' for i in range(5)]
+    assert collection.records[chunk_ids[4]][0] == [0.5, 0.5]
+
+
+def test_load_rejects_a_collection_of_another_model(monkeypatch, tmp_path):
+    _patch_embeddings(monkeypatch)
+
+    chunk_export = ChunkExport(root=str(tmp_path / 'chunks'))
+    document_chunks = _get_document_chunks(3)[0]
+
+    chunk_export.write(
+        article=ArticleLink(name='Article', page_link='link', year=2022, number=3),
+        document_chunks=document_chunks,
+        chunk_ids=get_id_list(document_list=document_chunks),
+        embeddings=[[float(i), 1.0] for i in range(3)],
+        embedding_model='model',
+    )
+
+    config = Config()
+    monkeypatch.setattr(config, 'chroma_persist_path', str(tmp_path / 'chroma'))
+    monkeypatch.setattr(config, 'chroma_collection', 'articles')
+
+    client = ChromaDBHandler().connect(config=config, backend=PERSISTENT_BACKEND)
+
+    assert (
+        ChromaDBHandler().load(
+            config=config,
+            client=client,
+            chunk_export=chunk_export,
+            embedding_model_name='model',
+        )
+        == 3
+    )
+    assert client.get_collection('articles').metadata == {'embedding_model': 'model'}
+
+    # DESC: A coleção criada com outro modelo não recebe os chunks
+    with pytest.raises(ValueError, match='created with the embedding model model'):
+        ChromaDBHandler().load(
+            config=config,
+            client=client,
+            chunk_export=chunk_export,
+            embedding_model_name='other-model',
+        )
+
+    # DESC: Uma coleção por modelo
+    monkeypatch.setattr(config, 'chroma_collection', 'articles_other_model')
+
+    ChromaDBHandler().load(
+        config=config,
+        client=client,
+        chunk_export=chunk_export,
+        embedding_model_name='other-model',
+    )
+
+    assert client.get_collection('articles_other_model').count() == 3
+
+
+def test_get_chroma_backend(monkeypatch):
+    config = Config()
+    monkeypatch.setattr(config, 'chroma_backend', 'http')
+    monkeypatch.setattr(config, 'chroma_bulk_load', False)
+
+    assert get_chroma_backend(config=config) == 'http'
+
+    # DESC: O bulk load sempre insere no store persistente local
+    monkeypatch.setattr(config, 'chroma_bulk_load', True)
+    assert get_chroma_backend(config=config) == PERSISTENT_BACKEND
+
+    monkeypatch.setattr(config, 'chroma_bulk_load', False)
+    monkeypatch.setattr(config, 'chroma_backend', 'sqlite')
+
+    with pytest.raises(ValueError, match='Invalid chroma backend'):
+        ChromaDBHandler().connect(config=config)
+
+
+def test_get_id_list_matches_the_chromadbx_ids():
+    document_list = [
+        Document(
+            page_content='chunk',
+            metadata={
+                'doi': '10.4316/AECE.2022.03001',
+                'publication_date': '2022-08-31',
+                'page': '1',
+                'start_index': 412,
+            },
+        ),
+        # DESC: Metadados ausentes também fazem parte do id
+        Document(page_content='chunk', metadata={'doi': 'ação'}),
+    ]
+
+    assert get_id_list(document_list=document_list) == [
+        _get_document_id(document_chunk=document_chunk)
+        for document_chunk in document_list
+    ]
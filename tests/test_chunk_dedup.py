@@ -0,0 +1,136 @@
+import json
+
+from langchain.schema import Document
+
+from src.chunk_dedup import (
+    EXACT,
+    NEAR,
+    ChunkDedup,
+    MinHash,
+    get_lsh_params,
+    get_shingles,
+    get_similarity,
+)
+from src.connections.utils import get_id_list
+from src.templates.dataclass import ArticleLink
+from src.web_scrapper import WebScrapper
+
+BOILERPLATE = (
+    'Advances in Electrical and Computer Engineering, Volume 22, Number 3, 2022. '
+    'This article is licensed under a Creative Commons Attribution 4.0 '
+    'International License, which permits use, sharing, adaptation and '
+    'reproduction in any medium, provided the original author and source are '
+    'credited and a link to the license is provided.'
+)
+
+TEXT = (
+    'The proposed convolutional network classifies power quality disturbances '
+    'from raw voltage waveforms, reaching an accuracy of 98 percent on the '
+    'synthetic dataset and 95 percent on the field measurements.'
+)
+
+
+def test_minhash_estimates_the_similarity():
+    minhash = MinHash(num_perm=128)
+
+    signature = minhash.get_signature(shingles=get_shingles(text=BOILERPLATE))
+    near = minhash.get_signature(
+        shingles=get_shingles(text=BOILERPLATE.replace('Number 3', 'Number 4'))
+    )
+    other = minhash.get_signature(shingles=get_shingles(text=TEXT))
+
+    assert get_similarity(signature=signature, other=signature) == 1.0
+    assert get_similarity(signature=signature, other=near) > 0.7
+    assert get_similarity(signature=signature, other=other) < 0.1
+
+    assert get_lsh_params(threshold=0.9, num_perm=64) == (8, 8)
+
+
+def test_chunk_dedup_keeps_the_first_occurrence(tmp_path):
+    path = str(tmp_path / 'dedup' / 'chunk_dedup.sqlite3')
+    chunk_dedup = ChunkDedup(path=path, threshold=0.8)
+
+    assert chunk_dedup.deduplicate(
+        chunk_ids=['a1', 'a2', 'a3'], texts=[BOILERPLATE, TEXT, TEXT.upper()]
+    )[0].model_dump() == {
+        'id': 'a3',
+        'duplicate_of': 'a2',
+        'similarity': 1.0,
+        'kind': EXACT,
+    }
+
+    # DESC: Outro artigo, o mesmo rodapé com outro número de issue
+    duplicates = chunk_dedup.deduplicate(
+        chunk_ids=['b1', 'b2'],
+        texts=[BOILERPLATE.replace('Number 3', 'Number 4'), 'Conclusions.'],
+    )
+
+    assert [(duplicate.id, duplicate.duplicate_of) for duplicate in duplicates] == [
+        ('b1', 'a1')
+    ]
+    assert duplicates[0].kind == NEAR
+    assert duplicates[0].similarity >= 0.8
+
+    chunk_dedup.close()
+
+    # DESC: O índice persiste entre execuções, chunks já mantidos
+    # (reindexação do mesmo artigo) não são removidos
+    chunk_dedup = ChunkDedup(path=path, threshold=0.8)
+
+    assert (
+        chunk_dedup.deduplicate(chunk_ids=['a1', 'a2'], texts=[BOILERPLATE, TEXT]) == []
+    )
+    assert [
+        duplicate.duplicate_of
+        for duplicate in chunk_dedup.deduplicate(chunk_ids=['c1'], texts=[TEXT])
+    ] == ['a2']
+
+    chunk_dedup.close()
+
+
+def test_deduplicate_chunks_reports_the_removed_chunks(tmp_path, get_scrapper):
+    web_scrapper = get_scrapper(WebScrapper, CHUNK_DEDUP='true')
+
+    def get_chunks(doi, texts):
+        return [
+            Document(
+                page_content=text,
+                metadata={'doi': doi, 'page': '0', 'start_index': index},
+            )
+            for index, text in enumerate(texts)
+        ]
+
+    first = get_chunks('doi 1', [BOILERPLATE, TEXT])
+    second = get_chunks('doi 2', [BOILERPLATE, 'Conclusions.'])
+
+    assert (
+        web_scrapper._deduplicate_chunks(
+            article=ArticleLink(name='1', page_link='link 1', year=2022, number=3),
+            document_chunks=first,
+        )
+        == first
+    )
+    assert (
+        web_scrapper._deduplicate_chunks(
+            article=ArticleLink(name='2', page_link='link 2', year=2022, number=3),
+            document_chunks=second,
+        )
+        == second[1:]
+    )
+
+    (report,) = [
+        json.loads(line)
+        for line in (tmp_path / 'chunk_dedup.jsonl').read_text().splitlines()
+    ]
+
+    assert report == {
+        'id': get_id_list(document_list=second)[0],
+        'duplicate_of': get_id_list(document_list=first)[0],
+        'similarity': 1.0,
+        'kind': EXACT,
+        'page_link': 'link 2',
+        'doi': 'doi 2',
+        'page': '0',
+        'start_index': 0,
+        'text': BOILERPLATE[:200],
+    }
@@ -0,0 +1,74 @@
+import os
+
+from langchain.schema import Document
+
+from src.chunk_export import ChunkExport
+from src.connections.utils import get_id_list
+
+
+def get_document_chunks(*, doi, total):
+    return [
+        Document(
+            page_content=f'{doi} chunk {i}',
+            metadata={'doi': doi, 'page': '0', 'start_index': i},
+        )
+        for i in range(total)
+    ]
+
+
+def export(chunk_export, *, article, total, embeddings=False):
+    document_chunks = get_document_chunks(doi=article.name, total=total)
+
+    return chunk_export.write(
+        article=article,
+        document_chunks=document_chunks,
+        chunk_ids=get_id_list(document_list=document_chunks),
+        embeddings=[[float(i), 1.0] for i in range(total)] if embeddings else None,
+        embedding_model='model',
+    )
+
+
+def test_chunk_export_is_partitioned_by_year_and_issue(tmp_path, get_article):
+    chunk_export = ChunkExport(root=str(tmp_path / 'chunks'))
+
+    path = export(chunk_export, article=get_article(1, year=2022, number=3), total=2)
+    export(
+        chunk_export,
+        article=get_article(1, year=2023, number=1),
+        total=3,
+        embeddings=True,
+    )
+
+    assert os.path.dirname(path) == str(tmp_path / 'chunks' / 'year=2022' / 'number=3')
+
+    # DESC: Um novo export do artigo substitui os chunks anteriores
+    export(chunk_export, article=get_article(1, year=2022, number=3), total=1)
+    assert sorted(os.listdir(os.path.dirname(path))) == [os.path.basename(path)]
+
+    batches = list(chunk_export.iter_batches(batch_size=3))
+    chunks = [chunk for batch in batches for chunk in batch]
+
+    assert [len(batch) for batch in batches] == [3, 1]
+    assert sorted(chunk.text for chunk in chunks) == [
+        'Article 1 chunk 0',
+        'Article 1 chunk 0',
+        'Article 1 chunk 1',
+        'Article 1 chunk 2',
+    ]
+
+    (chunk,) = [chunk for chunk in chunks if chunk.embedding is None]
+    assert chunk.metadata == {'doi': 'Article 1', 'page': '0', 'start_index': 0}
+    assert chunk.embedding_model == ''
+    assert (
+        chunk.id
+        == get_id_list(document_list=get_document_chunks(doi='Article 1', total=1))[0]
+    )
+
+    (batch,) = chunk_export.iter_batches(batch_size=10, years=[2023])
+    assert [chunk.embedding for chunk in batch] == [[0.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+    assert {chunk.embedding_model for chunk in batch} == {'model'}
+
+    assert (
+        list(ChunkExport(root=str(tmp_path / 'empty')).iter_batches(batch_size=10))
+        == []
+    )
@@ -0,0 +1,113 @@
+from langchain.schema import Document
+
+import src.article_scrapper as article_scrapper_module
+from src.crawl_state import FETCHED, INDEXED, CrawlState
+from src.templates.dataclass import ArticleInfo, StoredPdf
+from src.web_scrapper import WebScrapper
+
+
+def get_article_info(article):
+    return ArticleInfo(
+        name=article.name,
+        page_link=article.page_link,
+        pdf_download_link=f'{article.page_link}.pdf',
+        author_keywords='keywords',
+        publication_date='2022',
+        doi=f'doi {article.name}',
+        filename=f'/tmp/{article.name}.pdf',
+        pdf_sha256='sha256',
+    )
+
+
+def test_crawl_state_records_each_stage(tmp_path, get_article):
+    crawl_state = CrawlState(path=str(tmp_path / 'state' / 'crawl.sqlite3'))
+    article = get_article(1)
+    article_info = get_article_info(article)
+
+    assert crawl_state.get(article=article) is None
+
+    crawl_state.mark_fetched(article=article, article_info=article_info)
+    article_state = crawl_state.get(article=article)
+
+    assert article_state.status == FETCHED
+    assert article_state.article_info == article_info
+    assert article_state.pdf_sha256 == 'sha256'
+
+    crawl_state.mark_indexed(
+        article=article, article_info=article_info, chunk_ids=['a', 'b'], model='m'
+    )
+    crawl_state.close()
+
+    # DESC: O estado sobrevive a uma nova execução
+    article_state = CrawlState(path=crawl_state.path).get(article=article)
+
+    assert article_state.status == INDEXED
+    assert article_state.chunk_ids == ['a', 'b']
+    assert article_state.model == 'm'
+
+
+def test_index_articles_resumes_from_crawl_state(
+    monkeypatch, get_article, get_scrapper
+):
+    scraped = []
+    parsed = []
+    persisted = []
+
+    def fake_get_article_info(*, article):
+        scraped.append(article.name)
+        return get_article_info(article)
+
+    def fake_get_article_document(*, article_info):
+        parsed.append(article_info.name)
+
+        if parsed.count('Article 2') == 1 and article_info.name == 'Article 2':
+            raise ValueError('interrupted')
+
+        return [
+            Document(
+                page_content=article_info.name,
+                metadata={'doi': article_info.doi, 'page': 0, 'start_index': 0},
+            )
+        ]
+
+    monkeypatch.setattr(
+        article_scrapper_module, 'get_article_document', fake_get_article_document
+    )
+    monkeypatch.setattr(
+        article_scrapper_module,
+        'download_article_pdf',
+        lambda *, link, year, number, pdf_store: StoredPdf(
+            path=f'/tmp/{link}', link=link, size=1, sha256='sha256'
+        ),
+    )
+
+    def get_web_scrapper(**env):
+        web_scrapper = get_scrapper(WebScrapper, **env)
+        monkeypatch.setattr(web_scrapper, '_get_article_info', fake_get_article_info)
+        monkeypatch.setattr(
+            web_scrapper,
+            'persistir',
+            lambda *, document_chunks, embedding_model_name: persisted.append(
+                document_chunks[0][0].page_content
+            ),
+        )
+
+        return web_scrapper
+
+    articles = [get_article(i) for i in range(3)]
+    web_scrapper = get_web_scrapper()
+
+    # DESC: O parse do artigo 2 falha na primeira execução
+    assert web_scrapper._index_articles(articles=articles) == [1, 1]
+
+    # DESC: Apenas o artigo 2 é reprocessado, sem recarregar a página
+    assert web_scrapper._index_articles(articles=articles) == [1, 1, 1]
+    assert scraped == ['Article 0', 'Article 1', 'Article 2']
+    assert persisted == ['Article 0', 'Article 1', 'Article 2']
+    get_scrapper.close(web_scrapper)
+
+    # DESC: Outro modelo de embeddings reindexa todos os artigos
+    web_scrapper = get_web_scrapper(EMBEDDING_MODEL_NAME='other model')
+    assert web_scrapper._index_articles(articles=articles) == [1, 1, 1]
+    assert len(scraped) == 3
+    assert len(persisted) == 6
@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+
+from src.download_manager import DownloadManager
+
+
+@pytest.fixture
+def download_manager():
+    download_manager = DownloadManager(per_host_limit=2, retries=3, backoff=0.01)
+
+    yield download_manager
+
+    download_manager.close()
+
+
+def test_download_streams_the_file(http_server, sample_pdf, download_manager, tmp_path):
+    http_server.files['/article_1.pdf'] = sample_pdf
+    path = str(tmp_path / 'article_1.pdf')
+
+    download = download_manager.download(
+        url=f'{http_server.url}/article_1.pdf', path=path
+    )
+
+    assert download.status == 'downloaded'
+    assert download.size == len(sample_pdf)
+    assert download.etag
+    assert (tmp_path / 'article_1.pdf').read_bytes() == sample_pdf
+    assert not (tmp_path / 'article_1.pdf.part').exists()
+
+
+def test_download_revalidates_with_the_etag(
+    http_server, sample_pdf, download_manager, tmp_path
+):
+    http_server.files['/article_1.pdf'] = sample_pdf
+    url = f'{http_server.url}/article_1.pdf'
+    path = str(tmp_path / 'article_1.pdf')
+
+    first = download_manager.download(url=url, path=path)
+    second = download_manager.download(
+        url=url, path=path, etag=first.etag, last_modified=first.last_modified
+    )
+
+    assert second.status == 'not_modified'
+    assert http_server.requests[-1][1]['If-None-Match'] == first.etag
+
+
+def test_download_retries_and_resumes_interrupted_downloads(
+    http_server, sample_pdf, download_manager, tmp_path
+):
+    http_server.files['/article_1.pdf'] = sample_pdf
+    http_server.failures['/article_1.pdf'] = [503]
+    http_server.truncate['/article_1.pdf'] = 1000
+
+    download = download_manager.download(
+        url=f'{http_server.url}/article_1.pdf', path=str(tmp_path / 'article_1.pdf')
+    )
+
+    assert download.status == 'resumed'
+    assert (tmp_path / 'article_1.pdf').read_bytes() == sample_pdf
+    assert len(http_server.requests) == 3
+    assert http_server.requests[-1][1]['Range'] == 'bytes=1000-'
+
+
+def test_download_gives_up_after_the_retries(http_server, sample_pdf, tmp_path):
+    http_server.files['/article_1.pdf'] = sample_pdf
+    http_server.failures['/article_1.pdf'] = [503] * 3
+
+    download_manager = DownloadManager(retries=1, backoff=0.01)
+
+    try:
+        with pytest.raises(Exception, match='503'):
+            download_manager.download(
+                url=f'{http_server.url}/article_1.pdf',
+                path=str(tmp_path / 'article_1.pdf'),
+            )
+    finally:
+        download_manager.close()
+
+    assert len(http_server.requests) == 2
+
+
+def test_downloads_from_threads_respect_the_per_host_limit(
+    http_server, sample_pdf, download_manager, tmp_path
+):
+    http_server.delay = 0.05
+    results = []
+
+    def download(i):
+        results.append(
+            download_manager.download(
+                url=f'{http_server.url}/article_{i}.pdf',
+                path=str(tmp_path / f'article_{i}.pdf'),
+            )
+        )
+
+    threads = []
+    for i in range(6):
+        http_server.files[f'/article_{i}.pdf'] = sample_pdf
+        threads.append(threading.Thread(target=download, args=(i,)))
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [result.status for result in results] == ['downloaded'] * 6
+    assert http_server.max_active == 2
+
+
+def test_download_is_shared_between_threads(
+    http_server, sample_pdf, download_manager, tmp_path
+):
+    http_server.files['/article_1.pdf'] = sample_pdf
+    http_server.delay = 0.05
+    results = []
+
+    def download():
+        results.append(
+            download_manager.download(
+                url=f'{http_server.url}/article_1.pdf',
+                path=str(tmp_path / 'article_1.pdf'),
+            )
+        )
+
+    threads = [threading.Thread(target=download) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 3
+    assert len(http_server.requests) == 1
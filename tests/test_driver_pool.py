@@ -0,0 +1,77 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quitted = False
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise WebDriverException('browser crashed')
+        return 'about:blank'
+
+    def quit(self):
+        self.quitted = True
+
+
+def test_driver_pool_reuses_warm_drivers():
+    pool = DriverPool(factory=FakeDriver, size=2, max_pages=10)
+
+    with pool.borrow() as first:
+        pass
+
+    with pool.borrow() as second:
+        pass
+
+    assert first is second
+    assert pool.metrics.launches == 1
+    assert pool.metrics.borrows == 2
+
+
+def test_driver_pool_recycles_after_max_pages():
+    pool = DriverPool(factory=FakeDriver, size=1, max_pages=2)
+
+    for _ in range(4):
+        with pool.borrow():
+            pass
+
+    assert pool.metrics.launches == 2
+    assert pool.metrics.recycles == 2
+
+
+def test_driver_pool_recycles_crashed_drivers():
+    pool = DriverPool(factory=FakeDriver, size=1, max_pages=10)
+
+    with pytest.raises(WebDriverException):
+        with pool.borrow() as driver:
+            raise WebDriverException('page crashed')
+
+    assert driver.quitted
+
+    with pool.borrow() as idle_driver:
+        idle_driver.alive = False
+
+    with pool.borrow() as new_driver:
+        pass
+
+    assert new_driver is not idle_driver
+    assert pool.metrics.launches == 3
+    assert pool.metrics.recycles == 2
+
+
+def test_driver_pool_close_quits_idle_drivers():
+    pool = DriverPool(factory=FakeDriver, size=2, max_pages=10)
+
+    with pool.borrow() as driver:
+        pass
+
+    pool.close()
+
+    assert driver.quitted
+    with pytest.raises(RuntimeError):
+        pool.acquire()
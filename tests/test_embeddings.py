@@ -0,0 +1,41 @@
+import src.connections.embeddings as embeddings_module
+from src.connections.embeddings import EmbeddingCache, get_embeddings
+
+
+class FakeEmbeddingFunction:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+
+def test_get_embeddings_batches_and_caches(monkeypatch, tmp_path):
+    embedding_function = FakeEmbeddingFunction()
+    monkeypatch.setattr(
+        embeddings_module,
+        'get_embedding_function',
+        lambda *, embedding_model_name: embedding_function,
+    )
+
+    cache = EmbeddingCache(path=str(tmp_path / 'embeddings.sqlite3'))
+    texts = ['a', 'bb', 'ccc', 'bb', 'dddd', 'eeeee']
+
+    embeddings = get_embeddings(
+        texts=texts, embedding_model_name='model', batch_size=2, cache=cache
+    )
+
+    assert embeddings == [[float(len(text)), 0.5] for text in texts]
+    # DESC: 'bb' repetido é codificado uma única vez
+    assert [len(batch) for batch in embedding_function.calls] == [2, 2, 1]
+
+    embedding_function.calls.clear()
+    assert get_embeddings(
+        texts=['ccc', 'ffffff'], embedding_model_name='model', cache=cache
+    ) == [[3.0, 0.5], [6.0, 0.5]]
+    assert embedding_function.calls == [['ffffff']]
+
+    # DESC: O cache é separado por modelo
+    get_embeddings(texts=['ccc'], embedding_model_name='other-model', cache=cache)
+    assert embedding_function.calls[-1] == ['ccc']
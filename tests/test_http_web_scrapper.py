@@ -0,0 +1,409 @@
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from langchain.schema import Document
+
+import src.article_scrapper as article_scrapper_module
+import src.http_web_scrapper as http_web_scrapper_module
+from src.chunk_export import ChunkExport
+from src.html_parser import parse_html
+from src.http_web_scrapper import HttpWebScrapper
+from src.templates.dataclass import StoredPdf
+from src.utils import (
+    IssueNotPublishedError,
+    get_article_infos_from_document,
+    get_donwload_link_from_document,
+    get_issue_url,
+)
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'aece'
+
+
+def _fixture_name(url: str) -> str:
+    query = parse_qs(urlparse(url).query)
+    page = urlparse(url).path.strip('/').replace('.php', '')
+    parts = [page, query['year'][0], query['number'][0]]
+
+    if 'article' in query:
+        parts.append(query['article'][0])
+
+    return '_'.join(parts) + '.html'
+
+
+class FakeResponse:
+    headers = {}
+
+    def __init__(self, url, status_code=200):
+        self.url = url
+        self.status_code = status_code
+        self.text = (FIXTURES / _fixture_name(url)).read_text()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error', response=self)
+
+
+class FakeSession:
+    def __init__(self):
+        self.urls = []
+        # DESC: Status das próximas respostas, 200 quando vazio
+        self.statuses = []
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return FakeResponse(
+            url, status_code=self.statuses.pop(0) if self.statuses else 200
+        )
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_session(monkeypatch):
+    # DESC: As páginas vêm dos fixtures, sem acesso à rede
+    monkeypatch.setattr(http_web_scrapper_module.requests, 'Session', FakeSession)
+
+
+@pytest.fixture
+def article_document():
+    page_source = (FIXTURES / 'abstractplus_2022_3_1.html').read_text()
+    return parse_html(
+        page_source=page_source,
+        base_url='https://aece.ro/abstractplus.php?year=2022&number=3&article=1',
+    )
+
+
+def test_get_article_infos_from_document(article_document):
+    article_infos = get_article_infos_from_document(document=article_document)
+
+    assert article_infos.author_keywords == (
+        'deep learning, power quality, classification, convolutional neural networks'
+    )
+    assert article_infos.publication_date == '2022-08-31'
+    assert article_infos.doi == '10.4316/AECE.2022.03001'
+    assert article_infos.about['SCOPUS ID'] == '85137046231'
+
+
+def test_get_donwload_link_from_document_resolves_relative_links(article_document):
+    assert get_donwload_link_from_document(
+        document=article_document,
+        reference='https://aece.ro/displaypdf.php?year=2022&number=3',
+    ) == ['https://aece.ro/displaypdf.php?year=2022&number=3&article=1']
+
+
+def test_index_articles_parses_issue_offline(monkeypatch, get_scrapper):
+    monkeypatch.setattr(
+        http_web_scrapper_module,
+        'download_article_pdf',
+        lambda *, link, year, number, pdf_store: StoredPdf(
+            path=f'/tmp/{link.split("=")[-1]}.pdf', link=link, size=0, sha256=''
+        ),
+    )
+    monkeypatch.setattr(
+        article_scrapper_module,
+        'get_article_document',
+        lambda *, article_info: [
+            Document(
+                page_content=article_info.name,
+                metadata={
+                    'doi': article_info.doi,
+                    'filename': article_info.filename,
+                    'page': 0,
+                    'start_index': 0,
+                },
+            )
+        ],
+    )
+
+    persisted = []
+
+    web_scrapper = get_scrapper(HttpWebScrapper)
+    monkeypatch.setattr(
+        web_scrapper,
+        'persistir',
+        lambda *, document_chunks, embedding_model_name: persisted.extend(
+            document_chunks
+        ),
+    )
+
+    document = web_scrapper.conectar(
+        url=get_issue_url(number=3, year=2022), session=web_scrapper.session
+    )
+    articles = web_scrapper._get_articles(document=document, number=3, year=2022)
+
+    # DESC: O artigo 2 não possui link para o PDF
+    assert web_scrapper._index_articles(articles=articles) == [1, 1]
+    assert [chunks[0].metadata['doi'] for chunks in persisted] == [
+        '10.4316/AECE.2022.03001',
+        '10.4316/AECE.2022.03003',
+    ]
+    assert persisted[1][0].page_content == (
+        'Lightweight Encryption for Constrained IoT Devices'
+    )
+    assert persisted[1][0].metadata['filename'] == '/tmp/3.pdf'
+
+
+def test_get_articles_rejects_invalid_issue(get_scrapper):
+    web_scrapper = get_scrapper(HttpWebScrapper)
+
+    document = parse_html(
+        page_source=(FIXTURES / 'displayissue_invalid.html').read_text()
+    )
+
+    with pytest.raises(IssueNotPublishedError):
+        web_scrapper._get_articles(document=document, number=3, year=2022)
+
+
+def test_replay_reads_the_archived_pages(monkeypatch, get_scrapper):
+    monkeypatch.setattr(
+        http_web_scrapper_module,
+        'download_article_pdf',
+        lambda *, link, year, number, pdf_store: StoredPdf(
+            path=f'/tmp/{link.split("=")[-1]}.pdf', link=link, size=0, sha256=''
+        ),
+    )
+
+    web_scrapper = get_scrapper(HttpWebScrapper)
+
+    articles = web_scrapper.get_issue_articles(number=3, year=2022)
+    article_infos = [web_scrapper._captar_article_info(article) for article in articles]
+    get_scrapper.close(web_scrapper)
+
+    # DESC: Replay sem acesso à rede, a sessão falha em qualquer requisição
+    web_scrapper = get_scrapper(HttpWebScrapper, PAGE_ARCHIVE_MODE='replay')
+    monkeypatch.setattr(web_scrapper.session, 'get', None)
+
+    assert web_scrapper.get_issue_articles(number=3, year=2022) == articles
+    # DESC: A extração é refeita a partir do HTML, mesmo com o crawl state
+    assert [
+        web_scrapper._captar_article_info(article) for article in articles
+    ] == article_infos
+    assert web_scrapper._get_fetched_article_info(article=articles[0]) is None
+
+    with pytest.raises(FileNotFoundError):
+        web_scrapper.get_issue_articles(number=4, year=2022)
+
+
+def test_replay_reindexes_the_issue(monkeypatch, get_scrapper):
+    monkeypatch.setattr(
+        http_web_scrapper_module,
+        'download_article_pdf',
+        lambda *, link, year, number, pdf_store: StoredPdf(
+            path=f'/tmp/{link.split("=")[-1]}.pdf', link=link, size=0, sha256=''
+        ),
+    )
+
+    def set_parser(*, prefix):
+        monkeypatch.setattr(
+            article_scrapper_module,
+            'get_article_document',
+            lambda *, article_info: [
+                Document(
+                    page_content=f'{prefix}{article_info.name}',
+                    metadata={'doi': article_info.doi, 'page': 0, 'start_index': 0},
+                )
+            ],
+        )
+
+    persisted = []
+
+    def execute_issue(**env):
+        web_scrapper = get_scrapper(HttpWebScrapper, **env)
+        monkeypatch.setattr(
+            web_scrapper,
+            'persistir',
+            lambda *, document_chunks, embedding_model_name: persisted.extend(
+                document_chunks
+            ),
+        )
+
+        if env.get('PAGE_ARCHIVE_MODE') == 'replay':
+            # DESC: Replay sem acesso à rede
+            monkeypatch.setattr(web_scrapper.session, 'get', None)
+
+        indexed = web_scrapper.execute_issue(number=3, year=2022)
+        get_scrapper.close(web_scrapper)
+
+        return indexed
+
+    set_parser(prefix='')
+    assert execute_issue() == [1, 1]
+
+    # DESC: Os artigos já indexados são extraídos novamente com o parser corrigido
+    set_parser(prefix='fixed ')
+    del persisted[:]
+    assert execute_issue(PAGE_ARCHIVE_MODE='replay') == [1, 1]
+
+    assert sorted(chunks[0].page_content for chunks in persisted) == [
+        'fixed Deep Learning Approach for Power Quality Disturbance Classification',
+        'fixed Lightweight Encryption for Constrained IoT Devices',
+    ]
+
+
+def test_execute_issue_skips_unchanged_articles(monkeypatch, get_scrapper):
+    monkeypatch.setattr(
+        http_web_scrapper_module,
+        'download_article_pdf',
+        lambda *, link, year, number, pdf_store: StoredPdf(
+            path=f'/tmp/{link.split("=")[-1]}.pdf', link=link, size=0, sha256=''
+        ),
+    )
+    monkeypatch.setattr(
+        article_scrapper_module,
+        'get_article_document',
+        lambda *, article_info: [
+            Document(
+                page_content=article_info.name,
+                metadata={'doi': article_info.doi, 'page': 0, 'start_index': 0},
+            )
+        ],
+    )
+
+    persisted = []
+    sessions = []
+
+    for _ in range(2):
+        web_scrapper = get_scrapper(HttpWebScrapper, PAGE_ARCHIVE_MODE='off')
+        monkeypatch.setattr(
+            web_scrapper,
+            'persistir',
+            lambda *, document_chunks, embedding_model_name: persisted.extend(
+                document_chunks
+            ),
+        )
+        sessions.append(web_scrapper.session)
+
+        assert web_scrapper.execute_issue(number=3, year=2022) == [1, 1]
+        get_scrapper.close(web_scrapper)
+
+    # DESC: Na segunda execução apenas a página da issue é acessada,
+    # inclusive o artigo 2, que não possui PDF
+    assert len(sessions[0].urls) == 4
+    assert sessions[1].urls == sessions[0].urls[:1]
+    assert len(persisted) == 2
+
+    # DESC: Os chunks dos artigos indexados ficam no export
+    (batch,) = ChunkExport(root=web_scrapper.settings.chunk_export_path).iter_batches(
+        batch_size=10
+    )
+    assert sorted(chunk.metadata['doi'] for chunk in batch) == [
+        '10.4316/AECE.2022.03001',
+        '10.4316/AECE.2022.03003',
+    ]
+
+
+def test_execute_issue_reloads_expired_articles(monkeypatch, get_scrapper):
+    monkeypatch.setattr(
+        http_web_scrapper_module,
+        'download_article_pdf',
+        lambda *, link, year, number, pdf_store: StoredPdf(
+            path=f'/tmp/{link.split("=")[-1]}.pdf', link=link, size=0, sha256=''
+        ),
+    )
+    monkeypatch.setattr(
+        article_scrapper_module,
+        'get_article_document',
+        lambda *, article_info: [
+            Document(
+                page_content=article_info.name,
+                metadata={'doi': article_info.doi, 'page': 0, 'start_index': 0},
+            )
+        ],
+    )
+
+    sessions = []
+
+    # DESC: Com a captura expirada as páginas dos artigos são carregadas
+    # novamente, mesmo com o título sem alteração na listagem
+    for max_age in [0, 1e-9]:
+        web_scrapper = get_scrapper(
+            HttpWebScrapper, PAGE_ARCHIVE_MODE='off', ISSUE_INDEX_MAX_AGE=max_age
+        )
+        monkeypatch.setattr(
+            web_scrapper, 'persistir', lambda *, document_chunks, **_: None
+        )
+        sessions.append(web_scrapper.session)
+
+        assert web_scrapper.execute_issue(number=3, year=2022) == [1, 1]
+        get_scrapper.close(web_scrapper)
+
+    assert len(sessions[0].urls) == 4
+    assert sessions[1].urls == sessions[0].urls
+
+
+@pytest.fixture
+def selenium_calls(monkeypatch):
+    calls = []
+
+    class FakeWebScrapper:
+        def _config_driver_pool(self):
+            calls.append('config')
+
+        def _close_driver_pool(self):
+            calls.append('close')
+
+        def execute_issue(self, *, number, year):
+            calls.append((number, year, self.crawl_state))
+            return [1]
+
+    monkeypatch.setattr(http_web_scrapper_module, 'WebScrapper', FakeWebScrapper)
+
+    return calls
+
+
+def test_execute_falls_back_to_selenium(monkeypatch, get_scrapper, selenium_calls):
+    def failing_conectar(*, url, session):
+        raise requests.ConnectionError('connection refused')
+
+    web_scrapper = get_scrapper(HttpWebScrapper)
+    monkeypatch.setattr(web_scrapper, 'conectar', failing_conectar)
+
+    assert web_scrapper.execute_issue(number=3, year=2022) == [1]
+    assert web_scrapper.execute_issue(number=4, year=2022) == [1]
+    get_scrapper.close(web_scrapper)
+
+    # DESC: Um único fallback, com o estado do crawl do HttpWebScrapper
+    assert selenium_calls == [
+        'config',
+        (3, 2022, web_scrapper.crawl_state),
+        (4, 2022, web_scrapper.crawl_state),
+        'close',
+    ]
+    assert web_scrapper.selenium_scrapper is None
+
+
+def test_execute_falls_back_only_without_the_listing(
+    monkeypatch, get_scrapper, selenium_calls
+):
+    monkeypatch.setattr(
+        http_web_scrapper_module, 'get_donwload_link_from_document', lambda **_: []
+    )
+
+    web_scrapper = get_scrapper(
+        HttpWebScrapper, PAGE_ARCHIVE_MODE='off', HTTP_RETRIES=2
+    )
+    statuses = web_scrapper.session.statuses
+
+    # DESC: 429/5xx são repetidos no ritmo do rate limiter, a issue
+    # sem PDF's não usa o Selenium
+    statuses.extend([503, 429])
+    assert web_scrapper.execute_issue(number=3, year=2022) == []
+    assert web_scrapper.session.urls[:3] == [get_issue_url(number=3, year=2022)] * 3
+
+    # DESC: Sem sucesso após as novas tentativas, a issue falha sem o Selenium
+    statuses.extend([429] * 3)
+    with pytest.raises(requests.HTTPError):
+        web_scrapper.execute_issue(number=3, year=2022)
+
+    assert selenium_calls == []
+
+    # DESC: Cliente HTTP bloqueado, a listagem é carregada pelo Selenium
+    statuses.append(403)
+    assert web_scrapper.execute_issue(number=3, year=2022) == [1]
+    assert selenium_calls == ['config', (3, 2022, web_scrapper.crawl_state)]
@@ -0,0 +1,67 @@
+import json
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# DESC: Dependências que levam segundos para importar
+HEAVY_MODULES = [
+    'chromadb',
+    'chromadbx',
+    'langchain',
+    'langchain_community',
+    'logfire',
+    'selenium',
+    'sentence_transformers',
+]
+
+
+def _run(code: str, **env) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT,
+        env={'PATH': '', **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_get_articles_imports_lazily():
+    result = _run(
+        'import sys, json, scripts.get_articles; '
+        f'print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))'
+    )
+
+    assert json.loads(result.stdout) == []
+
+    # DESC: Tempo acumulado do import (µs), sem as dependências pesadas
+    cumulative = next(
+        int(line.split('|')[1])
+        for line in result.stderr.splitlines()
+        if line.split('|')[-1].strip() == 'scripts.get_articles'
+    )
+    assert cumulative < 500_000
+
+
+def test_get_articles_fails_fast_without_chroma():
+    result = _run(
+        'import sys, json\n'
+        'from scripts.get_articles import main\n'
+        'try:\n'
+        '    main()\n'
+        'except ConnectionError:\n'
+        f'    print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))',
+        CHROMA_HOST='127.0.0.1',
+        CHROMA_PORT=str(_get_free_port()),
+    )
+
+    assert json.loads(result.stdout) == []
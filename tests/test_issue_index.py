@@ -0,0 +1,54 @@
+from src.issue_index import IssueIndex
+
+
+def test_issue_index_diff(tmp_path, get_article):
+    issue_index = IssueIndex(path=str(tmp_path / 'index' / 'issue_index.sqlite3'))
+    articles = [get_article(i) for i in range(3)]
+
+    issue_diff = issue_index.diff(number=3, year=2022, articles=articles)
+    assert issue_diff.added == articles
+
+    # DESC: Artigos não captados seguem como alterados
+    for article in articles[:2]:
+        issue_index.mark_captured(article=article, pdf_link='')
+
+    issue_diff = issue_index.diff(number=3, year=2022, articles=articles)
+    assert issue_diff.added == []
+    assert issue_diff.changed == [articles[2]]
+    assert issue_diff.unchanged == articles[:2]
+
+    # DESC: Título alterado, artigo removido e artigo novo
+    listing = [get_article(0, name='Renamed'), articles[2], get_article(3)]
+    issue_diff = issue_index.diff(number=3, year=2022, articles=listing)
+
+    assert issue_diff.added == [listing[2]]
+    assert issue_diff.changed == listing[:2]
+    assert issue_diff.removed == ['link 1']
+
+    # DESC: Outras issues não são afetadas
+    assert issue_index.diff(number=4, year=2022, articles=[]).removed == []
+
+    issue_index.close()
+
+
+def test_issue_index_diff_expires_the_captures(tmp_path, get_article):
+    now = [1000.0]
+    issue_index = IssueIndex(
+        path=str(tmp_path / 'issue_index.sqlite3'), max_age=60, clock=lambda: now[0]
+    )
+    articles = [get_article(i) for i in range(2)]
+
+    issue_index.diff(number=3, year=2022, articles=articles)
+    issue_index.mark_captured(article=articles[0], pdf_link='pdf 0')
+
+    now[0] += 30
+    issue_index.mark_captured(article=articles[1], pdf_link='pdf 1')
+
+    # DESC: Apenas a captura mais antiga que max_age é refeita
+    now[0] += 40
+    issue_diff = issue_index.diff(number=3, year=2022, articles=articles)
+
+    assert issue_diff.changed == articles[:1]
+    assert issue_diff.unchanged == articles[1:]
+
+    issue_index.close()
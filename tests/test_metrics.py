@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from src.metrics import Metrics
+
+
+def test_metrics_record_spans_and_counters():
+    metrics = Metrics()
+
+    for _ in range(2):
+        with metrics.span('pdf_parse'):
+            pass
+
+    with pytest.raises(ValueError):
+        with metrics.span('chroma_add'):
+            raise ValueError('chroma unavailable')
+
+    metrics.increment('chunks_inserted', 10)
+    metrics.increment('chunks_inserted', 5)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot['stages']['pdf_parse']['count'] == 2
+    assert snapshot['stages']['chroma_add']['count'] == 1
+    assert snapshot['counters'] == {'chunks_inserted': 15}
+
+
+def test_metrics_merge_snapshots():
+    metrics = Metrics()
+    metrics.observe(name='pdf_parse', seconds=1.0)
+
+    other = Metrics()
+    other.observe(name='pdf_parse', seconds=3.0)
+    other.increment('pages_parsed', 8)
+
+    metrics.merge(snapshot=other.snapshot())
+
+    assert metrics.snapshot() == {
+        'stages': {'pdf_parse': {'count': 2, 'seconds': 4.0, 'max_seconds': 3.0}},
+        'counters': {'pages_parsed': 8},
+    }
+
+
+def test_metrics_export(tmp_path):
+    metrics = Metrics()
+    metrics.observe(name='pdf_download', seconds=0.5)
+    metrics.increment('bytes_downloaded', 1024)
+
+    metrics.export(path=str(tmp_path / 'metrics.json'))
+    metrics.export(path=str(tmp_path / 'metrics.prom'))
+
+    assert json.loads((tmp_path / 'metrics.json').read_text()) == metrics.snapshot()
+    assert (tmp_path / 'metrics.prom').read_text().splitlines() == [
+        '# TYPE crawler_stage_seconds summary',
+        'crawler_stage_seconds_count{stage="pdf_download"} 1',
+        'crawler_stage_seconds_sum{stage="pdf_download"} 0.5',
+        '# TYPE crawler_stage_seconds_max gauge',
+        'crawler_stage_seconds_max{stage="pdf_download"} 0.5',
+        '# TYPE crawler_bytes_downloaded_total counter',
+        'crawler_bytes_downloaded_total 1024',
+    ]
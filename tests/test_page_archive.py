@@ -0,0 +1,37 @@
+import gzip
+
+import pytest
+
+from src.page_archive import REPLAY, PageArchive
+
+
+def test_page_archive_round_trip(tmp_path):
+    page_archive = PageArchive(root=str(tmp_path))
+    url = 'https://aece.ro/abstractplus.php?year=2022&number=3&article=1'
+
+    path = page_archive.save(
+        url=url, page_source='<html>ção</html>', final_url=f'{url}&x=1'
+    )
+
+    assert path.startswith(str(tmp_path / 'aece.ro'))
+    assert path.endswith('.json.gz')
+
+    # DESC: Arquivo gzip, sem arquivos parciais no diretório
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        assert 'ção' in file.read()
+    assert [item.name for item in (tmp_path / 'aece.ro').rglob('*.part')] == []
+
+    snapshot = PageArchive(root=str(tmp_path), mode=REPLAY).load(url=url)
+
+    assert snapshot.url == url
+    assert snapshot.final_url == f'{url}&x=1'
+    assert snapshot.page_source == '<html>ção</html>'
+    assert snapshot.fetched_at > 0
+
+
+def test_page_archive_errors(tmp_path):
+    with pytest.raises(ValueError):
+        PageArchive(root=str(tmp_path), mode='invalid')
+
+    with pytest.raises(FileNotFoundError):
+        PageArchive(root=str(tmp_path)).load(url='https://aece.ro/index.php')
@@ -0,0 +1,78 @@
+import hashlib
+
+import pytest
+
+from src.download_manager import DownloadManager
+from src.pdf_store import PdfStore
+
+
+@pytest.fixture
+def download_manager():
+    download_manager = DownloadManager(backoff=0.01)
+
+    yield download_manager
+
+    download_manager.close()
+
+
+def test_pdf_store_downloads_each_pdf_once(
+    http_server, sample_pdf, download_manager, tmp_path
+):
+    http_server.files['/displaypdf.php'] = sample_pdf
+    link = f'{http_server.url}/displaypdf.php?year=2022&number=3&article=1'
+
+    pdf_store = PdfStore(root=str(tmp_path), download_manager=download_manager)
+
+    first = pdf_store.fetch(link=link, year=2022, number=3, article_number='1')
+    second = pdf_store.fetch(link=link, year=2022, number=3, article_number='1')
+
+    assert len(http_server.requests) == 1
+    assert first == second
+    assert first.path == str(tmp_path / '2022' / '3' / 'article_1.pdf')
+    assert first.size == len(sample_pdf)
+    assert first.sha256 == hashlib.sha256(sample_pdf).hexdigest()
+
+
+def test_pdf_store_refetches_corrupted_files(
+    http_server, sample_pdf, download_manager, tmp_path
+):
+    http_server.files['/displaypdf.php'] = sample_pdf
+    link = f'{http_server.url}/displaypdf.php?year=2022&number=3&article=1'
+
+    pdf_store = PdfStore(root=str(tmp_path), download_manager=download_manager)
+    stored_pdf = pdf_store.fetch(link=link, year=2022, number=3, article_number='1')
+
+    with open(stored_pdf.path, 'wb') as file:
+        file.write(b'%PDF-1.4 truncated')
+
+    assert pdf_store.get(year=2022, number=3, article_number='1') is None
+
+    refetched = pdf_store.fetch(link=link, year=2022, number=3, article_number='1')
+
+    assert len(http_server.requests) == 2
+    assert refetched == stored_pdf
+
+
+def test_pdf_store_revalidates_stored_pdfs(
+    http_server, sample_pdf, download_manager, tmp_path
+):
+    http_server.files['/displaypdf.php'] = sample_pdf
+    link = f'{http_server.url}/displaypdf.php?year=2022&number=3&article=1'
+
+    pdf_store = PdfStore(
+        root=str(tmp_path), download_manager=download_manager, revalidate=True
+    )
+    stored_pdf = pdf_store.fetch(link=link, year=2022, number=3, article_number='1')
+
+    assert (
+        pdf_store.fetch(link=link, year=2022, number=3, article_number='1')
+        == stored_pdf
+    )
+
+    # DESC: O PDF mudou no servidor, a nova versão é armazenada
+    http_server.files['/displaypdf.php'] = sample_pdf + b'\n'
+    updated = pdf_store.fetch(link=link, year=2022, number=3, article_number='1')
+
+    assert 'If-None-Match' in http_server.requests[1][1]
+    assert updated.size == len(sample_pdf) + 1
+    assert updated.etag != stored_pdf.etag
@@ -0,0 +1,53 @@
+import threading
+import time
+
+import pytest
+
+from src.pipeline import Pipeline
+
+
+def test_pipeline_keeps_order_and_drops_none():
+    results = Pipeline(
+        stages=[
+            lambda item: None if item % 3 == 0 else item * 10,
+            lambda item: item + 1,
+        ],
+        queue_size=2,
+    ).run(items=range(10))
+
+    assert results == [11, 21, 41, 51, 71, 81]
+
+
+def test_pipeline_bounds_items_in_flight():
+    produced = []
+    lock = threading.Lock()
+    max_in_flight = 0
+
+    def source():
+        for item in range(20):
+            produced.append(item)
+            yield item
+
+    def slow_sink(item):
+        nonlocal max_in_flight
+        with lock:
+            max_in_flight = max(max_in_flight, len(produced) - item)
+        time.sleep(0.005)
+        return item
+
+    Pipeline(stages=[lambda item: item, slow_sink], queue_size=1).run(items=source())
+
+    # DESC: fila de entrada + fila entre os estágios + itens nos workers
+    assert max_in_flight <= 6
+
+
+def test_pipeline_raises_stage_errors():
+    def failing_stage(item):
+        if item == 3:
+            raise RuntimeError('chroma is down')
+        return item
+
+    with pytest.raises(RuntimeError):
+        Pipeline(stages=[lambda item: item, failing_stage], queue_size=1).run(
+            items=range(100)
+        )
@@ -0,0 +1,31 @@
+import random
+
+from src.connections.preprocessing import preprocess_text, preprocess_texts
+from src.connections.utils import _get_preprocessed_text
+
+TEXT = 'Power quality (PQ)\nclassification:\t98.7% accuracy – ação ≤ 3 kV [12].'
+
+
+def test_preprocess_texts_is_identical_to_the_current_preprocessing():
+    random.seed(0)
+    texts = [TEXT, '', '\n\n', 'ÁÉÍÓÚ âêîô ãõ çÇ: ñ ü ß']
+    texts.extend(
+        ''.join(chr(random.randrange(0x3000)) for _ in range(200)) for _ in range(50)
+    )
+
+    assert preprocess_texts(texts=texts) == [
+        _get_preprocessed_text(text=text) for text in texts
+    ]
+
+
+def test_preprocess_text_collapses_whitespace():
+    assert preprocess_text(text=TEXT, collapse_whitespace=True) == (
+        'Power quality PQ classification: 987 accuracy ação 3 kV 12'
+    )
+
+
+def test_preprocess_text_keeps_punctuation():
+    assert preprocess_text(
+        text=TEXT, keep_punctuation=True, collapse_whitespace=True
+    ) == ('Power quality (PQ) classification: 98.7% accuracy ação 3 kV [12].')
+    assert preprocess_text(text='a-b\nc.', keep_punctuation=True) == 'a-bc.'
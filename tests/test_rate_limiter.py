@@ -0,0 +1,99 @@
+import pytest
+
+from src.download_manager import DownloadManager
+from src.rate_limiter import HostRateLimiter, RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limiter_schedules_after_the_burst():
+    clock = FakeClock()
+    rate_limiter = RateLimiter(rate=2, burst=2, clock=clock)
+
+    assert [rate_limiter.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+
+    # DESC: Os tokens são repostos com o tempo
+    clock.now = 10
+    assert rate_limiter.reserve() == 0
+
+
+def test_rate_limiter_slows_down_and_recovers():
+    clock = FakeClock()
+    rate_limiter = RateLimiter(rate=4, burst=1, min_rate=1.5, clock=clock)
+
+    rate_limiter.update(status_code=503)
+    assert rate_limiter.rate == 2
+
+    rate_limiter.update(status_code=429)
+    assert rate_limiter.rate == 1.5
+
+    rate_limiter.update(status_code=404)
+    assert rate_limiter.rate == 1.5
+
+    for _ in range(10):
+        rate_limiter.update(status_code=200)
+    assert rate_limiter.rate == 4
+
+
+def test_rate_limiter_honors_retry_after():
+    clock = FakeClock()
+    rate_limiter = RateLimiter(rate=10, burst=5, clock=clock)
+
+    rate_limiter.update(status_code=429, retry_after='30')
+
+    assert rate_limiter.reserve() == 30
+    clock.now = 31
+    assert rate_limiter.reserve() == 0
+
+
+def test_rate_limiter_can_be_disabled():
+    rate_limiter = RateLimiter(rate=0)
+
+    rate_limiter.update(status_code=429, retry_after='30')
+
+    assert [rate_limiter.reserve() for _ in range(100)] == [0] * 100
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(value='120') == 120
+    assert parse_retry_after(value=None) == 0
+    assert parse_retry_after(value='soon') == 0
+    assert parse_retry_after(
+        value='Wed, 21 Oct 2015 07:28:30 GMT', now=1445412480
+    ) == pytest.approx(30)
+
+
+def test_host_rate_limiter_is_per_host():
+    host_rate_limiter = HostRateLimiter(rate=1)
+
+    assert host_rate_limiter.get(url='https://aece.ro/a') is host_rate_limiter.get(
+        url='https://aece.ro/b'
+    )
+    assert host_rate_limiter.get(url='https://aece.ro/a') is not (
+        host_rate_limiter.get(url='https://example.org/a')
+    )
+
+
+def test_download_manager_slows_down_the_host(http_server, sample_pdf, tmp_path):
+    http_server.files['/article_1.pdf'] = sample_pdf
+    http_server.failures['/article_1.pdf'] = [429]
+    host_rate_limiter = HostRateLimiter(rate=100, burst=1)
+
+    download_manager = DownloadManager(backoff=0.01, rate_limiter=host_rate_limiter)
+
+    try:
+        download_manager.download(
+            url=f'{http_server.url}/article_1.pdf',
+            path=str(tmp_path / 'article_1.pdf'),
+        )
+    finally:
+        download_manager.close()
+
+    # DESC: Metade da taxa no 429, recuperação parcial no sucesso
+    assert host_rate_limiter.get(url=http_server.url).rate == 60
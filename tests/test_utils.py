@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from src.utils import get_article_infos_from_document, get_page_document
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'aece'
+
+
+class SnapshotDriver:
+    """Counts the WebDriver calls made while extracting the article infos."""
+
+    def __init__(self, page_source: str):
+        self._page_source = page_source
+        self.current_url = (
+            'https://aece.ro/abstractplus.php?year=2022&number=3&article=1'
+        )
+        self.calls = 0
+
+    def find_elements(self, by, value):
+        self.calls += 1
+        return [object()]
+
+    @property
+    def page_source(self):
+        self.calls += 1
+        return self._page_source
+
+
+def test_get_article_infos_single_pass():
+    driver = SnapshotDriver((FIXTURES / 'abstractplus_2022_3_1.html').read_text())
+
+    article_infos = get_article_infos_from_document(
+        document=get_page_document(driver=driver)
+    )
+
+    assert driver.calls == 2
+    assert article_infos.author_keywords == (
+        'deep learning, power quality, classification, convolutional neural networks'
+    )
+    assert article_infos.publication_date == '2022-08-31'
+    assert article_infos.doi == '10.4316/AECE.2022.03001'
+    assert article_infos.about == {
+        'Date of Publication': '2022-08-31',
+        'On page(s)': '3 - 10',
+        'ISSN': '1582-7445, e-ISSN: 1844-7600',
+        'Digital Object Identifier': '10.4316/AECE.2022.03001',
+        'Web of Science Accession Number': '000842101000001',
+        'SCOPUS ID': '85137046231',
+    }
@@ -0,0 +1,183 @@
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+from langchain.schema import Document
+
+import src.article_scrapper as article_scrapper_module
+import src.web_scrapper as web_scrapper_module
+from src.metrics import get_metrics
+from src.templates.dataclass import ArticleInfo, ArticleLink
+from src.utils import get_article_document
+from src.web_scrapper import WebScrapper
+
+SAMPLE_PDF = Path(__file__).parent / 'fixtures' / 'pdfs' / 'sample.pdf'
+
+
+def get_article_info(*, article, filename=''):
+    return ArticleInfo(
+        name=article.name,
+        page_link=article.page_link,
+        pdf_download_link=f'{article.page_link}.pdf',
+        author_keywords='keywords',
+        publication_date='2022',
+        doi=f'doi {article.name}',
+        filename=filename or f'/tmp/{article.name}.pdf',
+    )
+
+
+def get_chunks(*, article_info, total=1):
+    return [
+        Document(
+            page_content=article_info.name,
+            metadata={'doi': article_info.doi, 'page': 0, 'start_index': index},
+        )
+        for index in range(total)
+    ]
+
+
+class FakeAnchor:
+    def __init__(self, href):
+        self.href = href
+
+    def get_attribute(self, name):
+        return self.href
+
+
+class FakeElement:
+    def __init__(self, text, href):
+        self.text = text
+        self.anchor = FakeAnchor(href)
+
+    def find_element(self, by, value):
+        return self.anchor
+
+
+class FakeDriver:
+    def __init__(self, elements):
+        self.elements = elements
+
+    def find_elements(self, by, value):
+        return self.elements
+
+
+def test_index_articles_keeps_order_and_isolates_failures(monkeypatch, get_scrapper):
+    monkeypatch.setattr(web_scrapper_module, 'journal_issue_verify', lambda **_: None)
+
+    reference = 'https://aece.ro/abstractplus.php?year=2022&number=3'
+    elements = [
+        FakeElement(f'Article {i}', f'{reference}&article={i}') for i in range(5)
+    ]
+
+    def fake_get_article_info(*, article):
+        index = int(article.page_link.split('=')[-1])
+        if index == 2:
+            raise IndexError('article without pdf')
+        # DESC: os primeiros artigos terminam por último
+        time.sleep(0.01 * (5 - index))
+        return get_article_info(article=article)
+
+    persisted = []
+
+    def fake_persistir(*, document_chunks, embedding_model_name):
+        # DESC: O insert do artigo 3 falha, os demais seguem
+        if document_chunks[0][0].page_content == 'Article 3':
+            raise ConnectionError('chroma is down')
+
+        persisted.append([document.page_content for document in document_chunks[0]])
+
+    web_scrapper = get_scrapper(WebScrapper, SCRAPPER_WORKERS=4)
+    monkeypatch.setattr(web_scrapper, '_get_article_info', fake_get_article_info)
+    monkeypatch.setattr(web_scrapper, 'persistir', fake_persistir)
+    monkeypatch.setattr(
+        article_scrapper_module,
+        'get_article_document',
+        lambda *, article_info: get_chunks(article_info=article_info, total=2),
+    )
+
+    articles = web_scrapper._get_articles(
+        driver=FakeDriver(elements), number=3, year=2022
+    )
+
+    assert web_scrapper._index_articles(articles=articles) == [2, 2, 2]
+    assert persisted == [[f'Article {i}'] * 2 for i in [0, 1, 4]]
+
+    # DESC: O artigo com falha no insert não é marcado como indexado
+    assert web_scrapper._get_indexed_chunks(article=articles[3]) is None
+    assert web_scrapper._get_indexed_chunks(article=articles[4]) == 2
+
+
+def test_index_articles_parses_pdfs_in_a_process_pool(monkeypatch, get_scrapper):
+    def fake_get_article_info(*, article):
+        return get_article_info(article=article, filename=str(SAMPLE_PDF))
+
+    articles = [
+        ArticleLink(name=f'Article {i}', page_link=f'link {i}', year=2022, number=3)
+        for i in range(4)
+    ]
+
+    # DESC: O mesmo parse feito neste processo
+    expected = [
+        get_article_document(article_info=fake_get_article_info(article=article))
+        for article in articles
+    ]
+
+    documents_list = []
+
+    web_scrapper = get_scrapper(WebScrapper, SCRAPPER_WORKERS=2, PARSE_WORKERS=2)
+    monkeypatch.setattr(web_scrapper, '_get_article_info', fake_get_article_info)
+    monkeypatch.setattr(
+        web_scrapper,
+        'persistir',
+        lambda *, document_chunks, embedding_model_name: documents_list.extend(
+            document_chunks
+        ),
+    )
+    get_metrics().reset()
+
+    assert web_scrapper._index_articles(articles=articles) == [
+        len(document_chunks) for document_chunks in expected
+    ]
+
+    assert [chunks[0].metadata['name'] for chunks in documents_list] == [
+        article.name for article in articles
+    ]
+    assert documents_list == expected
+    assert len(documents_list[0]) > 1
+
+    # DESC: As métricas dos processos do pool são somadas
+    snapshot = get_metrics().snapshot()
+    assert snapshot['stages']['pdf_parse']['count'] == 4
+    assert snapshot['counters']['pages_parsed'] == 8
+    assert snapshot['counters']['chunks_created'] == sum(map(len, documents_list))
+
+
+def test_iter_article_infos_keeps_a_bounded_window(get_scrapper):
+    submitted = []
+
+    class FakeExecutor:
+        def submit(self, function, article):
+            submitted.append(article.name)
+            future = Future()
+            future.set_result(article.name)
+            return future
+
+    web_scrapper = get_scrapper(WebScrapper, SCRAPPER_WORKERS=2)
+
+    articles = [
+        ArticleLink(name=f'Article {i}', page_link=f'link {i}', year=2022, number=3)
+        for i in range(5)
+    ]
+
+    article_infos = web_scrapper._iter_article_infos(
+        articles=articles, executor=FakeExecutor()
+    )
+
+    # DESC: O próximo artigo só é submetido quando o mais antigo é consumido
+    assert next(article_infos) == (articles[0], 'Article 0')
+    assert submitted == ['Article 0', 'Article 1', 'Article 2']
+
+    assert [article_info for _, article_info in article_infos] == [
+        f'Article {i}' for i in range(1, 5)
+    ]
+    assert submitted == [f'Article {i}' for i in range(5)]
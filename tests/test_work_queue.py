@@ -0,0 +1,209 @@
+import threading
+
+from langchain.schema import Document
+
+import src.article_scrapper as article_scrapper_module
+from src.templates.dataclass import StoredPdf
+from src.web_scrapper import WebScrapper
+from src.work_queue import DONE, FAILED, LEASED, PENDING, WorkQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_work_queue_leases_each_task_once(tmp_path, get_article):
+    clock = FakeClock()
+    work_queue = WorkQueue(
+        path=str(tmp_path / 'queue.sqlite3'), lease_seconds=60, clock=clock
+    )
+
+    assert work_queue.put_many(articles=[get_article(i) for i in range(3)]) == 3
+    # DESC: A mesma issue enfileirada novamente não duplica os artigos
+    assert work_queue.put_many(articles=[get_article(i) for i in range(4)]) == 1
+
+    first = work_queue.lease(worker='a', limit=2)
+    second = work_queue.lease(worker='b', limit=5)
+
+    assert [task.article for task in first] == [get_article(0), get_article(1)]
+    assert [task.article for task in second] == [get_article(2), get_article(3)]
+    assert work_queue.lease(worker='c') == []
+
+    assert work_queue.complete(worker='a', task_id=first[0].id)
+    assert work_queue.get_counts() == {DONE: 1, LEASED: 3}
+
+    work_queue.close()
+
+
+def test_work_queue_requeues_finished_tasks(tmp_path, get_article):
+    work_queue = WorkQueue(path=str(tmp_path / 'queue.sqlite3'), max_attempts=1)
+    work_queue.put_many(articles=[get_article(1), get_article(2)])
+
+    done, failed = work_queue.lease(worker='a', limit=2)
+    work_queue.complete(worker='a', task_id=done.id)
+    work_queue.fail(worker='a', task_id=failed.id, error='timeout')
+
+    # DESC: Artigos alterados voltam para a fila, com as tentativas zeradas
+    assert work_queue.requeue(articles=[get_article(1), get_article(3)]) == 2
+    assert work_queue.get_counts() == {FAILED: 1, PENDING: 2}
+    assert [task.attempts for task in work_queue.lease(worker='b', limit=5)] == [
+        1,
+        1,
+    ]
+
+    work_queue.close()
+
+
+def test_work_queue_requeues_expired_leases(tmp_path, get_article):
+    clock = FakeClock()
+    work_queue = WorkQueue(
+        path=str(tmp_path / 'queue.sqlite3'), lease_seconds=60, clock=clock
+    )
+    work_queue.put_many(articles=[get_article(1), get_article(2)])
+
+    crashed = work_queue.lease(worker='crashed', limit=1)
+    alive = work_queue.lease(worker='alive', limit=1)
+
+    # DESC: Apenas o worker vivo renova o lease
+    clock.now += 45
+    assert work_queue.heartbeat(worker='alive', task_ids=[alive[0].id]) == 1
+    clock.now += 45
+
+    requeued = work_queue.lease(worker='other', limit=5)
+
+    assert [task.id for task in requeued] == [crashed[0].id]
+    assert requeued[0].attempts == 2
+
+    # DESC: O worker que perdeu o lease não conclui a tarefa
+    assert not work_queue.complete(worker='crashed', task_id=crashed[0].id)
+    assert work_queue.complete(worker='other', task_id=crashed[0].id)
+
+    work_queue.close()
+
+
+def test_work_queue_fails_after_the_max_attempts(tmp_path, get_article):
+    work_queue = WorkQueue(path=str(tmp_path / 'queue.sqlite3'), max_attempts=2)
+    work_queue.put_many(articles=[get_article(1)])
+
+    for status in [PENDING, FAILED]:
+        (task,) = work_queue.lease(worker='a')
+        assert work_queue.fail(worker='a', task_id=task.id, error='timeout')
+        assert work_queue.get_counts() == {status: 1}
+
+    work_queue.close()
+
+
+def test_work_queue_fails_expired_leases_after_the_max_attempts(tmp_path, get_article):
+    clock = FakeClock()
+    work_queue = WorkQueue(
+        path=str(tmp_path / 'queue.sqlite3'),
+        lease_seconds=60,
+        max_attempts=2,
+        clock=clock,
+    )
+    work_queue.put_many(articles=[get_article(1)])
+
+    # DESC: O worker cai em todas as tentativas, sem chamar fail
+    for attempts in [1, 2]:
+        (task,) = work_queue.lease(worker='crashed')
+        assert task.attempts == attempts
+        clock.now += 61
+
+    assert work_queue.lease(worker='other') == []
+    assert work_queue.get_counts() == {FAILED: 1}
+
+    work_queue.close()
+
+
+def test_work_queue_is_shared_between_connections(tmp_path, get_article):
+    path = str(tmp_path / 'queue.sqlite3')
+
+    work_queue = WorkQueue(path=path)
+    work_queue.put_many(articles=[get_article(i) for i in range(200)])
+
+    leased = []
+
+    def worker(name):
+        # DESC: Uma conexão por worker, como em processos separados
+        worker_queue = WorkQueue(path=path)
+
+        while tasks := worker_queue.lease(worker=name, limit=3):
+            leased.extend(task.id for task in tasks)
+
+        worker_queue.close()
+
+    threads = [threading.Thread(target=worker, args=(str(i),)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(leased) == list(range(1, 201))
+
+    work_queue.close()
+
+
+def test_execute_worker_drains_the_queue(
+    monkeypatch, tmp_path, get_article, get_scrapper
+):
+    indexed = []
+
+    def fake_get_article_document(*, article_info):
+        # DESC: O PDF do artigo 2 nunca pode ser lido
+        if article_info.name == 'Article 2':
+            raise ValueError('corrupted pdf')
+
+        indexed.append(article_info.name)
+
+        return [
+            Document(
+                page_content=article_info.name,
+                metadata={'doi': article_info.doi, 'page': 0, 'start_index': 0},
+            )
+        ]
+
+    monkeypatch.setattr(
+        article_scrapper_module, 'get_article_document', fake_get_article_document
+    )
+
+    web_scrapper = get_scrapper(WebScrapper, SCRAPPER_WORKERS=2)
+
+    def fake_get_article_info(*, article):
+        # DESC: O artigo 5 não tem link de download do PDF
+        if article.name == 'Article 5':
+            return None
+
+        return article_scrapper_module.ArticleInfo(
+            name=article.name,
+            page_link=article.page_link,
+            pdf_download_link=f'{article.page_link}.pdf',
+            author_keywords='keywords',
+            publication_date='2022',
+            doi=f'doi {article.name}',
+            filename=f'/tmp/{article.name}.pdf',
+        )
+
+    monkeypatch.setattr(web_scrapper, '_get_article_info', fake_get_article_info)
+    monkeypatch.setattr(
+        article_scrapper_module,
+        'download_article_pdf',
+        lambda *, link, year, number, pdf_store: StoredPdf(
+            path=f'/tmp/{link}', link=link, size=1, sha256='sha256'
+        ),
+    )
+    monkeypatch.setattr(web_scrapper, 'persistir', lambda **_: None)
+
+    work_queue = WorkQueue(path=str(tmp_path / 'queue.sqlite3'), max_attempts=2)
+    work_queue.put_many(articles=[get_article(i) for i in range(6)])
+
+    try:
+        assert web_scrapper.execute_worker(work_queue=work_queue, worker='a') == 4
+        assert sorted(indexed) == ['Article 0', 'Article 1', 'Article 3', 'Article 4']
+        # DESC: O artigo sem PDF é concluído, sem novas tentativas
+        assert work_queue.get_counts() == {DONE: 5, FAILED: 1}
+    finally:
+        work_queue.close()